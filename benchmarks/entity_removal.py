@@ -0,0 +1,160 @@
+"""
+Compara formas de tirar entidades mortas das listas do mundo:
+
+- cópia: "for x in lista[:]" + lista.remove(x) (o que o jogo usa)
+- compactação: percorre a lista uma vez, copia quem fica para a frente e
+  corta o fim com "del lista[vivos:]"
+- troca com o último: põe a última entidade no lugar da que morreu e
+  tira o fim com pop() (muda a ordem da lista)
+
+Cada quadro atualiza todas as entidades; uma fração delas expira e o mesmo
+número de entidades novas entra, então a lista fica sempre do mesmo
+tamanho. Mede o tempo por quadro e quantos bytes cada quadro aloca
+(tracemalloc) além das entidades novas.
+
+Resultado típico: a cópia é a mais rápida ou empata em todos os
+tamanhos. A compactação aloca de 3 a 5 vezes menos por quadro, mas fica
+uns 5 a 15% mais lenta com 100 e 1000 entidades; a troca com o último,
+de 10 a 35% mais lenta. list.remove() já é um memmove em C, e os laços
+em Python com atribuição por índice custam mais que a cópia da lista.
+Filtrar depois da atualização (lista[:] = [x for x in lista if ...])
+também não ganha da cópia e aloca ainda mais. Por isso o jogo continua
+com a cópia.
+
+Uso:
+    python -m benchmarks.entity_removal
+    python -m benchmarks.entity_removal --sizes 10 100 1000 --death-rate 0.05
+"""
+
+import argparse
+import random
+import time
+import tracemalloc
+
+
+class _Entity:
+    """Entidade mínima: só um tempo de vida que diminui a cada quadro"""
+
+    __slots__ = ("lifetime",)
+
+    def __init__(self, lifetime):
+        self.lifetime = lifetime
+
+    def update(self, dt):
+        self.lifetime -= dt
+
+    def is_expired(self):
+        return self.lifetime <= 0
+
+
+def update_with_copy(entities, dt):
+    for entity in entities[:]:
+        entity.update(dt)
+        if entity.is_expired():
+            entities.remove(entity)
+
+
+def update_with_compaction(entities, dt):
+    alive = 0
+    for entity in entities:
+        entity.update(dt)
+        if not entity.is_expired():
+            entities[alive] = entity
+            alive += 1
+    del entities[alive:]
+
+
+def update_with_swap_remove(entities, dt):
+    index = 0
+    while index < len(entities):
+        entity = entities[index]
+        entity.update(dt)
+        if entity.is_expired():
+            # A última ainda não foi atualizada: é a próxima a ser vista
+            entities[index] = entities[-1]
+            entities.pop()
+        else:
+            index += 1
+
+
+UPDATES = (
+    ("cópia", update_with_copy),
+    ("compactação", update_with_compaction),
+    ("troca", update_with_swap_remove),
+)
+
+
+def _make_frames(size, death_rate, frames, seed):
+    """
+    Lista inicial e, para cada quadro, as entidades novas que entram.
+
+    As entidades novas são criadas antes da medição para que a alocação
+    delas não conte para nenhum dos dois lados.
+    """
+    rng = random.Random(seed)
+    per_frame = max(1, round(size * death_rate))
+    lifetime = size / per_frame  # Em quadros: mantém o tamanho da lista estável
+    initial = [_Entity(rng.uniform(0, lifetime)) for _ in range(size)]
+    spawned = [[_Entity(lifetime) for _ in range(per_frame)] for _ in range(frames)]
+    return initial, spawned
+
+
+def measure(update, size, death_rate, frames, seed=0):
+    """
+    Roda um cenário com uma das funções de atualização.
+
+    Returns:
+        Dict com o tempo médio por quadro (us) e os bytes alocados por
+        quadro (pico dentro do quadro)
+    """
+    initial, spawned = _make_frames(size, death_rate, frames, seed)
+    entities = list(initial)
+    start = time.perf_counter()
+    for new_entities in spawned:
+        update(entities, 1)
+        entities.extend(new_entities)
+    elapsed = time.perf_counter() - start
+
+    # Alocação: mede poucos quadros separados (tracemalloc deixa tudo lento)
+    initial, spawned = _make_frames(size, death_rate, 50, seed)
+    entities = list(initial)
+    peak_bytes = 0
+    for new_entities in spawned:
+        # Um start() por quadro zera o pico (reset_peak só existe no 3.9+)
+        tracemalloc.start()
+        update(entities, 1)
+        peak_bytes = max(peak_bytes, tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+        entities.extend(new_entities)
+
+    return {
+        "us_per_frame": elapsed / frames * 1e6,
+        "bytes_per_frame": peak_bytes,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument(
+        "--death-rate",
+        type=float,
+        default=0.05,
+        help="Fração das entidades que expira a cada quadro",
+    )
+    parser.add_argument("--frames", type=int, default=2000)
+    args = parser.parse_args()
+
+    print(f"{'entidades':>9}  {'forma':>11}  {'us/quadro':>9}  {'B/quadro':>8}")
+    for size in args.sizes:
+        frames = max(50, args.frames * 100 // max(size, 100))
+        for name, update in UPDATES:
+            result = measure(update, size, args.death_rate, frames)
+            print(
+                f"{size:>9}  {name:>11}  {result['us_per_frame']:>9.2f}  "
+                f"{result['bytes_per_frame']:>8}"
+            )
+
+
+if __name__ == "__main__":
+    main()
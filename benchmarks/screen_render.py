@@ -0,0 +1,95 @@
+"""
+Mede o custo de desenhar as telas de menu e quantas fontes elas criam.
+
+Cria um GameManager com vídeo e áudio "dummy" (sem janela), desenha e
+envia (_render + _present) cada tela por alguns quadros e mostra o tempo
+médio por quadro e quantos pygame.font.Font foram construídos durante os
+quadros. Ranking e créditos são medidos já abertos (fade-in terminado),
+como ficam parados no menu. Os quadros rodam sem esperar o relógio, então
+o carro do menu inicial quase não se mexe: é o custo de um quadro parado.
+No fim mostra quantas fontes existem no registro compartilhado
+(utils/font_registry.py).
+
+Uso (na raiz do projeto):
+    python -m benchmarks.screen_render
+    python -m benchmarks.screen_render --frames 500 --screens start_screen game_over
+"""
+
+import argparse
+import os
+import time
+
+SCREENS = ("start_screen", "game_over", "highscore_input", "leaderboard", "credits")
+
+
+class _FontCounter:
+    """Conta as construções de pygame.font.Font enquanto estiver instalado"""
+
+    def __init__(self, pygame):
+        self.pygame = pygame
+        self.original = pygame.font.Font
+        self.created = 0
+
+    def __enter__(self):
+        counter = self
+        original = self.original
+
+        class CountingFont(original):
+            def __init__(self, *args, **kwargs):
+                counter.created += 1
+                super().__init__(*args, **kwargs)
+
+        self.pygame.font.Font = CountingFont
+        return self
+
+    def __exit__(self, *exc_info):
+        self.pygame.font.Font = self.original
+
+
+def measure(game_manager, screen, frames):
+    """
+    Desenha uma tela por frames quadros.
+
+    Returns:
+        Dict com o tempo médio por quadro (ms) e as fontes criadas
+    """
+    import pygame
+
+    game_manager.current_state = screen
+    for opened in (game_manager.leaderboard_screen, game_manager.credits_screen):
+        opened.alpha = 255
+    with _FontCounter(pygame) as counter:
+        start = time.perf_counter()
+        for _ in range(frames):
+            game_manager._present(game_manager._render())
+        elapsed = time.perf_counter() - start
+    return {"ms_per_frame": elapsed / frames * 1000, "fonts_created": counter.created}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--frames", type=int, default=200)
+    parser.add_argument("--screens", nargs="+", choices=SCREENS, default=list(SCREENS))
+    args = parser.parse_args()
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    from config.constants import HEIGHT, TITLE, WIDTH
+    from core.game_manager import GameManager
+    from utils.font_registry import font_stats
+
+    game_manager = GameManager(WIDTH, HEIGHT, TITLE)
+
+    print(f"{'tela':<16}  {'ms/quadro':>9}  {'fontes criadas':>14}")
+    for screen in args.screens:
+        result = measure(game_manager, screen, args.frames)
+        print(f"{screen:<16}  {result['ms_per_frame']:>9.3f}  {result['fonts_created']:>14}")
+
+    stats = font_stats()
+    print(f"\nFontes no registro: {stats['fonts']} ({stats['requests']} pedidos)")
+    for face, size in stats["loaded"]:
+        print(f"  {face or 'padrão'} {size}")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,4 +2,12 @@ WIDTH = 400
 HEIGHT = 600
 FPS = 60
 TITLE = "Corrida Maluca"
-SHOW_HITBOX = False
\ No newline at end of file
+SHOW_HITBOX = False
+
+# Simulação em passo fixo (independente da taxa de desenho)
+SIM_HZ = 120  # Passos de simulação por segundo
+MAX_FRAME_TIME = 0.25  # Maior tempo real (s) processado em um frame (evita travar após um engasgo)
+
+# Desenho por áreas alteradas (dirty rects) nas telas de menu
+DIRTY_RECTS = True  # False = sempre pygame.display.flip() da tela inteira
+DIRTY_AREA_LIMIT = 0.5  # Acima desta fração da tela alterada, atualiza tudo
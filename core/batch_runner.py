@@ -0,0 +1,230 @@
+"""
+Roda milhares de partidas headless em paralelo para testes de balanceamento
+e de desempenho.
+
+Uso:
+    python -m core.batch_runner --runs 10000 --policy random
+    python -m core.batch_runner --runs 2000 --set fuel_spawn_cooldown=3000
+    python -m core.batch_runner --runs 2000 --set "spawn_delay_range=(800, 2000)"
+
+Cada partida usa a semente base + índice, então rodar o mesmo comando duas
+vezes dá exatamente o mesmo resultado, e comparar dois valores de um
+parâmetro compara as mesmas partidas.
+"""
+
+import argparse
+import ast
+import json
+import os
+import statistics
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from config.constants import SIM_HZ
+from core.headless import HeadlessRunner
+from core.policies import POLICIES
+
+
+# Parâmetros do GameWorld que podem ser alterados pela linha de comando
+TUNABLE_PARAMS = (
+    "spawn_delay",
+    "spawn_delay_range",
+    "lane_cooldown",
+    "pickup_cooldown",
+    "fuel_spawn_cooldown",
+    "ghost_spawn_rate",
+    "rocket_pickup_spawn_rate",
+)
+
+# Cada processo cria um HeadlessRunner só uma vez (pygame.init e o
+# carregamento das imagens custam mais do que uma partida curta)
+_runner = None
+
+
+def _get_runner():
+    global _runner
+    if _runner is None:
+        _runner = HeadlessRunner()
+    return _runner
+
+
+def run_session(task):
+    """
+    Roda uma partida completa. Executado dentro dos processos do pool.
+
+    Args:
+        task: Tupla (semente, nome da política, duração em segundos, params)
+
+    Returns:
+        Resumo da partida (ver HeadlessRunner.summary)
+    """
+    seed, policy_name, duration, params = task
+    runner = _get_runner()
+    runner.seed = seed
+    runner.params = params
+    runner.policy = POLICIES[policy_name](seed)
+    runner.reset()
+    return runner.run(duration)
+
+
+def run_batch(runs, policy="random", duration=120, base_seed=0, params=None, workers=None):
+    """
+    Distribui as partidas entre todos os núcleos da máquina.
+
+    Args:
+        runs: Número de partidas
+        policy: Nome da política de entrada (ver core.policies.POLICIES)
+        duration: Tempo máximo de cada partida (segundos simulados)
+        base_seed: Semente da primeira partida (as outras usam base_seed + i)
+        params: Parâmetros do GameWorld a sobrescrever (ver TUNABLE_PARAMS)
+        workers: Número de processos (None = um por núcleo)
+
+    Returns:
+        Lista com o resumo de cada partida, na ordem das sementes
+    """
+    workers = workers or os.cpu_count() or 1
+    tasks = [(base_seed + i, policy, duration, params or {}) for i in range(runs)]
+
+    # Lotes grandes evitam pagar a comunicação entre processos a cada partida
+    chunksize = max(1, runs // (workers * 8))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(run_session, tasks, chunksize=chunksize))
+
+
+def aggregate(results, duration, wall_time):
+    """
+    Junta os resumos das partidas em um relatório.
+
+    survival_time é o tempo até o game over; partidas que chegaram ao fim
+    da duração contam como a duração inteira.
+    """
+    survival = [r["sim_time"] for r in results]
+    scores = [r["score"] for r in results]
+    fuel = [r["fuel_collected"] for r in results]
+    total_steps = sum(r["steps"] for r in results)
+    worker_time = sum(r["wall_time"] for r in results)
+
+    return {
+        "runs": len(results),
+        "duration": duration,
+        "game_over_rate": sum(r["game_over"] for r in results) / len(results),
+        "survival_time": _describe(survival),
+        "score": _describe(scores),
+        "fuel_collected": _describe(fuel),
+        "total_steps": total_steps,
+        "wall_time": wall_time,
+        # Passos por segundo de um processo e de todos juntos
+        "sim_fps_per_worker": total_steps / worker_time if worker_time > 0 else 0.0,
+        "sim_fps_total": total_steps / wall_time if wall_time > 0 else 0.0,
+    }
+
+
+def _describe(values):
+    """Média, desvio, mínimo, percentis e máximo de uma lista de valores"""
+    ordered = sorted(values)
+    return {
+        "mean": statistics.fmean(ordered),
+        "stdev": statistics.pstdev(ordered),
+        "min": ordered[0],
+        "p10": _percentile(ordered, 0.10),
+        "median": _percentile(ordered, 0.50),
+        "p90": _percentile(ordered, 0.90),
+        "max": ordered[-1],
+    }
+
+
+def _percentile(ordered, fraction):
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def print_report(report):
+    """Mostra o relatório do lote no terminal"""
+    print("=== Lote de simulações ===")
+    print(f"Partidas:            {report['runs']} (até {report['duration']:.0f}s cada)")
+    print(f"Game over:           {report['game_over_rate']:.1%}")
+    for key, label in (
+        ("survival_time", "Sobrevivência (s)"),
+        ("score", "Pontuação"),
+        ("fuel_collected", "Combustíveis"),
+    ):
+        stats = report[key]
+        print(
+            f"{label + ':':<20} média {stats['mean']:.1f} ± {stats['stdev']:.1f}"
+            f" | p10 {stats['p10']:.1f} | mediana {stats['median']:.1f}"
+            f" | p90 {stats['p90']:.1f} | máx {stats['max']:.1f}"
+        )
+    print(f"Passos simulados:    {report['total_steps']}")
+    print(f"Tempo real:          {report['wall_time']:.2f}s")
+    print(f"FPS por processo:    {report['sim_fps_per_worker']:.0f}")
+    print(f"FPS total:           {report['sim_fps_total']:.0f}")
+
+
+def parse_param(text):
+    """
+    Converte "nome=valor" em (nome, valor).
+
+    O valor é lido como literal Python: 3000, 2.5, (800, 2000)...
+    """
+    name, _, value = text.partition("=")
+    name = name.strip()
+    if name not in TUNABLE_PARAMS:
+        raise argparse.ArgumentTypeError(
+            f"Parâmetro desconhecido: {name!r} (use um de: {', '.join(TUNABLE_PARAMS)})"
+        )
+    try:
+        return name, ast.literal_eval(value.strip())
+    except (ValueError, SyntaxError):
+        raise argparse.ArgumentTypeError(f"Valor inválido para {name}: {value!r}")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Simulações headless em lote")
+    parser.add_argument("--runs", type=int, default=1000, help="Número de partidas")
+    parser.add_argument(
+        "--policy", choices=sorted(POLICIES), default="random", help="Política de entrada"
+    )
+    parser.add_argument(
+        "--duration", type=float, default=120, help="Duração máxima de cada partida (s)"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Semente da primeira partida")
+    parser.add_argument(
+        "--workers", type=int, default=None, help="Processos (padrão: um por núcleo)"
+    )
+    parser.add_argument(
+        "--set",
+        dest="params",
+        type=parse_param,
+        action="append",
+        default=[],
+        metavar="NOME=VALOR",
+        help="Sobrescreve um parâmetro do GameWorld (pode repetir)",
+    )
+    parser.add_argument("--json", default=None, help="Salva o relatório em JSON")
+    args = parser.parse_args()
+    if args.runs < 1:
+        parser.error("--runs precisa ser pelo menos 1")
+    return args
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    params = dict(args.params)
+
+    start = time.perf_counter()
+    results = run_batch(
+        args.runs,
+        policy=args.policy,
+        duration=args.duration,
+        base_seed=args.seed,
+        params=params,
+        workers=args.workers,
+    )
+    report = aggregate(results, args.duration, time.perf_counter() - start)
+    report["policy"] = args.policy
+    report["params"] = params
+    report["sim_hz"] = SIM_HZ
+
+    print_report(report)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2, ensure_ascii=False)
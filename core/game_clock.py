@@ -0,0 +1,80 @@
+class GameClock:
+    """
+    Relógio da simulação, independente do relógio real.
+
+    Todo o jogo (spawns, cooldowns, power-ups, animações) consulta este
+    relógio em vez de pygame.time.get_ticks(). Ele só anda quando alguém
+    chama step(sim_dt), então:
+    - Em modo headless o tempo avança tão rápido quanto a CPU aguentar
+    - Pausado, o tempo para (nenhum cooldown "vence" durante a pausa)
+    - Com time_scale > 1 o jogo roda acelerado (fast-forward)
+
+    O tempo é guardado em milissegundos, no mesmo formato de get_ticks(),
+    para que as contas existentes (ex: current_time - last_spawn > 1000)
+    continuem iguais.
+    """
+
+    FAST_FORWARD_SCALE = 4.0  # Velocidade padrão do fast-forward
+
+    def __init__(self, time_scale=1.0):
+        self.time_ms = 0.0  # Tempo simulado acumulado (ms, com fração)
+        self.time_scale = time_scale  # Multiplicador aplicado ao dt real
+        self.paused = False
+
+    def get_ticks(self):
+        """Tempo simulado em ms (substituto de pygame.time.get_ticks)"""
+        return int(self.time_ms)
+
+    def scale(self, dt):
+        """
+        Converte tempo real em tempo simulado.
+
+        Args:
+            dt: Tempo real decorrido (segundos)
+
+        Returns:
+            O dt simulado (segundos): 0 se pausado, dt * time_scale caso contrário
+        """
+        if self.paused:
+            return 0.0
+        return dt * self.time_scale
+
+    def step(self, sim_dt):
+        """
+        Avança o relógio por um passo de simulação.
+
+        Args:
+            sim_dt: Duração do passo, já em tempo simulado (segundos)
+        """
+        self.time_ms += sim_dt * 1000
+
+    def reset(self):
+        """Volta o tempo simulado para zero (nova partida)"""
+        self.time_ms = 0.0
+        self.paused = False
+
+    # === PAUSA ===
+
+    def pause(self):
+        self.paused = True
+
+    def resume(self):
+        self.paused = False
+
+    def toggle_pause(self):
+        self.paused = not self.paused
+
+    # === ESCALA DE TEMPO ===
+
+    def set_time_scale(self, scale):
+        """Define a velocidade da simulação (1.0 = tempo real)"""
+        if scale <= 0:
+            raise ValueError("A escala de tempo precisa ser positiva")
+        self.time_scale = scale
+
+    def toggle_fast_forward(self, scale=FAST_FORWARD_SCALE):
+        """Alterna entre velocidade normal e fast-forward"""
+        if self.time_scale == 1.0:
+            self.set_time_scale(scale)
+        else:
+            self.set_time_scale(1.0)
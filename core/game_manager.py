@@ -1,8 +1,9 @@
 import pygame
-import random
-import math
+from config.constants import DIRTY_AREA_LIMIT, DIRTY_RECTS, FPS, SIM_HZ, MAX_FRAME_TIME
+from core.game_clock import GameClock
 from core.game_world import GameWorld
-from entities.pickups.effects.ghost_effect import GhostPickupEffect
+from core.random_streams import RandomStreams
+from core.replay import Replay, ReplayPlayer
 from entities.player import Player
 from entities.side_gif import SideGif
 from img import img_config
@@ -15,10 +16,23 @@ from utils.score_manager import ScoreManager
 from ui.highscore_screen import HighscoreScreen
 from ui.leaderboard_screen import LeaderboardScreen
 from ui.credits_screen import CreditsScreen
+from ui.start_screen import StartScreen
+from ui.game_over_screen import GameOverScreen
 
 
 class GameManager:
-    def __init__(self, width, height, title):
+    def __init__(
+        self,
+        width,
+        height,
+        title,
+        fps=FPS,
+        seed=None,
+        record_path=None,
+        replay=None,
+        replay_speed=1.0,
+        replay_start=0.0,
+    ):
         pygame.init()
 
         # Inicializa o mixer de áudio
@@ -27,19 +41,38 @@ class GameManager:
         self.width = width
         self.height = height
         self.running = True
-        self.fps = 60
+        self.fps = fps  # Limite de desenho (0 = sem limite, modo benchmark)
         self.clock = pygame.time.Clock()
 
+        # Relógio da simulação: só avança com o dt do jogo (pausa/fast-forward)
+        self.game_clock = GameClock()
+
+        # Semente da partida (None = sorteia uma nova a cada partida)
+        self.seed = seed
+
+        # Gravação e reprodução de replays
+        self.record_path = record_path  # Onde salvar o replay (None = não grava)
+        self.recording = None  # Replay da partida em andamento
+        self.replay_player = None  # Fonte de teclas quando reproduzindo um replay
+        if replay is not None:
+            self.seed = replay.seed  # O replay só vale com a mesma semente
+            self.game_clock.set_time_scale(replay_speed)
+
+        # Passo fixo da simulação (desacoplado da taxa de desenho)
+        self.sim_dt = 1 / SIM_HZ
+        self.accumulator = 0.0  # Tempo simulado ainda não processado
+
         self.screen = Screen(width, height, title)
         self.img_config = ImgConfig(width, height)
-        self.game_world = GameWorld(width, height, self.img_config)
+        self.game_world = GameWorld(
+            width, height, self.img_config, self.game_clock, RandomStreams(self.seed)
+        )
         self.game_world.game_manager = self  # Permite acesso aos sons
         self.game_world.car.game_manager = self  # Para o jogador acessar os sons também
 
         # Pontuação
         self.score = 0
-        self.bonus_score = 0  # Pontos de bônus (explosões, etc)
-        self.start_ticks = pygame.time.get_ticks()
+        self.start_ticks = self.game_clock.get_ticks()
         self.game_over = False
         self.game_over_time = None
 
@@ -49,11 +82,17 @@ class GameManager:
         self.leaderboard_screen = LeaderboardScreen(self.score_manager)
         self.credits_screen = CreditsScreen()
         self.current_state = "start_screen"
+        self.presented_state = None  # Tela enviada à janela no último quadro
 
         # Menu inicial: opções e seleção (navegável por setas)
         self.menu_options = ["Iniciar Jogo", "Ranking", "Créditos", "Sair"]
         self.menu_selection = 0
-        self.menu_rects = []  # Para armazenar as áreas clicáveis das opções
+        # Telas de menu desenhadas a partir de camadas prontas
+        self.start_screen = StartScreen(
+            width, height, self.menu_options, getattr(self.img_config, "car_img", None)
+        )
+        self.game_over_screen = GameOverScreen(width, height)
+        self.menu_rects = self.start_screen.option_rects  # Áreas clicáveis das opções
 
 
         # Carrega os sons
@@ -64,10 +103,9 @@ class GameManager:
             self.game_world.car,
             self.img_config,
             lambda: self.score,
+            self.game_clock,
         )
 
-        self.game_world.car.ghost_effect = GhostPickupEffect(self.game_world.car)
-
         self.player_controls_enabled = True
         self.showing_explosion = False
         self.explosion_end_time = 0
@@ -76,11 +114,21 @@ class GameManager:
         self.side_gifs_list = []
         self._init_side_gifs()
 
+        # Replay: pula o menu e começa a partida direto
+        if replay is not None:
+            self.replay_player = ReplayPlayer(replay)
+            self._restart_game()
+            if replay_start > 0:
+                self._seek_replay(int(replay_start * replay.sim_hz))
+
     def _init_side_gifs(self):
         """Cria GIFs laterais com spawn controlado por probabilidade"""
         if not self.img_config.side_gifs:
             return
 
+        # Sorteios só visuais usam o stream "cosmetic" da partida
+        rng = self.game_world.rng.cosmetic
+
         sizes = {
             "coqueiro": (40, 80),
             "casa": (120, 120),
@@ -103,19 +151,19 @@ class GameManager:
                 continue
 
             chance = spawn_chances.get(folder_name, 1.0)
-            if random.random() > chance:
+            if rng.random() > chance:
                 continue
 
             size = sizes.get(folder_name, sizes["default"])
 
             # Posição Y aleatória
-            y = random.randint(-200, self.height - 50)
+            y = rng.randint(-200, self.height - 50)
 
             if folder_name == "casa":
                 # CASA apenas no lado direito
                 x_right = self.width - size[0]  # colada na direita
                 self.side_gifs_list.append(
-                    SideGif(frames, x_right, y, speed=5, frame_duration=300, size=size)
+                    SideGif(frames, x_right, y, self.game_clock, speed=5, frame_duration=300, size=size)
                 )
             else:
                 # Outros objetos podem spawnar dos dois lados
@@ -125,17 +173,17 @@ class GameManager:
                 x_right = self.width - size[0] - offset
 
                 y_left = y
-                y_right = random.randint(-200, self.height - 50)
+                y_right = rng.randint(-200, self.height - 50)
 
                 # Evita spawn no mesmo Y dos dois lados
                 while abs(y_right - y_left) < 80:
-                    y_right = random.randint(-200, self.height - 50)
+                    y_right = rng.randint(-200, self.height - 50)
 
                 self.side_gifs_list.append(
-                    SideGif(frames, x_left, y_left, speed=5, frame_duration=300, size=size)
+                    SideGif(frames, x_left, y_left, self.game_clock, speed=5, frame_duration=300, size=size)
                 )
                 self.side_gifs_list.append(
-                    SideGif(frames, x_right, y_right, speed=5, frame_duration=300, size=size)
+                    SideGif(frames, x_right, y_right, self.game_clock, speed=5, frame_duration=300, size=size)
                 )
 
 
@@ -143,14 +191,20 @@ class GameManager:
         last_time = pygame.time.get_ticks()
         while self.running:
             current_time = pygame.time.get_ticks()
-            dt = (current_time - last_time) / 1000.0  # Delta time em segundos
+            dt = (current_time - last_time) / 1000.0  # Delta time em segundos (real)
             last_time = current_time
+
+            # Depois de um engasgo longo (ex: arrastar a janela) não tenta
+            # recuperar todo o atraso de uma vez
+            dt = min(dt, MAX_FRAME_TIME)
             
             self._handle_events()
-            self._update(current_time, dt)
-            self._render()
-            pygame.display.flip()
+            self._update(dt)
+            self._present(self._render())
             self.clock.tick(self.fps)
+
+        # Fechou a janela no meio da partida: salva o que foi gravado
+        self._save_recording()
         pygame.quit()
 
     def _handle_events(self):
@@ -158,6 +212,10 @@ class GameManager:
             if event.type == pygame.QUIT:
                 self.running = False
 
+            # A janela foi descoberta/redimensionada: reenvia a tela inteira
+            if event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                self.presented_state = None
+
             # Tela inicial
             if self.current_state == "start_screen":
                 if event.type == pygame.KEYDOWN:
@@ -247,6 +305,14 @@ class GameManager:
                 if result == "menu":
                     self.current_state = "start_screen"
 
+            # Durante o jogo: pausa e fast-forward
+            elif self.current_state == "game":
+                if event.type == pygame.KEYDOWN:
+                    if event.key == pygame.K_p:
+                        self.game_clock.toggle_pause()
+                    elif event.key == pygame.K_f:
+                        self.game_clock.toggle_fast_forward()
+
             # Tela de game over
             elif self.current_state == "game_over":
                 if event.type == pygame.KEYDOWN:
@@ -258,53 +324,25 @@ class GameManager:
                         self.current_state = "start_screen"
 
 
-    def _update(self, current_time, dt):
+    def _update(self, dt):
         # Atualiza apenas se estiver no estado de jogo
         if self.current_state == "game":
-            if not self.game_over:
-                # Calcula pontuação baseada na distância percorrida + bônus
-                # Distância é medida em pixels, convertemos para metros (dividindo por 100)
-                # E multiplicamos por 1 para cada metro = 1 ponto
-                distance_in_meters = int(self.game_world.distance_traveled / 100)
-                self.score = distance_in_meters + self.bonus_score
-
-            # Atualiza o mundo do jogo com as teclas pressionadas
-            keys = pygame.key.get_pressed() if self.player_controls_enabled else {}
-            self.game_world.update(keys, dt)
-
-            # Atualiza os GIFs laterais
-            for gif in self.side_gifs_list:
-                gif.update(dt)
-
-            # Gerencia o poder fantasma
-            self._handle_ghost_power(current_time)
-
-            # Verifica condições do jogo se não estiver em explosão ou game over
-            if not self.showing_explosion and not self.game_over:
-                self._check_game_conditions()
-
-            # Transição para highscore_input ou game_over após 3 segundos
-            if self.game_over and current_time - self.game_over_time > 3000:
-                # VERIFICA se é uma pontuação alta ANTES de mudar de estado
-                if self.score_manager.is_highscore(self.score):
-                    self.current_state = "highscore_input"
-                    self.highscore_screen.active = True  # Ativa a tela de highscore
-                    print(f"Nova pontuação alta! Score: {self.score}")  # DEBUG
-                else:
-                    self.current_state = "game_over"
-                    print(f"Pontuação não é highscore: {self.score}")  # DEBUG
-
-            # CORREÇÃO: Não encerrar o jogo após explosão, apenas mudar de estado
-            if (self.showing_explosion and current_time >= self.explosion_end_time
-                and self.current_state == "game"):
-                self.showing_explosion = False
-                # Não encerre o jogo, apenas processe a transição de estado
-                if self.game_over:
-                    if self.score_manager.is_highscore(self.score):
-                        self.current_state = "highscore_input"
-                        self.highscore_screen.active = True
-                    else:
-                        self.current_state = "game_over"
+            # Acumula o tempo do frame (já com pausa/escala aplicadas) e roda
+            # quantos passos fixos couberem nele. Assim a física sempre usa o
+            # mesmo dt, não importa se o frame demorou 4ms ou 40ms.
+            self.accumulator += self.game_clock.scale(dt)
+            while self.accumulator >= self.sim_dt and self.current_state == "game":
+                self.game_clock.step(self.sim_dt)
+                self._fixed_update(self.sim_dt)
+                self.accumulator -= self.sim_dt
+
+            # A partida gravada acabou (game over ou fim do replay)
+            if self.current_state != "game":
+                self._save_recording()
+            if self.replay_player is not None and (
+                self.replay_player.finished or self.current_state != "game"
+            ):
+                self.running = False
 
         # ADICIONADO: Atualiza a tela de highscore se necessário
         elif self.current_state == "highscore_input":
@@ -323,28 +361,124 @@ class GameManager:
             # Esses estados não precisam de atualizações de jogo
             pass
 
+    def _fixed_update(self, dt):
+        """
+        Executa um passo de simulação de duração fixa.
+
+        Args:
+            dt: Duração do passo (sempre self.sim_dt)
+        """
+        current_time = self.game_clock.get_ticks()
+
+        if not self.game_over:
+            # Calcula pontuação baseada na distância percorrida + bônus
+            self.score = self.game_world.get_score()
+
+        # Atualiza o mundo do jogo com as teclas pressionadas
+        keys = self._read_keys()
+        if self.recording is not None:
+            self.recording.record(keys)
+        self.game_world.update(keys, dt)
+
+        # Atualiza os GIFs laterais
+        for gif in self.side_gifs_list:
+            gif.save_previous_position()
+            gif.update(dt)
+
+        # Gerencia o poder fantasma
+        self._handle_ghost_power(current_time)
+
+        # Verifica condições do jogo se não estiver em explosão ou game over
+        if not self.showing_explosion and not self.game_over:
+            self._check_game_conditions()
+
+        # Transição para highscore_input ou game_over após 3 segundos
+        if self.game_over and current_time - self.game_over_time > 3000:
+            # VERIFICA se é uma pontuação alta ANTES de mudar de estado
+            if self.score_manager.is_highscore(self.score):
+                self.current_state = "highscore_input"
+                self.highscore_screen.active = True  # Ativa a tela de highscore
+                print(f"Nova pontuação alta! Score: {self.score}")  # DEBUG
+            else:
+                self.current_state = "game_over"
+                print(f"Pontuação não é highscore: {self.score}")  # DEBUG
+
+        # CORREÇÃO: Não encerrar o jogo após explosão, apenas mudar de estado
+        if (self.showing_explosion and current_time >= self.explosion_end_time
+            and self.current_state == "game"):
+            self.showing_explosion = False
+            # Não encerre o jogo, apenas processe a transição de estado
+            if self.game_over:
+                if self.score_manager.is_highscore(self.score):
+                    self.current_state = "highscore_input"
+                    self.highscore_screen.active = True
+                else:
+                    self.current_state = "game_over"
+
+        # Keyframe para o replay poder pular direto para este ponto
+        # (só durante a partida: depois do game over não há o que procurar)
+        if self.recording is not None and not self.game_over and self.recording.wants_keyframe():
+            self.recording.add_keyframe(self.game_world.snapshot())
+
+    def _seek_replay(self, step):
+        """
+        Pula o replay para um passo: restaura o keyframe mais próximo e
+        simula o restante sem desenhar.
+        """
+        keyframe = self.replay_player.replay.nearest_keyframe(step)
+        if keyframe is not None:
+            keyframe_step, snapshot = keyframe
+            self.game_world.restore(snapshot)
+            self.replay_player.seek(keyframe_step)
+
+        while (
+            self.replay_player.step < step
+            and not self.replay_player.finished
+            and self.current_state == "game"
+        ):
+            self.game_clock.step(self.sim_dt)
+            self._fixed_update(self.sim_dt)
+
+    def _read_keys(self):
+        """Teclas deste passo: do teclado ou do replay em reprodução"""
+        if self.replay_player is not None:
+            return self.replay_player.next_keys()
+        if not self.player_controls_enabled:
+            return {}
+        return pygame.key.get_pressed()
+
+    def _save_recording(self):
+        """Salva o replay da partida em andamento (se houver)"""
+        if self.recording is None:
+            return
+        self.recording.save(self.record_path)
+        print(f"Replay salvo em {self.record_path} ({self.recording.steps} passos)")
+        self.recording = None
 
     def _check_rocket_explosion(self):
         """Verifica se a rocket explodiu inimigos e adiciona pontos"""
         # NOTA: A adição de pontos agora é feita diretamente no game_world
         # quando o foguete colide com o inimigo (linha ~85 de game_world.py)
         if hasattr(self.game_world, "rocket_explosion_active") and self.game_world.rocket_explosion_active:
-            for enemy in self.game_world.enemies[:]:
-                if self.game_world.rocket_explosion_rect.colliderect(enemy.rect):
-                    # Pontos já são adicionados no game_world.update()
-                    self.game_world.enemies.remove(enemy)
-                    # Pode tocar som de inimigo explodindo, se quiser
-                    if hasattr(self, "explosion_sound"):
-                        self.explosion_sound.play()
+            for enemy in self.game_world.enemies.colliding(self.game_world.rocket_explosion_rect):
+                # Pontos já são adicionados no game_world.update()
+                self.game_world.enemies.remove(enemy)
+                # Pode tocar som de inimigo explodindo, se quiser
+                if hasattr(self, "explosion_sound"):
+                    self.explosion_sound.play()
 
     def _handle_ghost_power(self, current_time):
         self._check_ghost_pickup_collision(current_time)
 
     def _check_ghost_pickup_collision(self, current_time):
-        for pickup in self.game_world.ghost_pickups[:]:
+        # Só um pickup é coletado (break logo depois), então dá para
+        # percorrer a lista sem copiar
+        for pickup in self.game_world.ghost_pickups:
             if pickup.check_collision(self.game_world.car):
                 self._activate_ghost_power(current_time)
                 self.game_world.ghost_pickups.remove(pickup)
+                self.game_world.lane_occupancy.remove_pickup(pickup)
+                self.game_world.ghost_pool.release(pickup)
                 # Toca o som do pickup
                 if hasattr(self, "ghost_pickup_sound"):
                     self.ghost_pickup_sound.play()
@@ -384,66 +518,34 @@ class GameManager:
         self._check_fuel()
 
     def _check_collisions(self):
-        # Se não há inimigos, não precisa verificar colisões
-        if not self.game_world.enemies:
+        current_time = self.game_clock.get_ticks()
+
+        # A regra de colisão (incluindo o modo fantasma) fica no GameWorld
+        enemy = self.game_world.check_player_collision(current_time)
+        if enemy is None:
             return
 
-        # Verifica se o efeito fantasma está ativo no jogador
-        current_time = pygame.time.get_ticks()
-        ghost_mode_active = (
-            hasattr(self.game_world.car, "ghost_power_active")
-            and self.game_world.car.ghost_power_active
-            and current_time < self.game_world.car.ghost_power_end_time
-        )
+        print("COLISÃO DETECTADA - GAME OVER")  # DEBUG
 
-        for enemy in self.game_world.enemies[:]:
-            # USA O MÉTODO check_collision DO EFEITO FANTASMA
-            collision_occurred = False
+        # Congela todo o jogo
+        self.game_world.freeze_all()
+        self.player_controls_enabled = False
 
-            # Verifica se o efeito fantasma existe e detecta colisão
-            if (
-                hasattr(self.game_world.car, "ghost_effect")
-                and self.game_world.car.ghost_effect is not None
-            ):
-                collision_occurred = self.game_world.car.ghost_effect.check_collision(
-                    enemy
-                )
-            else:
-                # Fallback: verificação de colisão normal se não houver efeito fantasma
-                collision_occurred = self.game_world.car.check_collision(enemy)
+        # Congela os sidegifs
+        for gif in self.side_gifs_list:
+            gif.frozen = True
 
-            if collision_occurred:
-                if ghost_mode_active:
-                    print("Colisão ignorada - modo fantasma ativo")  # DEBUG
-                    continue  # Ignora colisão se estiver no modo fantasma
+        # Ativa explosão
+        car_center = self.game_world.car.rect.center
+        self.game_world.explosions.trigger(car_center[0], car_center[1], 50)
+        self.explosion_end_time = current_time + 2000
+        self.showing_explosion = True
+        self.game_over = True
+        self.game_over_time = current_time
 
-                print("COLISÃO DETECTADA - GAME OVER")  # DEBUG
-
-                # Verificação de segurança
-                if not hasattr(self.game_world, "frozen"):
-                    self.game_world.frozen = False
-
-                # Congela todo o jogo
-                self.game_world.freeze_all()
-                self.player_controls_enabled = False
-                
-                # Congela os sidegifs
-                for gif in self.side_gifs_list:
-                    gif.frozen = True
-
-                # Ativa explosão
-                car_center = self.game_world.car.rect.center
-                self.game_world.explosion.trigger(car_center[0], car_center[1], 50)
-                self.explosion_end_time = current_time + 2000
-                self.showing_explosion = True
-                self.game_over = True
-                self.game_over_time = current_time
-
-                # Toca som de explosão
-                if hasattr(self, "explosion_sound"):
-                    self.explosion_sound.play()
-
-                break  # Sai do loop após a primeira colisão
+        # Toca som de explosão
+        if hasattr(self, "explosion_sound"):
+            self.explosion_sound.play()
 
     def _check_fuel(self):
         """Verifica se o combustível acabou"""
@@ -455,7 +557,7 @@ class GameManager:
                 gif.frozen = True
                 
             self.game_over = True
-            self.game_over_time = pygame.time.get_ticks()
+            self.game_over_time = self.game_clock.get_ticks()
 
     def _load_sounds(self):
         """Carrega todos os sons do jogo"""
@@ -502,93 +604,112 @@ class GameManager:
             self.rocket_sound = dummy_sound
             self.pickup_sound = dummy_sound
 
+    def _menu_screen(self):
+        """
+        Tela de menu do estado atual e os argumentos do draw() dela.
+
+        Returns:
+            (tela, argumentos), ou None durante a partida
+        """
+        if self.current_state == "start_screen":
+            return self.start_screen, (self.menu_selection,)
+        if self.current_state == "highscore_input":
+            return self.highscore_screen, (self.score,)
+        if self.current_state == "leaderboard":
+            return self.leaderboard_screen, ()
+        if self.current_state == "credits":
+            return self.credits_screen, ()
+        if self.current_state == "game_over":
+            return self.game_over_screen, (self.score,)
+        return None
+
     def _render(self):
+        """
+        Desenha o quadro atual na superfície da tela.
+
+        Numa tela de menu parada (needs_redraw() falso e a mesma tela do
+        quadro anterior) nada é desenhado: a superfície ainda tem o último
+        quadro, e _present não envia nada.
+
+        Returns:
+            Lista de Rects alterados desde o quadro anterior, informada
+            pelas telas de menu (None = a tela inteira)
+        """
+        menu = self._menu_screen()
+        if menu is not None:
+            screen, args = menu
+            if self.current_state == self.presented_state and not screen.needs_redraw(*args):
+                return []
+
         # Limpa a tela
         self.screen.surface.fill((0, 0, 0))
 
-        # Desenha de acordo com o estado atual
-        if self.current_state == "start_screen":
-            # ADICIONADO: Desenha a tela inicial
-            self._draw_start_screen()
+        if menu is not None:
+            return screen.draw(self.screen.surface, *args)
+
+        if self.current_state == "game":
+            # Quanto do próximo passo de simulação já passou (0 a 1):
+            # o desenho interpola entre os dois últimos estados
+            alpha = min(1.0, self.accumulator / self.sim_dt)
 
-        elif self.current_state == "game":
             # Desenha o mundo do jogo
-            self.game_world.draw(self.screen.surface)
+            self.game_world.draw(self.screen.surface, alpha)
 
             # Desenha os GIFs laterais
             for gif in self.side_gifs_list:
-                gif.draw(self.screen.surface)
+                gif.draw(self.screen.surface, alpha)
 
             # Atualiza e desenha o HUD
             self.hud.update()
             self.hud.draw()
 
-        elif self.current_state == "highscore_input":
-            # ADICIONADO: Desenha a tela de inserção de nome
-            self.highscore_screen.draw(self.screen.surface, self.score)
-
-        elif self.current_state == "leaderboard":
-            # ADICIONADO: Desenha a tela de leaderboard
-            self.leaderboard_screen.draw(self.screen.surface)
-
-        elif self.current_state == "credits":
-            # ADICIONADO: Desenha a tela de créditos
-            self.credits_screen.draw(self.screen.surface)
-
-        elif self.current_state == "game_over":
-            # ADICIONADO: Tela de game over com opções
-            self._draw_game_over_screen()
-
-    def _draw_game_over_screen(self):
-        """Desenha a tela de game over com opções"""
-        # Fundo escuro semi-transparente
-        overlay = pygame.Surface((self.width, self.height))
-        overlay.set_alpha(200)
-        overlay.fill((0, 0, 0))
-        self.screen.surface.blit(overlay, (0, 0))
-
-        # Título
-        font_large = pygame.font.Font(None, 64)
-        title = font_large.render("FIM DE JOGO", True, (255, 255, 255))
-        self.screen.surface.blit(title, (self.width // 2 - title.get_width() // 2, 100))
-
-        # Pontuação
-        font_medium = pygame.font.Font(None, 48)
-        score_text = font_medium.render(
-            f"Pontuação: {self.score}", True, (255, 255, 255)
+        return None
+
+    def _present(self, dirty):
+        """
+        Envia o quadro desenhado para a janela.
+
+        Nos menus só as áreas alteradas são enviadas
+        (pygame.display.update(rects)); num quadro parado nada é enviado.
+        A tela inteira é enviada (pygame.display.flip()) durante a partida,
+        que rola a pista inteira a cada quadro, na troca de tela, quando a
+        tela não informou as áreas ou quando elas passam de
+        DIRTY_AREA_LIMIT da tela.
+
+        Args:
+            dirty: Lista de Rects alterados (None = a tela inteira)
+        """
+        full = (
+            not DIRTY_RECTS
+            or dirty is None
+            or self.current_state == "game"
+            or self.current_state != self.presented_state
+            or sum(rect.width * rect.height for rect in dirty)
+            > DIRTY_AREA_LIMIT * self.width * self.height
         )
-        self.screen.surface.blit(
-            score_text, (self.width // 2 - score_text.get_width() // 2, 180)
-        )
-
-        # Opções
-        font_small = pygame.font.Font(None, 36)
-        options = [
-            "Pressione R para reiniciar",
-            "Pressione L para ver o ranking",
-            "Pressione ESC ou ENTER para voltar ao menu",
-        ]
-
-        y_pos = 280
-        for option in options:
-            text = font_small.render(option, True, (200, 200, 200))
-            self.screen.surface.blit(
-                text, (self.width // 2 - text.get_width() // 2, y_pos)
-            )
-            y_pos += 40
+        if full:
+            pygame.display.flip()
+        elif dirty:
+            pygame.display.update(dirty)
+        self.presented_state = self.current_state
 
     def _restart_game(self):
         """Reinicia o jogo"""
-        # Recria todas as instâncias necessárias
-        self.game_world = GameWorld(self.width, self.height, self.img_config)
+        # Uma partida ainda gravando (ex: reinício pelo menu) é salva antes
+        self._save_recording()
+
+        # Recria todas as instâncias necessárias (com o tempo simulado zerado)
+        self.game_clock.reset()
+        self.accumulator = 0.0
+        self.game_world = GameWorld(
+            self.width, self.height, self.img_config, self.game_clock, RandomStreams(self.seed)
+        )
         self.game_world.game_manager = self
         self.game_world.car.game_manager = self
-        self.game_world.car.ghost_effect = GhostPickupEffect(self.game_world.car)
 
         # Reseta variáveis de estado
         self.score = 0
-        self.bonus_score = 0  # Reseta os pontos de bônus
-        self.start_ticks = pygame.time.get_ticks()
+        self.start_ticks = self.game_clock.get_ticks()
         self.game_over = False
         self.game_over_time = None
         self.player_controls_enabled = True
@@ -611,109 +732,16 @@ class GameManager:
             self.game_world.car,
             self.img_config,
             lambda: self.score,
+            self.game_clock,
         )
 
         # Recria os GIFs laterais
         self.side_gifs_list = []
         self._init_side_gifs()
 
-    def _draw_start_screen(self):
-        """Desenha uma tela inicial simples"""
-        # Fundo com gradiente vertical (doescuro para mais claro)
-        top_color = pygame.Color(6, 16, 42)
-        bottom_color = pygame.Color(10, 60, 120)
-        for i in range(self.height):
-            ratio = i / self.height
-            r = int(top_color.r * (1 - ratio) + bottom_color.r * ratio)
-            g = int(top_color.g * (1 - ratio) + bottom_color.g * ratio)
-            b = int(top_color.b * (1 - ratio) + bottom_color.b * ratio)
-            pygame.draw.line(self.screen.surface, (r, g, b), (0, i), (self.width, i))
-
-        # Fontes
-        font_large = pygame.font.Font(None, 72)
-        font_medium = pygame.font.Font(None, 40)
-        font_small = pygame.font.Font(None, 22)
-
-        # Título com sombra
-        title = font_large.render("CORRIDINHA", True, (255, 230, 120))
-        title_shadow = font_large.render("CORRIDINHA", True, (20, 20, 40))
-        tx = self.width // 2 - title.get_width() // 2
-        self.screen.surface.blit(title_shadow, (tx + 4, 104))
-        self.screen.surface.blit(title, (tx, 100))
-
-        # Pequena descrição abaixo
-        subtitle = font_small.render("Desvie, colete power-ups e sobreviva o maior tempo!", True, (220, 220, 220))
-        self.screen.surface.blit(subtitle, (self.width // 2 - subtitle.get_width() // 2, 170))
-
-        # Animação de pulso para item selecionado
-        t = pygame.time.get_ticks() / 1000.0
-        pulse = 1.0 + 0.05 * (1 + math.sin(t * 3))
-
-        # Desenha um sprite de carro (pixel art se disponível) com um leve bob
-        try:
-            car_sprite = self.img_config.car_img
-        except Exception:
-            car_sprite = None
-
-        if car_sprite:
-            # Escala para uma dimensão agradável no menu
-            car_w = 120
-            car_h = int(car_sprite.get_height() * (car_w / car_sprite.get_width()))
-            car_img_scaled = pygame.transform.scale(car_sprite, (car_w, car_h))
-
-            # Bob (subida/descida) para animação
-            bob = int(8 * math.sin(t * 2.0))
-
-            car_x = self.width // 2 - car_w // 2
-            car_y = 200 + bob
-
-            # Sombra simples
-            shadow = pygame.Surface((car_w, 8), pygame.SRCALPHA)
-            pygame.draw.ellipse(shadow, (0, 0, 0, 100), shadow.get_rect())
-            self.screen.surface.blit(shadow, (car_x, car_y + car_h - 6))
-
-            # Desenha o carro
-            self.screen.surface.blit(car_img_scaled, (car_x, car_y))
-
-        # Opções navegáveis com destaque
-        y_pos = 250
-        self.menu_rects = []  # Limpa e recria as áreas clicáveis
-        for idx, option in enumerate(self.menu_options):
-            is_selected = idx == self.menu_selection
-            color = (255, 240, 140) if is_selected else (240, 240, 240)
-            text = font_medium.render(option, True, color)
-
-            # Calcula posição, aplica transformação se selecionado
-            x = self.width // 2 - text.get_width() // 2
-            y = y_pos
-            
-            # Armazena a área clicável (com padding)
-            rect = pygame.Rect(x - 15, y - 7, text.get_width() + 30, text.get_height() + 14)
-            self.menu_rects.append(rect)
-            
-            if is_selected:
-                # Pula levemente e aumenta
-                scaled = int(text.get_height() * pulse)
-                # Centro preservado: desenha um highlight
-                highlight = pygame.Surface((text.get_width() + 30, text.get_height() + 14), pygame.SRCALPHA)
-                highlight.fill((30, 30, 60, 120))
-                self.screen.surface.blit(highlight, (x - 15, y - 7))
-
-            self.screen.surface.blit(text, (x, y))
-            y_pos += 60
-
-        # Instruções
-        instructions = [
-            "Use SETAS ou o MOUSE para navegar",
-            "ENTER ou clique para confirmar",
-            "Boa sorte!",
-        ]
-
-        y_pos = self.height - 90
-        for instruction in instructions:
-            text = font_small.render(instruction, True, (200, 200, 200))
-            self.screen.surface.blit(text, (self.width // 2 - text.get_width() // 2, y_pos))
-            y_pos += 22
+        # Começa a gravar a nova partida
+        if self.record_path is not None and self.replay_player is None:
+            self.recording = Replay(self.game_world.rng.seed, SIM_HZ)
 
     def check_highscore(self):
         """Verifica se a pontuação atual é um highscore"""
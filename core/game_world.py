@@ -1,13 +1,40 @@
-import pygame
-import random
+import io
+import pickle
+from functools import partial
+
 from entities.pickups.rocket_pickup import RocketPickup
 from entities.player import Player
 from entities.track import Track
 from entities.pickups.fuel import FuelPickup
-from entities.enemy_car import EnemyCar
+from entities.enemy_manager import EnemyManager
 from entities.pickups.ghost import GhostPickup
-from entities.explosion import Explosion
+from entities.pickups.effects.ghost_effect import GhostPickupEffect
+from entities.explosion import ExplosionManager
+from entities.effects.particle_system import ParticleSystem
 from entities.floating_text import FloatingText
+from core.lane_occupancy import LaneOccupancy
+from core.spawn_scheduler import SpawnScheduler
+from utils.object_pool import ObjectPool
+
+
+class _SnapshotUnpickler(pickle.Unpickler):
+    """
+    Lê snapshots sem aceitar nenhuma classe ou função.
+
+    Um snapshot só tem números, strings, tuplas, listas e dicts, então não
+    precisa de find_class. Recusar tudo impede que um replay adulterado
+    (os keyframes vêm do arquivo) execute código no restore().
+    """
+
+    def find_class(self, module, name):
+        raise pickle.UnpicklingError(f"Snapshot com objeto não permitido: {module}.{name}")
+
+
+def _load_snapshot(data):
+    try:
+        return _SnapshotUnpickler(io.BytesIO(data)).load()
+    except (pickle.UnpicklingError, EOFError, TypeError, ValueError) as error:
+        raise ValueError(f"Snapshot inválido: {error}") from error
 
 
 class GameWorld:
@@ -23,10 +50,19 @@ class GameWorld:
     - Congelar o jogo quando necessário (game over)
     """
     
-    def __init__(self, width, height, img_config):
+    def __init__(self, width, height, img_config, clock, rng):
+        """
+        Args:
+            width, height: Dimensões da tela
+            img_config: Imagens já carregadas
+            clock: GameClock com o tempo simulado (nunca o relógio real)
+            rng: RandomStreams da partida (spawns, IA dos inimigos, efeitos)
+        """
         self.width = width
         self.height = height
         self.img_config = img_config
+        self.clock = clock
+        self.rng = rng
         
         # === CONFIGURAÇÕES DAS PISTAS ===
         self.enemy_lanes = [100, 220]  # Posições X das faixas para inimigos
@@ -36,30 +72,73 @@ class GameWorld:
         # Inimigos
         self.last_spawn_time = 0  # Última vez que spawnou um inimigo
         self.spawn_delay = 1000  # Delay mínimo entre spawns (ms)
-        self.lane_cooldowns = {lane: 0 for lane in self.enemy_lanes}  # Cooldown por faixa
+        self.spawn_delay_range = (1000, 2500)  # Sorteio do delay após cada spawn (ms)
+        self.lane_cooldowns = {lane: 0 for lane in self.enemy_lanes}  # Último spawn por faixa
+        self.lane_cooldown = 2000  # Tempo mínimo entre spawns na mesma faixa (ms)
         
         # Pickups
         self.last_pickup_spawn = 0  # Último spawn de pickup genérico
         self.pickup_cooldown = 2000  # Cooldown para pickups (ms)
         self.last_fuel_spawn = 0  # Último spawn de combustível
         self.fuel_spawn_cooldown = 4000  # Cooldown específico para fuel (ms)
+        # Taxas por segundo: as chances por frame do jogo original (0.003 e
+        # 0.001) vezes os 60 frames por segundo em que ele rodava
+        self.ghost_spawn_rate = 0.18  # Fantasmas por segundo, depois do cooldown
+        self.rocket_pickup_spawn_rate = 0.06  # Bazucas por segundo
+
+        # Próximo spawn de cada tipo, por tempo simulado. Os eventos são
+        # agendados no primeiro update (depois que o headless/batch runner
+        # já trocou os parâmetros acima)
+        self.spawn_scheduler = SpawnScheduler()
+        self._spawn_handlers = {
+            "enemy": self._enemy_spawn_due,
+            "fuel": self._fuel_spawn_due,
+            "ghost": self._ghost_spawn_due,
+            "rocket_pickup": self._rocket_pickup_spawn_due,
+        }
         
         # === ELEMENTOS DO JOGO ===
         self.track = Track(self.img_config.track_img, self.height)
         self.car = Player(
-            self.img_config.car_img, self.width, self.height, x_pos=200, y_pos=500
+            self.img_config.car_img,
+            self.width,
+            self.height,
+            x_pos=200,
+            y_pos=500,
+            clock=self.clock,
+            cosmetic_rng=self.rng.cosmetic,
+            rocket_img=self.img_config.rocket_pickup_img,
         )
-        self.enemies = []  # Lista de carros inimigos
+        # O efeito fantasma também decide colisões, então faz parte do mundo
+        # (e não só do GameManager): headless e replays usam a mesma regra
+        self.car.ghost_effect = GhostPickupEffect(self.car)
+        # Carros inimigos: estado em arrays NumPy, atualizados todos de uma vez
+        # (funciona como uma lista de EnemyCar para o resto do jogo)
+        self.enemies = EnemyManager(self.enemy_lanes, self.height, self.rng.enemy_ai)
         self.fuel_pickups = []  # Lista de pickups de combustível
         self.ghost_pickups = []  # Lista de pickups de fantasma
         self.pickups = []  # Lista genérica de pickups
+        # Pickups e textos que saem do jogo são reaproveitados nos próximos
+        # spawns (sem criar sprites, rects, hitboxes e fontes a cada vez)
+        self.fuel_pool = ObjectPool(partial(FuelPickup, self.img_config.fuel_img))
+        self.ghost_pool = ObjectPool(partial(GhostPickup, self.img_config.ghost_power_img))
+        self.rocket_pickup_pool = ObjectPool(
+            partial(RocketPickup, self.img_config.rocket_pickup_img)
+        )
+        self.text_pool = ObjectPool(FloatingText)
+        # Quem ocupa cada faixa perto do topo (regras de spawn)
+        self.lane_occupancy = LaneOccupancy(self.enemies)
         
         # === SISTEMA DE EXPLOSÃO ===
-        self.explosion = Explosion(img_config)
+        self.explosions = ExplosionManager(
+            img_config, self.clock, ParticleSystem(rng=self.rng.particles)
+        )
         
         # === SISTEMA DE PONTUAÇÃO ===
         self.floating_texts = []  # Textos flutuantes (ex: "+20")
         self.distance_traveled = 0  # Distância percorrida em pixels
+        self.bonus_score = 0  # Pontos de bônus (explosões, etc)
+        self.fuel_collected = 0  # Pickups de combustível coletados (estatística)
         
         # === ESTADO DO JOGO ===
         self.frozen = False  # Se o jogo está congelado
@@ -83,18 +162,22 @@ class GameWorld:
             keys: Dicionário com estado das teclas
             dt: Delta time (tempo desde o último frame)
         """
-        # Se está congelado, apenas atualiza a explosão
+        # Guarda as posições atuais para o desenho interpolar entre os passos
+        self._save_previous_positions()
+
+        # Se está congelado, apenas atualiza as explosões
         if self.frozen:
-            self.explosion.update(dt)
+            self.explosions.update(dt)
             return
         
-        current_time = pygame.time.get_ticks()
+        current_time = self.clock.get_ticks()
         
         # Atualiza elementos base
         self._update_track_and_player(keys, dt)
-        self._spawn_and_update_enemies(dt)
-        self._spawn_and_update_pickups(dt)
-        self.explosion.update(dt)
+        self._run_due_spawns(current_time)
+        self._update_enemies(dt)
+        self._update_pickups(dt)
+        self.explosions.update(dt)
         self.car.update_ghost_power(current_time)
         
         # Atualiza distância percorrida (para pontuação)
@@ -106,33 +189,218 @@ class GameWorld:
             text.update(dt)
             if text.is_expired():
                 self.floating_texts.remove(text)
+                self.text_pool.release(text)
 
         if hasattr(self.car, "rockets"):
             for rocket in self.car.rockets[:]:
-                for enemy in self.enemies[:]:
-                    if rocket.rect.colliderect(enemy.rect):
-                        self.create_explosion(enemy.rect.center)
-                        
-                        # Cria texto flutuante de pontos
-                        self.create_floating_text(
-                            "+20", 
-                            enemy.rect.centerx, 
-                            enemy.rect.top - 10
-                        )
-                        
-                        # Adiciona pontos ao bonus_score (não ao score diretamente)
-                        if hasattr(self, "game_manager"):
-                            self.game_manager.bonus_score += 20
-                        
-                        self.enemies.remove(enemy)
-                        self.car.rockets.remove(rocket)
-                        break
+                # Só os inimigos nas células do foguete são testados
+                hits = self.enemies.colliding(rocket.rect)
+                if hits:
+                    enemy = hits[0]
+                    self.create_explosion(enemy.rect.center)
+                    
+                    # Cria texto flutuante de pontos
+                    self.create_floating_text(
+                        "+20", 
+                        enemy.rect.centerx, 
+                        enemy.rect.top - 10
+                    )
+                    
+                    # Adiciona pontos ao bonus_score (não ao score diretamente)
+                    self.bonus_score += 20
+                    
+                    self.enemies.remove(enemy)
+                    self.car.rockets.remove(rocket)
+                    self.car.rocket_pool.release(rocket)
                 # Remove foguetes que saíram da tela
-                if rocket.rect.bottom < 0:
+                elif rocket.rect.bottom < 0:
                     self.car.rockets.remove(rocket)
+                    self.car.rocket_pool.release(rocket)
+
+    def _save_previous_positions(self):
+        """Guarda a posição de cada entidade antes do passo de simulação"""
+        self.track.save_previous_position()
+        self.car.save_previous_position()
+        for rocket in self.car.rockets:
+            rocket.save_previous_position()
+        self.enemies.save_previous_positions()
+        for pickups in (self.fuel_pickups, self.ghost_pickups, self.pickups):
+            for entity in pickups:
+                entity.save_previous_position()
+        for text in self.floating_texts:
+            text.save_previous_position()
+
+    # === SNAPSHOTS ===
+
+    def snapshot(self):
+        """
+        Serializa o estado completo da simulação.
+
+        Guarda só números (posições, timers, fases de oscilação, estado dos
+        geradores aleatórios); imagens viram índices e são reconstruídas no
+        restore(). Leva uns 0,1 a 0,2 ms e ocupa uns 5 KB, então pode ser
+        chamado a cada segundo de jogo sem engasgar o quadro.
+
+        Returns:
+            bytes com o estado (para restore())
+        """
+        state = (
+            self.clock.time_ms,
+            self.rng.get_state(),
+            self.last_spawn_time,
+            self.spawn_delay,
+            self.lane_cooldowns,
+            self.last_pickup_spawn,
+            self.last_fuel_spawn,
+            self.distance_traveled,
+            self.bonus_score,
+            self.fuel_collected,
+            self.frozen,
+            self.track.get_state(),
+            self.car.get_state(),
+            [
+                (self.enemy_imgs.index(enemy.image), enemy.get_state())
+                for enemy in self.enemies
+            ],
+            [pickup.get_state() for pickup in self.fuel_pickups],
+            [pickup.get_state() for pickup in self.ghost_pickups],
+            [pickup.get_state() for pickup in self.pickups],
+            [text.get_state() for text in self.floating_texts],
+            self.explosions.get_state(),
+            self.spawn_scheduler.get_state(),
+        )
+        return pickle.dumps(state, pickle.HIGHEST_PROTOCOL)
+
+    def restore(self, data):
+        """
+        Volta o mundo (e o relógio da simulação) para um snapshot().
+
+        Args:
+            data: bytes devolvidos por snapshot()
+
+        Raises:
+            ValueError: Se data não for um snapshot (ex: keyframe de um
+                replay adulterado)
+        """
+        (
+            self.clock.time_ms,
+            rng_state,
+            self.last_spawn_time,
+            self.spawn_delay,
+            self.lane_cooldowns,
+            self.last_pickup_spawn,
+            self.last_fuel_spawn,
+            self.distance_traveled,
+            self.bonus_score,
+            self.fuel_collected,
+            self.frozen,
+            track_state,
+            car_state,
+            enemy_states,
+            fuel_states,
+            ghost_states,
+            pickup_states,
+            text_states,
+            explosion_states,
+            spawn_events,
+        ) = _load_snapshot(data)
+
+        self.rng.set_state(rng_state)
+        self.spawn_scheduler.set_state(spawn_events)
+        self.track.set_state(track_state)
+        self.car.set_state(car_state)
+        self.explosions.set_state(explosion_states)
+
+        self.enemies.clear()
+        for image_index, state in enemy_states:
+            self.enemies.add(self.enemy_imgs[image_index], state)
+        self.fuel_pickups = self._restore_pickups(
+            self.fuel_pool, self.fuel_pickups, fuel_states
+        )
+        self.ghost_pickups = self._restore_pickups(
+            self.ghost_pool, self.ghost_pickups, ghost_states
+        )
+        self.lane_occupancy.reset_pickups(self.fuel_pickups + self.ghost_pickups)
+        self.pickups = self._restore_pickups(
+            self.rocket_pickup_pool, self.pickups, pickup_states
+        )
+
+        self.text_pool.release_all(self.floating_texts)
+        self.floating_texts = []
+        for state in text_states:
+            text, x, start_y, _, _ = state
+            floating_text = self._acquire_floating_text(text, x, start_y)
+            floating_text.set_state(state)
+            self.floating_texts.append(floating_text)
+
+    def _restore_pickups(self, pool, current, states):
+        """
+        Recria uma lista de pickups salvos com get_state(), devolvendo os
+        atuais (current) para o pool antes
+        """
+        pool.release_all(current)
+        pickups = []
+        for state in states:
+            pickup = pool.acquire(state[0], self.height)
+            pickup.set_state(state)
+            pickups.append(pickup)
+        return pickups
+
+    def get_score(self):
+        """
+        Calcula a pontuação atual do mundo.
+
+        Distância é medida em pixels, convertemos para metros (dividindo por 100)
+        e cada metro vale 1 ponto, somado aos pontos de bônus.
+        """
+        distance_in_meters = int(self.distance_traveled / 100)
+        return distance_in_meters + self.bonus_score
+
+    def check_player_collision(self, current_time):
+        """
+        Procura um inimigo que colidiu com o jogador.
+
+        Usado tanto pelo GameManager quanto pelo modo headless, para que
+        as duas formas de rodar o jogo tenham exatamente a mesma regra.
+
+        Args:
+            current_time: Tempo atual em ms (para checar o poder fantasma)
+
+        Returns:
+            O inimigo atingido, ou None se não houve colisão válida
+        """
+        # Se não há inimigos, não precisa verificar colisões
+        if not self.enemies:
+            return None
+
+        # Verifica se o efeito fantasma está ativo no jogador
+        ghost_mode_active = (
+            self.car.ghost_power_active
+            and current_time < self.car.ghost_power_end_time
+        )
+
+        # Broadphase: só os inimigos nas células do jogador podem encostar
+        # nele (rect e hitbox juntos, que é o que as checagens abaixo usam)
+        area = self.car.rect
+        hitbox = getattr(self.car, "hitbox", None)
+        if hitbox is not None and hitbox.rect is not None:
+            area = area.union(hitbox.rect)
+
+        for enemy in self.enemies.nearby(area):
+            # Usa o método check_collision do efeito fantasma quando existe
+            if self.car.ghost_effect is not None:
+                collision_occurred = self.car.ghost_effect.check_collision(enemy)
+            else:
+                # Fallback: verificação de colisão normal se não houver efeito fantasma
+                collision_occurred = self.car.check_collision(enemy)
+
+            if collision_occurred and not ghost_mode_active:
+                return enemy
+
+        return None
 
     def create_explosion(self, position):
-        self.explosion.trigger(position[0], position[1], particle_count=30)
+        self.explosions.trigger(position[0], position[1], particle_count=30)
 
         # Toca o som da explosão
         if hasattr(self, "game_manager") and hasattr(
@@ -142,15 +410,18 @@ class GameWorld:
     
     def create_floating_text(self, text, x, y):
         """Cria um texto flutuante (ex: pontos ganhos)"""
-        floating_text = FloatingText(
+        self.floating_texts.append(self._acquire_floating_text(text, x, y))
+
+    def _acquire_floating_text(self, text, x, y):
+        return self.text_pool.acquire(
             text=text,
             x=x,
             y=y,
             color=(255, 215, 0),  # Dourado
             font_size=28,
-            duration=1500
+            duration=1500,
+            clock=self.clock,
         )
-        self.floating_texts.append(floating_text)
 
     def freeze_all(self):
         """Congela todos os elementos do jogo"""
@@ -203,94 +474,94 @@ class GameWorld:
         self.car.update(keys, dt)
 
     # ===== SISTEMA DE SPAWN MELHORADO =====
-    def _spawn_and_update_enemies(self, dt):
-        current_time = pygame.time.get_ticks()
+    # Cada tipo de spawn é um evento da agenda (SpawnScheduler) que vence
+    # no fim do seu cooldown. Quando vence, o handler confere as condições
+    # de espaço: se dá para spawnar, spawna e agenda o próximo; se não,
+    # tenta de novo no passo seguinte. Fantasma e bazuca têm taxa por
+    # segundo: o tempo até o próximo é sorteado (exponencial) ao agendar.
+
+    def _run_due_spawns(self, current_time):
+        """Roda os eventos de spawn vencidos (nos outros passos, nada)"""
+        scheduler = self.spawn_scheduler
+        if not scheduler:
+            self._schedule_spawns(current_time)
+        name = scheduler.pop_due(current_time)
+        while name is not None:
+            self._spawn_handlers[name](current_time)
+            name = scheduler.pop_due(current_time)
+
+    def _schedule_spawns(self, current_time):
+        """Agenda o primeiro evento de cada tipo (começo da partida)"""
+        scheduler = self.spawn_scheduler
+        scheduler.schedule_after("enemy", self.last_spawn_time, self.spawn_delay)
+        scheduler.schedule_after(
+            "fuel", self.last_fuel_spawn, self.fuel_spawn_cooldown * 0.6
+        )
+        scheduler.schedule_after(
+            "ghost",
+            self.last_pickup_spawn,
+            self.pickup_cooldown * 1.5 + self._random_wait(self.ghost_spawn_rate),
+        )
+        scheduler.schedule(
+            "rocket_pickup",
+            current_time + self._random_wait(self.rocket_pickup_spawn_rate),
+        )
 
-        # Verifica se é hora de spawnar e se há espaço suficiente
-        if current_time - self.last_spawn_time > self.spawn_delay and (
-            len(self.enemies) == 0 or self.enemies[-1].rect.y > 150
-        ):
+    def _random_wait(self, rate):
+        """Tempo (ms) até o próximo evento de um processo com rate eventos por segundo"""
+        return self.rng.spawn.expovariate(rate) * 1000
+
+    def _retry_spawn_next_step(self, name, current_time):
+        # O relógio anda em ms inteiros: vence no próximo passo
+        self.spawn_scheduler.schedule(name, current_time + 1)
+
+    def _enemy_spawn_due(self, current_time):
+        # Verifica se há espaço suficiente
+        if len(self.enemies) == 0 or self.enemies[-1].rect.y > 150:
             # NOVA VERIFICAÇÃO: Verifica se não está criando um bloqueio total
             if not self._would_create_blockage():
                 self.spawn_enemy()
                 self.last_spawn_time = current_time
-                self.spawn_delay = random.randint(1000, 2500)  # Intervalo mais controlado
-
-        # Atualiza inimigos existentes (passando a posição do player e outros inimigos)
-        for enemy in self.enemies[:]:
-            enemy.update(self.car.rect, self.enemies, dt)  # Passa a posição do player e lista de inimigos
-            if enemy.off_screen(self.height):
-                self.enemies.remove(enemy)
+                self.spawn_delay = self.rng.spawn.randint(*self.spawn_delay_range)  # Intervalo mais controlado
+                self.spawn_scheduler.schedule_after("enemy", current_time, self.spawn_delay)
+                return
+        self._retry_spawn_next_step("enemy", current_time)
+
+    def _update_enemies(self, dt):
+        # Atualiza todos os inimigos de uma vez (o manager também remove
+        # os que saíram da tela)
+        self.enemies.update(self.car.rect, dt)
     
     def _would_create_blockage(self):
         """Verifica se spawnar um novo inimigo criaria um bloqueio total para o player"""
-        # Verifica se há inimigos muito próximos um do outro formando uma "parede"
-        # que bloquearia completamente a passagem do player
-        
-        # Agrupa inimigos por faixas de Y (altura similar = possível bloqueio)
-        y_ranges = []
-        blockage_threshold = 100  # Distância Y que considera como "mesma linha"
-        
-        for enemy in self.enemies:
-            # Só considera inimigos que estão visíveis e à frente do player
-            if 0 < enemy.rect.y < self.height and enemy.rect.y < self.car.rect.y + 200:
-                # Verifica se já existe um range Y similar
-                found_range = False
-                for y_range in y_ranges:
-                    if abs(y_range['y'] - enemy.rect.y) < blockage_threshold:
-                        y_range['lanes'].add(enemy.rect.x)
-                        found_range = True
-                        break
-                
-                if not found_range:
-                    y_ranges.append({'y': enemy.rect.y, 'lanes': {enemy.rect.x}})
-        
-        # Verifica se alguma "linha" de inimigos ocupa todas as faixas
-        for y_range in y_ranges:
-            if len(y_range['lanes']) >= len(self.enemy_lanes):
-                # Todas as faixas ocupadas nessa altura = bloqueio total
-                return True
-        
-        return False
+        # Inimigos muito próximos um do outro formando uma "parede" que
+        # bloquearia completamente a passagem do player. Só considera
+        # inimigos visíveis e à frente do player
+        return self.lane_occupancy.would_block(
+            len(self.enemy_lanes), min(self.height, self.car.rect.y + 200)
+        )
 
     def spawn_enemy(self):
-        now = pygame.time.get_ticks()
+        now = self.clock.get_ticks()
+
+        # Faixas fora do cooldown e sem inimigos na área superior. Se todas
+        # estão ocupadas, não spawna nada: o player sempre tem por onde passar
         available_lanes = [
             lane
             for lane in self.enemy_lanes
-            if now - self.lane_cooldowns[lane] > 2000  # 2s de cooldown por pista
+            if now - self.lane_cooldowns[lane] > self.lane_cooldown
+            and self.lane_occupancy.lane_free(lane, 250)
         ]
 
-        # Verifica pistas ocupadas por inimigos próximos
-        occupied_lanes = []
-        for enemy in self.enemies:
-            if enemy.rect.y < 250:  # Verifica inimigos na área superior
-                if enemy.rect.x in available_lanes and enemy.rect.x not in occupied_lanes:
-                    occupied_lanes.append(enemy.rect.x)
-
-        # Remove pistas ocupadas das disponíveis
-        for lane in occupied_lanes:
-            if lane in available_lanes:
-                available_lanes.remove(lane)
-        
-        # NOVA VERIFICAÇÃO: Garante que sempre haverá pelo menos UMA faixa livre
-        # Se todas as faixas foram ocupadas recentemente, não spawna nada
-        # Isso garante que o player sempre terá espaço para passar
-        if len(occupied_lanes) >= len(self.enemy_lanes):
-            # Todas as faixas estão ocupadas, não spawna para deixar espaço
-            return
-        
         if available_lanes:
-            lane = random.choice(available_lanes)
-            enemy_img = random.choice(self.enemy_imgs)
-            self.enemies.append(EnemyCar(enemy_img, lane, self.height))
+            lane = self.rng.spawn.choice(available_lanes)
+            enemy_img = self.rng.spawn.choice(self.enemy_imgs)
+            self.enemies.spawn(enemy_img, lane)
             self.lane_cooldowns[lane] = now  # Atualiza cooldown da pista
 
-    def _spawn_and_update_pickups(self, dt):
-        current_time = pygame.time.get_ticks()
-
+    def _fuel_spawn_due(self, current_time):
         # Spawn de fuel - SISTEMA MELHORADO E CONTROLADO
-        # Spawn automático se:
+        # O evento vence com 60% do cooldown. Spawn automático se:
         # 1. Passou o cooldown
         # 2. Não há fuel na tela OU o último está longe o suficiente
         # 3. O combustível do player está abaixo de 60% (prioridade) OU passou tempo suficiente
@@ -308,15 +579,41 @@ class GameWorld:
         if should_spawn_fuel:
             self._spawn_fuel_pickup()
             self.last_fuel_spawn = current_time
+            self.spawn_scheduler.schedule_after(
+                "fuel", current_time, self.fuel_spawn_cooldown * 0.6
+            )
+        else:
+            self._retry_spawn_next_step("fuel", current_time)
 
-        # Spawn de ghost - menos frequente que fuel
-        if (
-            current_time - self.last_pickup_spawn > self.pickup_cooldown * 1.5
-            and random.random() < 0.003
-            and (len(self.ghost_pickups) == 0 or self.ghost_pickups[-1].rect.y > 250)
-        ):
+    def _ghost_spawn_due(self, current_time):
+        # Spawn de ghost - menos frequente que fuel (cooldown maior e
+        # ghost_spawn_rate por segundo depois dele)
+        if len(self.ghost_pickups) == 0 or self.ghost_pickups[-1].rect.y > 250:
             self._spawn_ghost_pickup()
             self.last_pickup_spawn = current_time
+            self.spawn_scheduler.schedule_after(
+                "ghost",
+                current_time,
+                self.pickup_cooldown * 1.5 + self._random_wait(self.ghost_spawn_rate),
+            )
+        else:
+            # Faixa ocupada: perde a vez e sorteia a próxima
+            self.spawn_scheduler.schedule(
+                "ghost", current_time + self._random_wait(self.ghost_spawn_rate)
+            )
+
+    def _rocket_pickup_spawn_due(self, current_time):
+        # Spawn da bazuca (só uma na tela por vez)
+        if not any(isinstance(p, RocketPickup) for p in self.pickups):
+            lane = self.rng.spawn.choice(self.road_lanes)
+            self.pickups.append(self.rocket_pickup_pool.acquire(lane, self.height))
+        self.spawn_scheduler.schedule(
+            "rocket_pickup",
+            current_time + self._random_wait(self.rocket_pickup_spawn_rate),
+        )
+
+    def _update_pickups(self, dt):
+        current_time = self.clock.get_ticks()
 
         # Atualiza fuel pickups
         for fuel in self.fuel_pickups[:]:
@@ -325,9 +622,14 @@ class GameWorld:
                 if hasattr(self, "game_manager"):
                     self.game_manager.fuel_pickup_sound.play()
                 self.car.fuel = min(self.car.max_fuel, self.car.fuel + 25)  # Aumentado de 20 para 25
+                self.fuel_collected += 1
                 self.fuel_pickups.remove(fuel)
+                self.lane_occupancy.remove_pickup(fuel)
+                self.fuel_pool.release(fuel)
             elif fuel.off_screen(self.height):
                 self.fuel_pickups.remove(fuel)
+                self.lane_occupancy.remove_pickup(fuel)
+                self.fuel_pool.release(fuel)
 
         # Atualiza ghost pickups
         for ghost in self.ghost_pickups[:]:
@@ -335,90 +637,86 @@ class GameWorld:
             if ghost.check_collision(self.car):
                 if hasattr(self, "game_manager"):
                     self.game_manager.ghost_pickup_sound.play()
-                current_time = pygame.time.get_ticks()
                 self.car.activate_ghost_power(current_time)   # <-- ATIVA o poder
                 self.ghost_pickups.remove(ghost)
+                self.lane_occupancy.remove_pickup(ghost)
+                self.ghost_pool.release(ghost)
             elif ghost.off_screen(self.height):
                 self.ghost_pickups.remove(ghost)
-
-
-        # Spawn da bazuca
-        if (
-            random.random() < 0.001
-            and len([p for p in self.pickups if isinstance(p, RocketPickup)]) == 0
-        ):
-            lane = random.choice(self.road_lanes)
-            self.pickups.append(
-                RocketPickup(self.img_config.rocket_pickup_img, lane, self.height)
-            )
+                self.lane_occupancy.remove_pickup(ghost)
+                self.ghost_pool.release(ghost)
 
         # Atualiza rocket pickups
         for pickup in self.pickups[:]:
-            pickup.update()
+            pickup.update(dt)
             if pickup.off_screen(self.height):
                 self.pickups.remove(pickup)
+                self.rocket_pickup_pool.release(pickup)
             elif pickup.check_collision(self.car):
                 if isinstance(pickup, RocketPickup):
                     if hasattr(self, "game_manager"):
                         self.game_manager.rocket_pickup_sound.play()
                         self.game_manager.rocket_sound.play()
-                    current_time = pygame.time.get_ticks()
                     self.car.activate_rocket_power(current_time)
                 self.pickups.remove(pickup)
+                self.rocket_pickup_pool.release(pickup)
 
     def _spawn_fuel_pickup(self):
         """Spawn de fuel pickup com lógica melhorada para facilitar coleta"""
-        available_lanes = self.enemy_lanes.copy()
-
         # Verificação suave - permite spawn mesmo com objetos próximos
-        for obj in self.enemies + self.fuel_pickups + self.ghost_pickups:
-            if obj.rect.y < 100 and obj.rect.x in available_lanes:  # Mais permissivo
-                available_lanes.remove(obj.rect.x)
+        available_lanes = self.lane_occupancy.free_lanes(
+            self.enemy_lanes, 100, include_pickups=True
+        )
 
         # Se não há faixas disponíveis, força o spawn em uma faixa aleatória
         # (garante que sempre terá fuel disponível)
         if not available_lanes:
             available_lanes = self.enemy_lanes.copy()
 
-        lane = random.choice(available_lanes)
-        self.fuel_pickups.append(
-            FuelPickup(self.img_config.fuel_img, lane, self.height)
-        )
+        lane = self.rng.spawn.choice(available_lanes)
+        fuel = self.fuel_pool.acquire(lane, self.height)
+        self.fuel_pickups.append(fuel)
+        self.lane_occupancy.add_pickup(fuel)
 
     def _spawn_ghost_pickup(self):
-        available_lanes = self.road_lanes.copy()
-
         # Verificação ainda mais rigorosa para ghost pickups
-        for obj in self.enemies + self.fuel_pickups + self.ghost_pickups:
-            if obj.rect.y < 350 and obj.rect.x in available_lanes:
-                available_lanes.remove(obj.rect.x)
+        available_lanes = self.lane_occupancy.free_lanes(
+            self.road_lanes, 350, include_pickups=True
+        )
 
         if available_lanes:
-            lane = random.choice(available_lanes)
-            self.ghost_pickups.append(
-                GhostPickup(self.img_config.ghost_power_img, lane, self.height)
-            )
+            lane = self.rng.spawn.choice(available_lanes)
+            ghost = self.ghost_pool.acquire(lane, self.height)
+            self.ghost_pickups.append(ghost)
+            self.lane_occupancy.add_pickup(ghost)
 
     # ===== FIM DO SISTEMA DE SPAWN =====
 
-    def draw(self, surface):
-        self.track.draw(surface)
+    def draw(self, surface, alpha=1.0):
+        """
+        Desenha o mundo.
+
+        Args:
+            surface: Superfície de destino
+            alpha: Fração do próximo passo de simulação já decorrida (0 a 1),
+                usada para interpolar as posições entre os dois últimos passos
+        """
+        self.track.draw(surface, alpha)
 
         # Desenha todos os elementos (mesmo congelados)
-        for enemy in self.enemies:
-            enemy.draw(surface)
+        self.enemies.draw(surface, alpha)
         for fuel in self.fuel_pickups:
-            fuel.draw(surface)
+            fuel.draw(surface, alpha)
         for ghost in self.ghost_pickups:
-            ghost.draw(surface)
+            ghost.draw(surface, alpha)
         for pickup in self.pickups:
-            pickup.draw(surface)
+            pickup.draw(surface, alpha)
 
         # Carro por último (sobre a explosão)
-        self.car.draw(surface)
-        # Explosão sobre os elementos
-        self.explosion.draw(surface)
+        self.car.draw(surface, alpha)
+        # Explosões sobre os elementos
+        self.explosions.draw(surface)
         
         # Textos flutuantes por último (sempre visíveis)
         for text in self.floating_texts:
-            text.draw(surface)
+            text.draw(surface, alpha)
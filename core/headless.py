@@ -0,0 +1,210 @@
+import os
+import time
+
+import pygame
+
+from config.constants import WIDTH, HEIGHT, SIM_HZ
+from core.game_clock import GameClock
+from core.game_world import GameWorld
+from core.policies import IdlePolicy
+from core.random_streams import RandomStreams
+from core.replay import ReplayPlayer
+from img.img_config import ImgConfig
+
+
+def setup_headless_drivers():
+    """
+    Configura o SDL para rodar sem janela e sem placa de som.
+
+    Precisa ser chamado ANTES de pygame.init(), pois o SDL lê essas
+    variáveis de ambiente apenas na inicialização.
+    """
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+
+class HeadlessRunner:
+    """
+    Roda o GameWorld sem janela, sem desenho, sem HUD e sem som.
+
+    Responsabilidades:
+    - Inicializar o pygame com os drivers "dummy" do SDL
+    - Avançar o GameWorld e o GameClock com um dt sintético (não espera o relógio real)
+    - Aplicar as mesmas regras de game over do GameManager (colisão e combustível)
+    - Medir quantos frames por segundo foram simulados
+
+    Como não existe clock.tick() nem _render(), uma partida de 10 minutos
+    simulados termina em poucos segundos de tempo real.
+    """
+
+    def __init__(
+        self, width=WIDTH, height=HEIGHT, dt=1 / SIM_HZ, policy=None, seed=None, params=None
+    ):
+        """
+        Args:
+            width, height: Dimensões do mundo (iguais às da janela do jogo)
+            dt: Passo fixo da simulação (segundos), o mesmo do jogo com janela
+            policy: Função que recebe o GameWorld e devolve o estado das teclas
+            seed: Semente da partida (None = sorteia uma nova a cada reset)
+            params: Atributos do GameWorld a sobrescrever em cada partida
+                (ex: {"fuel_spawn_cooldown": 3000}), para testes de balanceamento
+        """
+        setup_headless_drivers()
+        pygame.init()
+
+        # convert()/convert_alpha() do ImgConfig exigem um modo de vídeo,
+        # mesmo que seja o driver "dummy" (nada é mostrado na tela)
+        pygame.display.set_mode((width, height))
+
+        self.width = width
+        self.height = height
+        self.dt = dt
+        self.policy = policy or IdlePolicy()
+        self.seed = seed
+        self.params = params or {}
+        self.img_config = ImgConfig(width, height)
+        self.reset()
+
+    def reset(self):
+        """Cria um mundo novo (equivalente a reiniciar a partida)"""
+        # Sem game_manager no mundo: nenhum som é tocado
+        self.game_clock = GameClock()
+        self.game_world = GameWorld(
+            self.width,
+            self.height,
+            self.img_config,
+            self.game_clock,
+            RandomStreams(self.seed),
+        )
+        for name, value in self.params.items():
+            if not hasattr(self.game_world, name):
+                raise ValueError(f"GameWorld não tem o parâmetro {name!r}")
+            setattr(self.game_world, name, value)
+        self.steps = 0
+        self.game_over = False
+
+    def step(self, keys=None):
+        """
+        Avança a simulação em um passo de dt.
+
+        Args:
+            keys: Estado das teclas; se None, consulta a política de entrada
+        """
+        if self.game_over:
+            return
+
+        if keys is None:
+            keys = self.policy(self.game_world)
+
+        self.game_clock.step(self.dt)
+        self.game_world.update(keys, self.dt)
+        self.steps += 1
+        self._check_game_conditions()
+
+    def seek(self, replay_player, step):
+        """
+        Leva a simulação de um replay até um passo.
+
+        Restaura o keyframe mais próximo antes do passo e simula só o
+        restante, em vez de refazer a partida desde o início.
+
+        Args:
+            replay_player: ReplayPlayer que alimenta esta simulação
+            step: Passo de destino
+        """
+        self.reset()
+        keyframe = replay_player.replay.nearest_keyframe(step)
+        if keyframe is not None:
+            self.steps, snapshot = keyframe
+            self.game_world.restore(snapshot)
+
+        replay_player.seek(self.steps)
+        while not self.game_over and self.steps < step:
+            self.step(replay_player.next_keys())
+
+    def _check_game_conditions(self):
+        """Mesmas condições de fim de jogo usadas pelo GameManager"""
+        current_time = self.game_clock.get_ticks()
+        collided = self.game_world.check_player_collision(current_time) is not None
+        out_of_fuel = self.game_world.car.fuel <= 0
+
+        if collided or out_of_fuel:
+            self.game_world.freeze_all()
+            self.game_over = True
+
+    def run(self, duration):
+        """
+        Simula até o game over ou até atingir a duração pedida.
+
+        Args:
+            duration: Tempo máximo de jogo simulado (segundos)
+
+        Returns:
+            Dicionário com o resumo da sessão
+        """
+        return self.run_steps(int(duration / self.dt))
+
+    def run_steps(self, max_steps):
+        """
+        Simula até o game over ou até completar max_steps passos.
+
+        Args:
+            max_steps: Número máximo de passos de simulação
+
+        Returns:
+            Dicionário com o resumo da sessão
+        """
+        start = time.perf_counter()
+
+        while not self.game_over and self.steps < max_steps:
+            self.step()
+
+        wall_time = time.perf_counter() - start
+        return self.summary(wall_time)
+
+    def summary(self, wall_time):
+        """Monta o relatório da sessão"""
+        sim_time = self.steps * self.dt
+        return {
+            "seed": self.game_world.rng.seed,
+            "steps": self.steps,
+            "sim_time": sim_time,
+            "wall_time": wall_time,
+            "sim_fps": self.steps / wall_time if wall_time > 0 else 0.0,
+            "speedup": sim_time / wall_time if wall_time > 0 else 0.0,
+            "score": self.game_world.get_score(),
+            "fuel_collected": self.game_world.fuel_collected,
+            "game_over": self.game_over,
+        }
+
+
+def run_replay(replay, start_step=0):
+    """
+    Reproduz um replay sem janela, na velocidade máxima da CPU.
+
+    Args:
+        replay: Replay carregado com Replay.load()
+        start_step: Passo onde a reprodução começa (usa os keyframes para chegar lá)
+
+    Returns:
+        Dicionário com o resumo da sessão (mesmo formato de run())
+    """
+    player = ReplayPlayer(replay)
+    runner = HeadlessRunner(dt=1 / replay.sim_hz, policy=player.policy, seed=replay.seed)
+    if start_step:
+        runner.seek(player, start_step)
+    return runner.run_steps(replay.steps)
+
+
+def print_summary(summary):
+    """Mostra o relatório da sessão headless no terminal"""
+    print("=== Simulação headless ===")
+    print(f"Semente:          {summary['seed']}")
+    print(f"Passos simulados: {summary['steps']}")
+    print(f"Tempo simulado:   {summary['sim_time']:.1f}s")
+    print(f"Tempo real:       {summary['wall_time']:.2f}s")
+    print(f"FPS simulados:    {summary['sim_fps']:.0f}")
+    print(f"Aceleração:       {summary['speedup']:.1f}x")
+    print(f"Pontuação:        {summary['score']}")
+    print(f"Combustíveis:     {summary['fuel_collected']}")
+    print(f"Game over:        {'sim' if summary['game_over'] else 'não'}")
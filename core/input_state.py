@@ -0,0 +1,57 @@
+from collections import defaultdict
+
+import pygame
+
+
+# Teclas que o jogo realmente lê durante a partida (Player.update)
+TRACKED_KEYS = (
+    pygame.K_LEFT,
+    pygame.K_RIGHT,
+    pygame.K_UP,
+    pygame.K_DOWN,
+    pygame.K_SPACE,
+)
+
+
+def make_keys(pressed=()):
+    """
+    Cria um estado de teclas compatível com pygame.key.get_pressed().
+
+    O Player acessa as teclas como keys[pygame.K_LEFT]. Um defaultdict
+    devolve False para qualquer tecla não pressionada, então serve como
+    substituto quando não existe teclado (modo headless, simulações).
+
+    Args:
+        pressed: Teclas que devem aparecer como pressionadas
+    """
+    keys = defaultdict(bool)
+    for key in pressed:
+        keys[key] = True
+    return keys
+
+
+def keys_to_mask(keys):
+    """
+    Compacta o estado das teclas em um inteiro (um bit por tecla).
+
+    Só as TRACKED_KEYS entram na máscara: são as únicas que mudam o
+    resultado da simulação. Bit 0 = K_LEFT, bit 1 = K_RIGHT, e assim por diante.
+
+    Args:
+        keys: Estado das teclas (pygame.key.get_pressed(), make_keys() ou {})
+
+    Returns:
+        Máscara de bits (0 = nenhuma tecla pressionada)
+    """
+    if not keys:
+        return 0
+    mask = 0
+    for bit, key in enumerate(TRACKED_KEYS):
+        if keys[key]:
+            mask |= 1 << bit
+    return mask
+
+
+def mask_to_keys(mask):
+    """Operação inversa de keys_to_mask: recria o estado das teclas"""
+    return make_keys(key for bit, key in enumerate(TRACKED_KEYS) if mask & (1 << bit))
@@ -0,0 +1,90 @@
+class LaneOccupancy:
+    """
+    Ocupação das faixas perto do topo da tela, para as regras de spawn.
+
+    Responde às perguntas que o GameWorld faz antes de criar um inimigo ou
+    um pickup, sem juntar listas nem reconstruir a ocupação do zero:
+    - A faixa X está livre acima de y?
+    - Quais faixas estão livres (na ordem da lista de faixas)?
+    - Um novo inimigo formaria uma "parede" em todas as faixas?
+
+    Inimigos: usa as filas por faixa do EnemyManager (ordenadas por y e
+    atualizadas quando um carro aparece, troca de faixa ou sai do jogo).
+    Pickups de combustível e fantasma: uma lista por faixa, atualizada pelo
+    GameWorld quando o pickup aparece e quando some (coletado ou fora da
+    tela). Pickups não mudam de faixa.
+
+    As respostas são as mesmas das verificações antigas (uma faixa está
+    ocupada quando o rect.x do objeto é exatamente a posição dela), então
+    os spawns de uma semente não mudam.
+    """
+
+    BLOCKAGE_THRESHOLD = 100  # Distância Y que considera como "mesma linha"
+
+    def __init__(self, enemies):
+        """
+        Args:
+            enemies: EnemyManager do mundo
+        """
+        self.enemies = enemies
+        self.pickups_by_lane = {}  # rect.x -> pickups nessa faixa
+
+    # === PICKUPS ===
+
+    def add_pickup(self, pickup):
+        self.pickups_by_lane.setdefault(pickup.rect.x, []).append(pickup)
+
+    def remove_pickup(self, pickup):
+        self.pickups_by_lane[pickup.rect.x].remove(pickup)
+
+    def reset_pickups(self, pickups):
+        """Recomeça a partir de uma lista de pickups (ex: snapshot restaurado)"""
+        self.pickups_by_lane = {}
+        for pickup in pickups:
+            self.add_pickup(pickup)
+
+    # === CONSULTAS ===
+
+    def lane_free(self, lane, above_y, include_pickups=False):
+        """
+        Nenhum objeto na faixa acima de above_y (rect.y < above_y)?
+
+        Args:
+            lane: Posição X da faixa
+            above_y: Altura limite
+            include_pickups: Também conta pickups de combustível e fantasma
+        """
+        if include_pickups:
+            for pickup in self.pickups_by_lane.get(lane, ()):
+                if pickup.rect.y < above_y:
+                    return False
+        return not self.enemies.lane_taken(lane, above_y)
+
+    def free_lanes(self, lanes, above_y, include_pickups=False):
+        """Faixas livres acima de above_y, na ordem de lanes"""
+        return [lane for lane in lanes if self.lane_free(lane, above_y, include_pickups)]
+
+    def would_block(self, lane_count, bottom):
+        """
+        Os inimigos visíveis já formam uma linha que ocupa todas as faixas?
+
+        Agrupa os inimigos entre o topo da tela e bottom por altura
+        parecida (BLOCKAGE_THRESHOLD), na ordem da lista de inimigos, e
+        conta as posições X de cada grupo.
+
+        Args:
+            lane_count: Número de faixas
+            bottom: Só considera inimigos com rect.y < bottom
+        """
+        y_ranges = []
+        for enemy in self.enemies.visible(0, bottom):
+            # Verifica se já existe um range Y similar
+            for y_range in y_ranges:
+                if abs(y_range[0] - enemy.rect.y) < self.BLOCKAGE_THRESHOLD:
+                    y_range[1].add(enemy.rect.x)
+                    break
+            else:
+                y_ranges.append((enemy.rect.y, {enemy.rect.x}))
+
+        # Todas as faixas ocupadas na mesma altura = bloqueio total
+        return any(len(lanes) >= lane_count for _, lanes in y_ranges)
@@ -0,0 +1,112 @@
+import random
+
+import pygame
+
+from core.input_state import make_keys
+
+
+class IdlePolicy:
+    """O jogador não aperta nenhuma tecla (mede só o tráfego)"""
+
+    def __init__(self, seed=None):
+        pass
+
+    def __call__(self, world):
+        return make_keys()
+
+
+class RandomPolicy:
+    """
+    Aperta combinações aleatórias de teclas, segurando cada uma por um tempo.
+
+    Trocar de tecla a cada passo deixaria o carro tremendo no lugar; segurar
+    por 10 a 60 passos parece mais com um jogador (ruim) de verdade.
+    """
+
+    MOVES = (
+        (),
+        (pygame.K_LEFT,),
+        (pygame.K_RIGHT,),
+        (pygame.K_UP,),
+        (pygame.K_DOWN,),
+        (pygame.K_LEFT, pygame.K_SPACE),
+        (pygame.K_RIGHT, pygame.K_SPACE),
+    )
+
+    def __init__(self, seed=None):
+        """
+        Args:
+            seed: Semente da partida (a política tem seu próprio gerador,
+                separado dos streams do jogo)
+        """
+        self.rng = random.Random(f"{seed}:policy")
+        self.keys = make_keys()
+        self.hold_steps = 0
+
+    def __call__(self, world):
+        if self.hold_steps <= 0:
+            self.keys = make_keys(self.rng.choice(self.MOVES))
+            self.hold_steps = self.rng.randint(10, 60)
+        self.hold_steps -= 1
+        return self.keys
+
+
+class DodgePolicy:
+    """
+    Jogador "scriptado" simples:
+    - Foge para a outra faixa quando há um inimigo logo à frente
+    - Vai atrás do combustível quando o tanque está abaixo de 70%
+    - Atira sempre que tem a bazuca
+    """
+
+    DANGER_DISTANCE = 250  # Distância (px) em que um inimigo à frente vira ameaça
+    LOW_FUEL = 70
+
+    def __init__(self, seed=None):
+        pass
+
+    def __call__(self, world):
+        car = world.car
+        pressed = []
+
+        target_x = self._target_x(world)
+        if target_x is not None:
+            if target_x < car.rect.centerx - 5:
+                pressed.append(pygame.K_LEFT)
+            elif target_x > car.rect.centerx + 5:
+                pressed.append(pygame.K_RIGHT)
+
+        if car.has_rocket:
+            pressed.append(pygame.K_SPACE)
+
+        return make_keys(pressed)
+
+    def _target_x(self, world):
+        """Centro (x) para onde o carro deve ir, ou None para ficar parado"""
+        car = world.car
+
+        threat = None
+        for enemy in world.enemies:
+            ahead = car.rect.top - enemy.rect.bottom
+            same_lane = abs(enemy.rect.centerx - car.rect.centerx) < car.rect.width
+            if same_lane and -car.rect.height < ahead < self.DANGER_DISTANCE:
+                threat = enemy
+                break
+
+        if threat is not None:
+            # Vai para a faixa mais distante do inimigo
+            lanes = [lane + threat.rect.width // 2 for lane in world.enemy_lanes]
+            return max(lanes, key=lambda x: abs(x - threat.rect.centerx))
+
+        if car.fuel < self.LOW_FUEL and world.fuel_pickups:
+            return world.fuel_pickups[0].rect.centerx
+
+        return None
+
+
+# Políticas disponíveis por nome (usado pela linha de comando do batch runner)
+POLICIES = {
+    "idle": IdlePolicy,
+    "random": RandomPolicy,
+    "dodge": DodgePolicy,
+}
@@ -0,0 +1,63 @@
+import random
+from array import array
+
+import numpy as np
+
+
+class RandomStreams:
+    """
+    Geradores aleatórios com semente, um para cada subsistema do jogo.
+
+    Streams:
+    - spawn: quando e onde criar inimigos e pickups
+    - enemy_ai: velocidade, padrão de movimento e troca de faixa dos inimigos
+    - cosmetic: efeitos só visuais (GIFs laterais, rastro dos foguetes)
+    - particles: partículas das explosões (numpy.random.Generator, para
+      sortear todas as partículas de uma explosão de uma vez)
+
+    Por que separar? Se tudo usasse o mesmo gerador, uma partícula a mais
+    no rastro de um foguete mudaria a sequência de números e, com ela, todo
+    o tráfego dali em diante. Com streams independentes, a mesma semente
+    sempre gera o mesmo tráfego, mesmo que os efeitos visuais mudem.
+    """
+
+    # Streams que mudam o resultado da simulação (entram nos snapshots).
+    # "cosmetic" e "particles" ficam de fora: só alteram efeitos visuais.
+    SIMULATION_STREAMS = ("spawn", "enemy_ai")
+
+    def __init__(self, seed=None):
+        """
+        Args:
+            seed: Semente da partida (int). Se None, sorteia uma e guarda
+                em self.seed para que a partida possa ser reproduzida.
+        """
+        if seed is None:
+            seed = random.randrange(2**32)
+        self.seed = seed
+
+        # Cada stream recebe uma semente derivada do nome (sementes em str
+        # são convertidas de forma estável entre versões do Python)
+        self.spawn = random.Random(f"{seed}:spawn")
+        self.enemy_ai = random.Random(f"{seed}:enemy_ai")
+        self.cosmetic = random.Random(f"{seed}:cosmetic")
+        self.particles = np.random.default_rng(
+            random.Random(f"{seed}:particles").getrandbits(128)
+        )
+
+    def get_state(self):
+        """
+        Estado dos streams da simulação, para snapshots.
+
+        O estado do Mersenne Twister tem 625 inteiros de 32 bits; guardados
+        como array binário ocupam 2,5 KB (um pickle da tupla ocupa ~40% a mais).
+        """
+        states = []
+        for name in self.SIMULATION_STREAMS:
+            version, internal, gauss = getattr(self, name).getstate()
+            states.append((version, array("I", internal).tobytes(), gauss))
+        return states
+
+    def set_state(self, states):
+        """Restaura o que foi salvo com get_state()"""
+        for name, (version, internal, gauss) in zip(self.SIMULATION_STREAMS, states):
+            getattr(self, name).setstate((version, tuple(array("I", internal)), gauss))
@@ -0,0 +1,223 @@
+import bisect
+import json
+import struct
+import zlib
+
+from config.constants import SIM_HZ
+from core.input_state import keys_to_mask, mask_to_keys
+
+
+# Formato do arquivo de replay:
+#   4 bytes   assinatura (REPLAY_MAGIC)
+#   4 bytes   tamanho do cabeçalho JSON (uint32, little-endian)
+#   N bytes   cabeçalho JSON (versão, semente, sim_hz, passos, keyframes)
+#   4 bytes   tamanho do bloco de teclas (uint32)
+#   M bytes   corridas de teclas comprimidas com zlib
+#   resto     keyframes comprimidos com zlib
+#
+# Cada corrida é (máscara, repetições): um jogador segura a mesma tecla por
+# dezenas de passos, então 10 minutos de jogo cabem em poucos KB.
+#
+# Keyframes são snapshots do GameWorld (GameWorld.snapshot) tirados a cada
+# keyframe_interval passos. Para pular para o minuto 9, restaura o keyframe
+# mais próximo e simula só o que falta, em vez de refazer tudo desde o início.
+# Na memória cada keyframe fica sem compressão (rápido de tirar); no arquivo
+# todos são comprimidos juntos, e o zlib aproveita o que se repete entre um
+# keyframe e o seguinte (estado dos geradores aleatórios, pista, etc).
+REPLAY_MAGIC = b"CRPL"
+REPLAY_VERSION = 4
+MAX_REPLAY_SPEED = 16
+
+_HEADER_SIZE = struct.Struct("<I")
+_RUN = struct.Struct("<BI")  # máscara (uint8), repetições (uint32)
+_KEYFRAME = struct.Struct("<II")  # passo, tamanho do snapshot
+
+
+class Replay:
+    """
+    Gravação das teclas de uma partida, um estado por passo fixo.
+
+    Com a mesma semente (RandomStreams) e o mesmo passo fixo (SIM_HZ), as
+    mesmas teclas produzem exatamente a mesma partida. Por isso basta gravar
+    as teclas: todo o resto (tráfego, pickups, colisões) é recalculado.
+    """
+
+    def __init__(self, seed, sim_hz=SIM_HZ, keyframe_interval=None):
+        """
+        Args:
+            seed: Semente da partida gravada
+            sim_hz: Frequência da simulação usada na gravação
+            keyframe_interval: Passos entre keyframes (None = um por segundo)
+        """
+        self.seed = seed
+        self.sim_hz = sim_hz
+        self.keyframe_interval = keyframe_interval or sim_hz
+        self.runs = []  # Lista de [máscara, repetições]
+        self.steps = 0  # Total de passos gravados
+        self.keyframes = []  # Lista de (passo, snapshot), em ordem de passo
+        self.keyframe_steps = []  # Só os passos dos keyframes (para o bisect)
+
+    def record(self, keys):
+        """
+        Grava o estado das teclas de um passo de simulação.
+
+        Args:
+            keys: As mesmas teclas passadas para GameWorld.update()
+        """
+        mask = keys_to_mask(keys)
+        if self.runs and self.runs[-1][0] == mask:
+            self.runs[-1][1] += 1
+        else:
+            self.runs.append([mask, 1])
+        self.steps += 1
+
+    # === KEYFRAMES ===
+
+    def wants_keyframe(self):
+        """Se está na hora de guardar um keyframe (depois do passo atual)"""
+        return self.steps > 0 and self.steps % self.keyframe_interval == 0
+
+    def add_keyframe(self, snapshot):
+        """
+        Guarda o estado do mundo depois dos passos já gravados.
+
+        Args:
+            snapshot: bytes de GameWorld.snapshot()
+        """
+        self.keyframes.append((self.steps, snapshot))
+        self.keyframe_steps.append(self.steps)
+
+    def nearest_keyframe(self, step):
+        """
+        Procura o último keyframe antes (ou exatamente em) um passo.
+
+        Returns:
+            (passo, snapshot), ou None se o passo for anterior ao primeiro keyframe
+        """
+        index = bisect.bisect_right(self.keyframe_steps, step)
+        if index == 0:
+            return None
+        return self.keyframes[index - 1]
+
+    # === ARQUIVO ===
+
+    def save(self, path):
+        """Salva o replay no formato compacto descrito no topo do módulo"""
+        header = json.dumps(
+            {
+                "version": REPLAY_VERSION,
+                "seed": self.seed,
+                "sim_hz": self.sim_hz,
+                "steps": self.steps,
+                "keyframe_interval": self.keyframe_interval,
+            }
+        ).encode("utf-8")
+        runs = zlib.compress(b"".join(_RUN.pack(mask, count) for mask, count in self.runs))
+        keyframes = zlib.compress(
+            b"".join(
+                _KEYFRAME.pack(step, len(snapshot)) + snapshot
+                for step, snapshot in self.keyframes
+            )
+        )
+
+        with open(path, "wb") as file:
+            file.write(REPLAY_MAGIC)
+            file.write(_HEADER_SIZE.pack(len(header)))
+            file.write(header)
+            file.write(_HEADER_SIZE.pack(len(runs)))
+            file.write(runs)
+            file.write(keyframes)
+
+    @classmethod
+    def load(cls, path):
+        """
+        Lê um replay salvo com save().
+
+        Raises:
+            ValueError: Se o arquivo não for um replay ou for de outra versão
+        """
+        with open(path, "rb") as file:
+            data = file.read()
+
+        if data[:4] != REPLAY_MAGIC:
+            raise ValueError(f"{path} não é um arquivo de replay")
+
+        (header_size,) = _HEADER_SIZE.unpack_from(data, 4)
+        start = 4 + _HEADER_SIZE.size
+        header = json.loads(data[start:start + header_size].decode("utf-8"))
+        version = header["version"]
+        if version != REPLAY_VERSION:
+            raise ValueError(f"Versão de replay não suportada: {version}")
+
+        replay = cls(header["seed"], header["sim_hz"], header.get("keyframe_interval"))
+        replay.steps = header["steps"]
+        start += header_size
+
+        (runs_size,) = _HEADER_SIZE.unpack_from(data, start)
+        start += _HEADER_SIZE.size
+        runs = data[start:start + runs_size]
+        keyframes = zlib.decompress(data[start + runs_size:])
+
+        body = zlib.decompress(runs)
+        replay.runs = [[mask, count] for mask, count in _RUN.iter_unpack(body)]
+
+        offset = 0
+        while offset < len(keyframes):
+            step, size = _KEYFRAME.unpack_from(keyframes, offset)
+            offset += _KEYFRAME.size
+            replay.keyframes.append((step, keyframes[offset:offset + size]))
+            replay.keyframe_steps.append(step)
+            offset += size
+        return replay
+
+
+class ReplayPlayer:
+    """
+    Devolve as teclas gravadas, um passo de cada vez.
+
+    Serve tanto de política de entrada do HeadlessRunner (velocidade máxima)
+    quanto de fonte de teclas do GameManager (replay desenhado a 1x-16x).
+    """
+
+    def __init__(self, replay):
+        self.replay = replay
+        self.step = 0  # Próximo passo a ser reproduzido
+        self._run_index = 0  # Corrida atual
+        self._run_offset = 0  # Passos já consumidos da corrida atual
+
+    @property
+    def finished(self):
+        return self.step >= self.replay.steps
+
+    def seek(self, step):
+        """Posiciona a reprodução em um passo (0 = início)"""
+        step = min(step, self.replay.steps)
+        run_start = 0  # Passo em que a corrida atual começa
+        self._run_index = 0
+        for mask, count in self.replay.runs:
+            if run_start + count > step:
+                break
+            run_start += count
+            self._run_index += 1
+        self._run_offset = step - run_start
+        self.step = step
+
+    def next_keys(self):
+        """
+        Returns:
+            O estado das teclas do próximo passo (nenhuma tecla depois do fim)
+        """
+        if self.finished:
+            return mask_to_keys(0)
+
+        mask, count = self.replay.runs[self._run_index]
+        self._run_offset += 1
+        if self._run_offset >= count:
+            self._run_index += 1
+            self._run_offset = 0
+        self.step += 1
+        return mask_to_keys(mask)
+
+    def policy(self, world):
+        """Política de entrada para o HeadlessRunner"""
+        return self.next_keys()
@@ -0,0 +1,82 @@
+import heapq
+import math
+
+
+class SpawnScheduler:
+    """
+    Agenda de eventos de spawn por tempo simulado (fila de prioridade heapq).
+
+    Cada tipo de spawn ("enemy", "fuel", "ghost", "rocket_pickup") tem no
+    máximo um evento agendado, com o tempo (ms de jogo) em que ele vence.
+    O GameWorld só olha a agenda: num passo sem evento vencido o custo é
+    uma comparação com o topo da fila, e nenhuma regra de spawn é avaliada.
+
+    Reagendar um tipo não procura o evento antigo na fila: ele fica lá e é
+    ignorado quando chegar ao topo (o número de sequência não bate mais).
+    """
+
+    def __init__(self):
+        self.events = []  # Heap de (vencimento, sequência, nome)
+        self.pending = {}  # nome -> sequência do evento válido
+        self._sequence = 0
+
+    def __len__(self):
+        return len(self.pending)
+
+    def __contains__(self, name):
+        return name in self.pending
+
+    def clear(self):
+        self.events.clear()
+        self.pending.clear()
+
+    def schedule(self, name, due_ms):
+        """
+        Agenda (ou reagenda) o evento name para o tempo due_ms.
+
+        Eventos que vencem no mesmo tempo saem na ordem em que foram agendados.
+        """
+        self._sequence += 1
+        self.pending[name] = self._sequence
+        heapq.heappush(self.events, (due_ms, self._sequence, name))
+
+    def schedule_after(self, name, since_ms, delay_ms):
+        """
+        Agenda name para o primeiro ms inteiro em que "agora - since_ms > delay_ms".
+
+        É a mesma condição dos cooldowns do jogo (tempo decorrido maior que
+        o intervalo), já que o relógio da simulação avança em ms inteiros.
+        """
+        self.schedule(name, since_ms + math.floor(delay_ms) + 1)
+
+    def pop_due(self, now_ms):
+        """
+        Tira da fila o próximo evento vencido (vencimento <= now_ms).
+
+        Returns:
+            Nome do evento, ou None se nenhum venceu
+        """
+        events = self.events
+        pending = self.pending
+        while events and events[0][0] <= now_ms:
+            _, sequence, name = heapq.heappop(events)
+            if pending.get(name) == sequence:
+                del pending[name]
+                return name
+        return None
+
+    # === SNAPSHOTS ===
+
+    def get_state(self):
+        """Eventos agendados como lista de (nome, vencimento), na ordem da fila"""
+        pending = self.pending
+        return [
+            (name, due_ms)
+            for due_ms, sequence, name in sorted(self.events)
+            if pending.get(name) == sequence
+        ]
+
+    def set_state(self, state):
+        self.clear()
+        for name, due_ms in state:
+            self.schedule(name, due_ms)
@@ -0,0 +1,636 @@
+"""
+Ambiente vetorizado: simula N mundos independentes em lote com NumPy.
+
+Em vez de N objetos GameWorld (cada um com listas de EnemyCar, pickups e
+foguetes), o estado de todos os mundos fica em arrays "struct-of-arrays":
+enemy_y[mundo, vaga], enemy_speed[mundo, vaga], fuel[mundo]... Um passo de
+1000 mundos é uma dúzia de operações NumPy, e não 1000 chamadas de update().
+
+As regras e os parâmetros vêm do GameWorld e do EnemyCar (lidos de um mundo
+"modelo" criado no construtor), então um ajuste de balanceamento no jogo vale
+também aqui. A simulação não é idêntica bit a bit ao GameWorld: os sorteios
+usam um gerador NumPy por lote, e os inimigos de um mesmo passo se movem
+todos a partir das posições do passo anterior. Para reproduzir uma partida
+exata, use o HeadlessRunner.
+
+Uso:
+    env = VectorEnv(1000, seed=0)
+    obs = env.reset()
+    obs, scores, dones = env.step(actions)  # actions: máscara de teclas por mundo
+"""
+
+import math
+
+import numpy as np
+import pygame
+
+from config.constants import WIDTH, HEIGHT, SIM_HZ
+from core.game_clock import GameClock
+from core.game_world import GameWorld
+from core.headless import setup_headless_drivers
+from core.input_state import TRACKED_KEYS
+from core.random_streams import RandomStreams
+from entities.enemy_car import EnemyCar, MOVEMENT_PATTERNS
+from entities.enemy_manager import wave_tables
+from entities.pickups.fuel import FuelPickup
+from img.img_config import ImgConfig
+
+
+# Bits das ações (mesma ordem de core.input_state.keys_to_mask)
+ACTION_LEFT, ACTION_RIGHT, ACTION_UP, ACTION_DOWN, ACTION_FIRE = (
+    1 << bit for bit in range(len(TRACKED_KEYS))
+)
+
+
+def _collide(ax, ay, aw, ah, bx, by, bw, bh):
+    """colliderect vetorizado (mesma regra do pygame.Rect)"""
+    return (ax < bx + bw) & (bx < ax + aw) & (ay < by + bh) & (by < ay + ah)
+
+
+def _choose(rng, allowed):
+    """
+    Sorteia uma coluna permitida por linha.
+
+    Args:
+        allowed: Array booleano (mundos, opções)
+
+    Returns:
+        Índice sorteado por mundo (lixo onde nenhuma opção é permitida)
+    """
+    scores = rng.random(allowed.shape)
+    scores[~allowed] = -1.0
+    return scores.argmax(axis=1)
+
+
+class VectorEnv:
+    """
+    Lote de mundos simulados em paralelo, com observações em arrays NumPy.
+
+    Cada mundo tem um número fixo de "vagas" para inimigos, pickups e
+    foguetes; uma vaga livre é marcada com alive = False. Os limites
+    padrão sobram para o tráfego normal do jogo (na prática há no máximo
+    3 ou 4 inimigos na tela).
+    """
+
+    def __init__(
+        self,
+        num_worlds,
+        seed=None,
+        dt=1 / SIM_HZ,
+        max_enemies=8,
+        max_pickups=4,
+        max_rockets=16,
+        auto_reset=True,
+        params=None,
+        img_config=None,
+    ):
+        """
+        Args:
+            num_worlds: Quantos mundos simular em lote
+            seed: Semente do lote (mesma semente + mesmo num_worlds = mesmo resultado)
+            dt: Passo fixo da simulação (segundos)
+            max_enemies, max_pickups, max_rockets: Vagas por mundo
+            auto_reset: Reinicia sozinho os mundos que terminaram
+            params: Atributos do GameWorld a sobrescrever (como no HeadlessRunner)
+            img_config: ImgConfig já carregado (None = carrega com drivers "dummy")
+        """
+        self.num_worlds = num_worlds
+        self.dt = dt
+        self.auto_reset = auto_reset
+        self.rng = np.random.default_rng(seed)
+
+        self._read_rules(img_config, params or {})
+
+        n = num_worlds
+        # === MUNDO E JOGADOR ===
+        self.time_ms = np.zeros(n)
+        self.steps = np.zeros(n, dtype=np.int64)
+        self.done = np.zeros(n, dtype=bool)
+        self.player_x = np.zeros(n)
+        self.player_y = np.zeros(n)
+        self.fuel = np.zeros(n)
+        self.distance = np.zeros(n)
+        self.bonus = np.zeros(n, dtype=np.int64)
+        self.fuel_collected = np.zeros(n, dtype=np.int64)
+        self.ghost_end = np.zeros(n)
+        self.rocket_end = np.zeros(n)
+        self.rocket_cooldown = np.zeros(n)
+
+        # === CONTROLE DE SPAWN ===
+        self.last_spawn = np.zeros(n)
+        self.spawn_delay = np.zeros(n)
+        self.lane_last_spawn = np.zeros((n, self.num_lanes))
+        self.last_fuel_spawn = np.zeros(n)
+        self.last_pickup_spawn = np.zeros(n)
+
+        # === INIMIGOS (mundo, vaga) ===
+        e = max_enemies
+        self.enemy_alive = np.zeros((n, e), dtype=bool)
+        self.enemy_kind = np.zeros((n, e), dtype=np.int8)  # Índice da imagem
+        self.enemy_w = np.zeros((n, e))  # Tamanho da imagem (guardado para não
+        self.enemy_h = np.zeros((n, e))  # indexar enemy_sizes a cada passo)
+        self.enemy_x = np.zeros((n, e))
+        self.enemy_y = np.zeros((n, e))
+        self.enemy_speed = np.zeros((n, e))
+        self.enemy_base_x = np.zeros((n, e))
+        self.enemy_lateral = np.zeros((n, e))
+        self.enemy_osc_speed = np.zeros((n, e))
+        self.enemy_osc_amplitude = np.zeros((n, e))
+        self.enemy_phase = np.zeros((n, e))
+        self.enemy_time = np.zeros((n, e))
+        self.enemy_pattern = np.zeros((n, e), dtype=np.int8)
+        self.enemy_can_change = np.zeros((n, e), dtype=bool)
+        self.enemy_changing = np.zeros((n, e), dtype=bool)
+        self.enemy_trigger_y = np.zeros((n, e))
+        self.enemy_target_x = np.zeros((n, e))
+
+        # === PICKUPS E FOGUETES (mundo, vaga) ===
+        self.fuel_alive = np.zeros((n, max_pickups), dtype=bool)
+        self.fuel_x = np.zeros((n, max_pickups))
+        self.fuel_y = np.zeros((n, max_pickups))
+        self.ghost_alive = np.zeros((n, max_pickups), dtype=bool)
+        self.ghost_x = np.zeros((n, max_pickups))
+        self.ghost_y = np.zeros((n, max_pickups))
+        self.rocket_pickup_alive = np.zeros((n, max_pickups), dtype=bool)
+        self.rocket_pickup_x = np.zeros((n, max_pickups))
+        self.rocket_pickup_y = np.zeros((n, max_pickups))
+        self.rocket_alive = np.zeros((n, max_rockets), dtype=bool)
+        self.rocket_x = np.zeros((n, max_rockets))
+        self.rocket_y = np.zeros((n, max_rockets))
+
+        self.observation_fields = (
+            "player_x",
+            "player_y",
+            "fuel",
+            "ghost_time",
+            "rocket_time",
+        ) + tuple(f"enemy_distance_lane{i}" for i in range(self.num_lanes))
+
+        self.reset()
+
+    def _read_rules(self, img_config, params):
+        """Lê parâmetros e tamanhos de sprite de um GameWorld modelo"""
+        if img_config is None:
+            setup_headless_drivers()
+            pygame.init()
+            if pygame.display.get_surface() is None:
+                pygame.display.set_mode((WIDTH, HEIGHT))
+            img_config = ImgConfig(WIDTH, HEIGHT)
+
+        world = GameWorld(WIDTH, HEIGHT, img_config, GameClock(), RandomStreams(0))
+        for name, value in params.items():
+            if not hasattr(world, name):
+                raise ValueError(f"GameWorld não tem o parâmetro {name!r}")
+            setattr(world, name, value)
+
+        self.width = world.width
+        self.height = world.height
+        self.lanes = np.array(world.enemy_lanes, dtype=float)
+        self.road_lanes = np.array(world.road_lanes, dtype=float)
+        self.num_lanes = len(world.enemy_lanes)
+        self.spawn_delay_range = world.spawn_delay_range
+        self.lane_cooldown = world.lane_cooldown
+        self.pickup_cooldown = world.pickup_cooldown
+        self.fuel_spawn_cooldown = world.fuel_spawn_cooldown
+        # Taxas por segundo viram chance por passo (processo de Poisson)
+        self.ghost_spawn_chance = -math.expm1(-world.ghost_spawn_rate * self.dt)
+        self.rocket_pickup_spawn_chance = -math.expm1(-world.rocket_pickup_spawn_rate * self.dt)
+        self.track_speed = world.track.speed
+
+        # Jogador
+        car = world.car
+        self.player_start = (car.x, car.y)
+        self.player_size = car.rect.size
+        self.player_speed = car.speed
+        self.player_limits = (car.left_limit, car.right_limit)
+        self.max_fuel = car.max_fuel
+        self.fuel_rate = car.fuel_consumption_rate
+
+        # Foguete: posição relativa ao carro e tamanho, do mesmo jeito que o Player cria
+        rocket = car._create_rocket()
+        self.rocket_offset = (rocket.x - car.rect.centerx, rocket.y - car.rect.top)
+        self.rocket_size = rocket.rect.size
+        self.rocket_speed = rocket.speed
+
+        # Inimigos e pickups
+        self.enemy_sizes = np.array([image.get_size() for image in world.enemy_imgs], dtype=float)
+        self.fuel_size = img_config.fuel_img.get_size()
+        self.ghost_size = img_config.ghost_power_img.get_size()
+        self.rocket_pickup_size = img_config.rocket_pickup_img.get_size()
+        self.pickup_speed = FuelPickup(img_config.fuel_img, 0, world.height).speed
+
+        # Ondas de cada padrão (mesmas tabelas do EnemyManager)
+        self.wave_frequency, self.wave_factor = wave_tables()
+        self.pattern_tuning = np.array(
+            [EnemyCar.PATTERN_TUNING.get(name, (1.0, 1.0)) for name in MOVEMENT_PATTERNS]
+        )
+
+    # === API ===
+
+    def reset(self, mask=None):
+        """
+        Reinicia mundos (todos, ou só os marcados em mask).
+
+        Returns:
+            Observações de todos os mundos
+        """
+        if mask is None:
+            mask = np.ones(self.num_worlds, dtype=bool)
+
+        self.time_ms[mask] = 0.0
+        self.steps[mask] = 0
+        self.done[mask] = False
+        self.player_x[mask], self.player_y[mask] = self.player_start
+        self.fuel[mask] = self.max_fuel
+        self.distance[mask] = 0.0
+        self.bonus[mask] = 0
+        self.fuel_collected[mask] = 0
+        self.ghost_end[mask] = 0.0
+        self.rocket_end[mask] = 0.0
+        self.rocket_cooldown[mask] = 0.0
+
+        self.last_spawn[mask] = 0.0
+        self.spawn_delay[mask] = 1000.0
+        self.lane_last_spawn[mask] = 0.0
+        self.last_fuel_spawn[mask] = 0.0
+        self.last_pickup_spawn[mask] = 0.0
+
+        self.enemy_alive[mask] = False
+        self.fuel_alive[mask] = False
+        self.ghost_alive[mask] = False
+        self.rocket_pickup_alive[mask] = False
+        self.rocket_alive[mask] = False
+        return self.observations()
+
+    def step(self, actions):
+        """
+        Avança todos os mundos um passo.
+
+        Args:
+            actions: Array (num_worlds,) com a máscara de teclas de cada mundo
+                (ACTION_LEFT | ACTION_FIRE, ...), no formato de keys_to_mask
+
+        Returns:
+            (observações, pontuações, terminou): arrays com uma linha por mundo.
+            Pontuação e "terminou" se referem ao passo atual; com auto_reset,
+            as observações de um mundo que terminou já são do mundo reiniciado.
+        """
+        actions = np.asarray(actions)
+        running = ~self.done
+        dt = self.dt
+
+        self.time_ms[running] += dt * 1000
+        self.steps[running] += 1
+        now = self.time_ms
+
+        self._update_player(actions, running, now)
+        self._update_rockets(actions, running, now)
+        self._spawn_enemies(running, now)
+        self._update_enemies(running)
+        self._spawn_pickups(running, now)
+        self._update_pickups(running, now)
+        self.distance[running] += self.track_speed * dt * 60
+        self._rocket_hits(running)
+
+        # Fim de jogo: colisão (fora do modo fantasma) ou sem combustível
+        crashed = self._player_hits_enemy() & ~(now < self.ghost_end)
+        finished = running & (crashed | (self.fuel <= 0))
+        self.done |= finished
+
+        scores = self.scores()
+        dones = finished.copy()
+        if self.auto_reset and finished.any():
+            self.reset(finished)
+        return self.observations(), scores, dones
+
+    def scores(self):
+        """Pontuação de cada mundo (mesma conta do GameWorld.get_score)"""
+        return (self.distance / 100).astype(np.int64) + self.bonus
+
+    def observations(self):
+        """
+        Observações contíguas (num_worlds, len(observation_fields)) em float32:
+        posição do jogador, combustível, segundos restantes de fantasma e de
+        bazuca, e a distância até o inimigo mais próximo à frente em cada
+        faixa (altura da tela quando a faixa está livre).
+        """
+        obs = np.empty((self.num_worlds, len(self.observation_fields)), dtype=np.float32)
+        now = self.time_ms
+        obs[:, 0] = self.player_x
+        obs[:, 1] = self.player_y
+        obs[:, 2] = self.fuel
+        obs[:, 3] = np.maximum(self.ghost_end - now, 0) / 1000
+        obs[:, 4] = np.maximum(self.rocket_end - now, 0) / 1000
+
+        # Faixa de cada inimigo = a mais próxima do centro da faixa dele
+        lane = np.abs(self.enemy_base_x[:, :, None] - self.lanes).argmin(axis=2)
+        ahead = self.player_y[:, None] - self.enemy_y
+        valid = self.enemy_alive & (ahead > 0)
+        for i in range(self.num_lanes):
+            in_lane = np.where(valid & (lane == i), ahead, np.inf)
+            obs[:, 5 + i] = np.minimum(in_lane.min(axis=1), self.height)
+        return obs
+
+    # === JOGADOR ===
+
+    def _update_player(self, actions, running, now):
+        speed_dt = self.player_speed * 60 * self.dt
+        moving = running & (self.fuel > 0)
+        left_limit, right_limit = self.player_limits
+        _, height = self.player_size
+
+        left = moving & ((actions & ACTION_LEFT) != 0) & (self.player_x > left_limit)
+        right = moving & ((actions & ACTION_RIGHT) != 0) & (self.player_x < right_limit)
+        up = moving & ((actions & ACTION_UP) != 0) & (self.player_y > 0)
+        down = moving & ((actions & ACTION_DOWN) != 0) & (self.player_y < self.height - height)
+        self.player_x -= left * speed_dt
+        self.player_x += right * speed_dt
+        self.player_y -= up * speed_dt
+        self.player_y += down * speed_dt
+
+        # Como no Player, o combustível é gasto a cada passo
+        self.fuel[running] = np.maximum(
+            self.fuel[running] - self.fuel_rate * 60 * self.dt, 0
+        )
+
+    def _player_rect(self):
+        width, height = self.player_size
+        return np.rint(self.player_x), np.rint(self.player_y), width, height
+
+    def _update_rockets(self, actions, running, now):
+        # Disparo: com a bazuca ativa, ESPAÇO e fora do cooldown
+        fire = (
+            running
+            & (now < self.rocket_end)
+            & ((actions & ACTION_FIRE) != 0)
+            & (now > self.rocket_cooldown)
+        )
+        free = ~self.rocket_alive
+        fire &= free.any(axis=1)
+        if fire.any():
+            worlds = np.flatnonzero(fire)
+            slots = free[worlds].argmax(axis=1)
+            px, py, width, _ = self._player_rect()
+            centerx = px[worlds] + width // 2
+            self.rocket_alive[worlds, slots] = True
+            self.rocket_x[worlds, slots] = centerx + self.rocket_offset[0]
+            self.rocket_y[worlds, slots] = py[worlds] + self.rocket_offset[1]
+            self.rocket_cooldown[worlds] = now[worlds] + 500
+
+        # Movimento e saída pela parte de cima da tela
+        moving = self.rocket_alive & running[:, None]
+        self.rocket_y -= moving * (self.rocket_speed * 60 * self.dt)
+        self.rocket_alive &= np.rint(self.rocket_y) + self.rocket_size[1] >= 0
+
+    # === INIMIGOS ===
+
+    def _enemy_rect(self):
+        return np.rint(self.enemy_x), np.rint(self.enemy_y), self.enemy_w, self.enemy_h
+
+    def _spawn_enemies(self, running, now):
+        ex, ey, _, _ = self._enemy_rect()
+        alive = self.enemy_alive
+
+        # Espaço atrás do último inimigo (o mais alto da tela)
+        topmost = np.where(alive, ey, np.inf).min(axis=1)
+        due = running & (now - self.last_spawn > self.spawn_delay) & (topmost > 150)
+        due &= ~self._would_create_blockage(ex, ey)
+        if not due.any():
+            return
+
+        # Faixas fora do cooldown e sem inimigo alinhado perto do topo
+        cooled = now[:, None] - self.lane_last_spawn > self.lane_cooldown
+        near_top = alive & (ey < 250)
+        occupied = (near_top[:, :, None] & (ex[:, :, None] == self.lanes)).any(axis=1)
+        occupied &= cooled  # O GameWorld só marca como ocupadas as faixas disponíveis
+        available = cooled & ~occupied
+        spawn = due & (occupied.sum(axis=1) < self.num_lanes)
+        spawn &= available.any(axis=1) & (~alive).any(axis=1)
+
+        # O relógio de spawn reinicia mesmo sem faixa livre (como no GameWorld)
+        self.last_spawn[due] = now[due]
+        low, high = self.spawn_delay_range
+        self.spawn_delay[due] = self.rng.integers(low, high + 1, size=int(due.sum()))
+
+        if spawn.any():
+            worlds = np.flatnonzero(spawn)
+            lane = _choose(self.rng, available[worlds])
+            slots = (~alive[worlds]).argmax(axis=1)
+            self._create_enemies(worlds, slots, self.lanes[lane])
+            self.lane_last_spawn[worlds, lane] = now[worlds]
+
+    def _would_create_blockage(self, ex, ey):
+        """
+        Mesmo critério do GameWorld: inimigos visíveis, à frente do jogador,
+        em faixas (x) diferentes e a menos de 100px de altura um do outro
+        formam uma "parede" que ocuparia todas as faixas.
+        """
+        visible = self.enemy_alive & (ey > 0) & (ey < self.height)
+        visible &= ey < np.rint(self.player_y)[:, None] + 200
+        pair = visible[:, :, None] & visible[:, None, :]
+        pair &= np.abs(ey[:, :, None] - ey[:, None, :]) < 100
+        pair &= ex[:, :, None] != ex[:, None, :]
+        return pair.any(axis=(1, 2))
+
+    def _create_enemies(self, worlds, slots, lane_x):
+        """Sorteia os parâmetros dos novos inimigos (mesmas faixas do EnemyCar)"""
+        count = len(worlds)
+        rng = self.rng
+        index = (worlds, slots)
+
+        kind = rng.integers(0, len(self.enemy_sizes), size=count)
+        speed = EnemyCar.BASE_SPEED * rng.uniform(*EnemyCar.SPEED_VARIATION, size=count)
+        pattern = rng.integers(0, len(MOVEMENT_PATTERNS), size=count)
+        tuning = self.pattern_tuning[pattern]
+
+        self.enemy_alive[index] = True
+        self.enemy_kind[index] = kind
+        self.enemy_w[index] = self.enemy_sizes[kind, 0]
+        self.enemy_h[index] = self.enemy_sizes[kind, 1]
+        self.enemy_speed[index] = speed
+        self.enemy_base_x[index] = lane_x
+        self.enemy_x[index] = lane_x
+        self.enemy_y[index] = -self.enemy_sizes[kind, 1]
+        self.enemy_lateral[index] = 0.0
+        self.enemy_osc_speed[index] = rng.uniform(*EnemyCar.OSCILLATION_SPEED_RANGE, size=count) * tuning[:, 0]
+        self.enemy_osc_amplitude[index] = (
+            rng.uniform(*EnemyCar.OSCILLATION_AMPLITUDE_RANGE, size=count) * tuning[:, 1]
+        )
+        self.enemy_phase[index] = rng.uniform(0, 2 * np.pi, size=count)
+        self.enemy_time[index] = 0.0
+        self.enemy_pattern[index] = pattern
+        self.enemy_can_change[index] = rng.random(count) < EnemyCar.LANE_CHANGE_CHANCE
+        low, high = EnemyCar.LANE_CHANGE_TRIGGER_RANGE
+        self.enemy_trigger_y[index] = rng.integers(low, high + 1, size=count)
+        self.enemy_changing[index] = False
+
+    def _update_enemies(self, running):
+        alive = self.enemy_alive & running[:, None]
+        dt = self.dt
+        ex, ey, ew, eh = self._enemy_rect()
+
+        # Segue o carro da frente: não anda se ficaria perto demais dele
+        new_y = self.enemy_y + self.enemy_speed * 60 * dt
+        centerx = ex + ew // 2
+        same_lane = np.abs(centerx[:, :, None] - centerx[:, None, :]) < EnemyCar.SAME_LANE_DISTANCE
+        gap = self.enemy_y[:, None, :] - new_y[:, :, None]  # [mundo, eu, outro]
+        blocked = same_lane & (gap > 0) & (gap < (eh + EnemyCar.FOLLOW_DISTANCE)[:, :, None])
+        blocked &= self.enemy_alive[:, None, :]
+        moves = alive & ~blocked.any(axis=2)
+        self.enemy_y = np.where(moves, new_y, self.enemy_y)
+
+        # Início da troca de faixa (longe do jogador)
+        player_y = np.rint(self.player_y)[:, None]
+        start = (
+            alive
+            & self.enemy_can_change
+            & ~self.enemy_changing
+            & (self.enemy_y >= self.enemy_trigger_y)
+            & (self.enemy_y >= EnemyCar.MIN_Y_FOR_LANE_CHANGE)
+            & (np.abs(self.enemy_y - player_y) >= EnemyCar.SAFE_DISTANCE_FROM_PLAYER)
+        )
+        if start.any():
+            worlds, slots = np.nonzero(start)
+            other = self.lanes != self.enemy_base_x[worlds, slots][:, None]
+            lane = _choose(self.rng, other)
+            self.enemy_target_x[worlds, slots] = self.lanes[lane]
+            self.enemy_changing[worlds, slots] = True
+            self.enemy_can_change[worlds, slots] = False
+
+        # Troca de faixa em andamento
+        changing = alive & self.enemy_changing
+        step = self.enemy_speed * EnemyCar.LANE_CHANGE_SPEED_FACTOR * 60 * dt
+        diff = self.enemy_target_x - self.enemy_base_x
+        arrived = changing & (np.abs(diff) <= step)
+        self.enemy_base_x = np.where(changing & ~arrived, self.enemy_base_x + np.sign(diff) * step, self.enemy_base_x)
+        self.enemy_base_x = np.where(arrived, self.enemy_target_x, self.enemy_base_x)
+        self.enemy_changing &= ~arrived
+        self.enemy_lateral[arrived] = 0.0
+        self.enemy_time[arrived] = 0.0
+
+        # Oscilação lateral (ver PATTERN_WAVES)
+        oscillating = alive & ~changing
+        self.enemy_time += oscillating * (self.enemy_osc_speed * 60 * dt)
+        frequency = self.wave_frequency[self.enemy_pattern]
+        factor = self.wave_factor[self.enemy_pattern]
+        waves = np.sin(self.enemy_time[..., None] * frequency + self.enemy_phase[..., None])
+        offset = (waves * (self.enemy_osc_amplitude[..., None] * factor)).sum(axis=2)
+        limit = EnemyCar.MAX_LATERAL_MOVEMENT
+        self.enemy_lateral = np.where(oscillating, np.clip(offset, -limit, limit), self.enemy_lateral)
+
+        self.enemy_x = np.where(alive, self.enemy_base_x + self.enemy_lateral, self.enemy_x)
+        self.enemy_alive &= ~(alive & (self.enemy_y > self.height))
+
+    def _player_hits_enemy(self):
+        px, py, pw, ph = self._player_rect()
+        ex, ey, ew, eh = self._enemy_rect()
+        hit = _collide(px[:, None], py[:, None], pw, ph, ex, ey, ew, eh)
+        return (hit & self.enemy_alive).any(axis=1)
+
+    def _rocket_hits(self, running):
+        """Cada foguete destrói no máximo um inimigo (+20 pontos)"""
+        if not self.rocket_alive.any():
+            return
+        ex, ey, ew, eh = self._enemy_rect()
+        rw, rh = self.rocket_size
+        rx, ry = np.rint(self.rocket_x), np.rint(self.rocket_y)
+        hit = _collide(
+            rx[:, :, None], ry[:, :, None], rw, rh,
+            ex[:, None, :], ey[:, None, :], ew[:, None, :], eh[:, None, :],
+        )
+        hit &= (self.rocket_alive & running[:, None])[:, :, None] & self.enemy_alive[:, None, :]
+        worlds, rockets = np.nonzero(hit.any(axis=2))
+        for world, rocket in zip(worlds, rockets):
+            targets = np.flatnonzero(hit[world, rocket] & self.enemy_alive[world])
+            if len(targets):
+                self.enemy_alive[world, targets[0]] = False
+                self.rocket_alive[world, rocket] = False
+                self.bonus[world] += 20
+
+    # === PICKUPS ===
+
+    def _spawn_pickups(self, running, now):
+        ex, ey, _, _ = self._enemy_rect()
+        fx, fy = np.rint(self.fuel_x), np.rint(self.fuel_y)
+        gx, gy = np.rint(self.ghost_x), np.rint(self.ghost_y)
+        obstacles_x = np.concatenate([ex, fx, gx], axis=1)
+        obstacles_y = np.concatenate([ey, fy, gy], axis=1)
+        obstacles = np.concatenate([self.enemy_alive, self.fuel_alive, self.ghost_alive], axis=1)
+
+        # Combustível: cooldown normal, ou 60% dele quando o tanque está abaixo de 60
+        since_fuel = now - self.last_fuel_spawn
+        top_fuel = np.where(self.fuel_alive, fy, np.inf).min(axis=1)
+        spawn_fuel = (since_fuel > self.fuel_spawn_cooldown) & (top_fuel > 250)
+        spawn_fuel |= (self.fuel < 60) & (since_fuel > self.fuel_spawn_cooldown * 0.6)
+        spawn_fuel &= running & (~self.fuel_alive).any(axis=1)
+        if spawn_fuel.any():
+            blocked = self._lanes_blocked(obstacles, obstacles_x, obstacles_y, 100, self.lanes)
+            free = ~blocked[spawn_fuel]
+            free[~free.any(axis=1)] = True  # Sem faixa livre: sorteia entre todas
+            self._spawn_into(spawn_fuel, free, self.lanes, self.fuel_alive, self.fuel_x, self.fuel_y)
+            self.last_fuel_spawn[spawn_fuel] = now[spawn_fuel]
+
+        # Fantasma: raro, e só com a faixa livre até y=350
+        top_ghost = np.where(self.ghost_alive, gy, np.inf).min(axis=1)
+        spawn_ghost = running & (now - self.last_pickup_spawn > self.pickup_cooldown * 1.5)
+        spawn_ghost &= self.rng.random(self.num_worlds) < self.ghost_spawn_chance
+        spawn_ghost &= (top_ghost > 250) & (~self.ghost_alive).any(axis=1)
+        if spawn_ghost.any():
+            blocked = self._lanes_blocked(obstacles, obstacles_x, obstacles_y, 350, self.road_lanes)
+            free = ~blocked
+            spawn_ghost &= free.any(axis=1)
+            if spawn_ghost.any():
+                self._spawn_into(
+                    spawn_ghost, free[spawn_ghost], self.road_lanes,
+                    self.ghost_alive, self.ghost_x, self.ghost_y,
+                )
+                self.last_pickup_spawn[spawn_ghost] = now[spawn_ghost]
+
+        # Bazuca: só uma por vez
+        spawn_rocket = running & (self.rng.random(self.num_worlds) < self.rocket_pickup_spawn_chance)
+        spawn_rocket &= ~self.rocket_pickup_alive.any(axis=1)
+        if spawn_rocket.any():
+            free = np.ones((int(spawn_rocket.sum()), len(self.road_lanes)), dtype=bool)
+            self._spawn_into(
+                spawn_rocket, free, self.road_lanes,
+                self.rocket_pickup_alive, self.rocket_pickup_x, self.rocket_pickup_y,
+            )
+
+    def _lanes_blocked(self, alive, xs, ys, max_y, lanes):
+        """Faixas com algum objeto alinhado (mesmo x) acima de max_y"""
+        near = alive & (ys < max_y)
+        return (near[:, :, None] & (xs[:, :, None] == lanes)).any(axis=1)
+
+    def _spawn_into(self, spawn, free_lanes, lanes, alive, xs, ys):
+        worlds = np.flatnonzero(spawn)
+        lane = _choose(self.rng, free_lanes)
+        slots = (~alive[worlds]).argmax(axis=1)
+        alive[worlds, slots] = True
+        xs[worlds, slots] = lanes[lane]
+        ys[worlds, slots] = 0.0
+
+    def _update_pickups(self, running, now):
+        speed_dt = self.pickup_speed * 60 * self.dt
+        px, py, pw, ph = self._player_rect()
+
+        for alive, xs, ys, size, kind in (
+            (self.fuel_alive, self.fuel_x, self.fuel_y, self.fuel_size, "fuel"),
+            (self.ghost_alive, self.ghost_x, self.ghost_y, self.ghost_size, "ghost"),
+            (self.rocket_pickup_alive, self.rocket_pickup_x, self.rocket_pickup_y, self.rocket_pickup_size, "rocket"),
+        ):
+            moving = alive & running[:, None]
+            ys += moving * speed_dt
+            hit = moving & _collide(
+                np.rint(xs), np.rint(ys), size[0], size[1], px[:, None], py[:, None], pw, ph
+            )
+            got = hit.any(axis=1)
+            if kind == "fuel":
+                # Cada pickup coletado vale +25 (podem ser dois no mesmo passo)
+                count = hit.sum(axis=1)
+                self.fuel = np.minimum(self.max_fuel, self.fuel + 25 * count)
+                self.fuel_collected += count
+            elif kind == "ghost":
+                self.ghost_end[got] = now[got] + 8000
+            else:
+                self.rocket_end[got] = now[got] + 10000
+            alive &= ~hit & ~(ys > self.height)
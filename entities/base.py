@@ -11,13 +11,50 @@ class BaseEntity:
         else:
             self.image = image
             
+        # Posição "real" no mundo, em float. O pygame.Rect só guarda inteiros,
+        # então movimentos menores que 1 pixel por passo (comuns em 144+ FPS)
+        # seriam perdidos se somássemos direto no rect.
+        self.x = float(x_pos)
+        self.y = float(y_pos)
+
+        # Rect inteiro usado para desenho e colisão (sincronizado com x/y)
         self.rect = self.image.get_rect()
-        self.rect.x = x_pos
-        self.rect.y = y_pos
+        self.sync_rect()
         self.frozen = False
 
-    def draw(self, surface):
+        # Posição no passo de simulação anterior (para interpolar o desenho)
+        self.save_previous_position()
+
+    def sync_rect(self):
+        """Copia a posição float para o rect inteiro (uma vez por passo)"""
+        self.rect.x = round(self.x)
+        self.rect.y = round(self.y)
+
+    def set_position(self, x_pos, y_pos):
+        """Teleporta a entidade (sem interpolar a partir da posição antiga)"""
+        self.x = float(x_pos)
+        self.y = float(y_pos)
+        self.sync_rect()
+        self.save_previous_position()
+
+    def save_previous_position(self):
+        """Guarda a posição atual antes de um novo passo de simulação"""
+        self.prev_x = self.x
+        self.prev_y = self.y
+
+    def render_position(self, alpha=1.0):
+        """
+        Posição interpolada entre os dois últimos passos de simulação.
+
+        Args:
+            alpha: Fração do próximo passo já decorrida (0 = anterior, 1 = atual)
+        """
+        x = self.prev_x + (self.x - self.prev_x) * alpha
+        y = self.prev_y + (self.y - self.prev_y) * alpha
+        return (round(x), round(y))
+
+    def draw(self, surface, alpha=1.0):
         try:
-            surface.blit(self.image, self.rect)
+            surface.blit(self.image, self.render_position(alpha))
         except:
             print("Erro ao desenhar entidade")
\ No newline at end of file
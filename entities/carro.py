@@ -71,9 +71,9 @@ class Carro(BaseEntity):
                 hitbox_y
             )
     
-    def draw(self, screen):
-        """Desenha o carro e sua hitbox (para debug)"""
-        screen.blit(self.image, self.rect)
+    def draw(self, screen, alpha=1.0):
+        """Desenha o carro (na posição interpolada) e sua hitbox (para debug)"""
+        screen.blit(self.image, self.render_position(alpha))
         self.hitbox.draw_hitbox(screen)
     
     def check_hitbox_collision(self, other):
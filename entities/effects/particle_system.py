@@ -0,0 +1,152 @@
+import math
+
+import numpy as np
+import pygame
+
+
+class ParticleSystem:
+    """
+    Partículas de explosão guardadas em arrays NumPy.
+
+    Cada partícula é uma linha dos arrays (posição, velocidade, tempo de
+    vida, tamanho e cor) e todas andam de uma vez por update(). As vivas
+    ficam sempre nas primeiras `count` linhas; as que acabam são retiradas
+    compactando os arrays, e a capacidade é fixa (os arrays são o pool de
+    partículas: emitir não aloca nada).
+
+    O desenho não cria Surface por partícula: cada círculo vem de um cache
+    de sprites pré-renderizados por (tamanho, cor da paleta, faixa de
+    opacidade), e todas são desenhadas com um só blits().
+
+    As partículas são só visuais: não entram nos snapshots.
+    """
+
+    CAPACITY = 512  # Máximo de partículas vivas (as mais velhas dão lugar às novas)
+
+    # Sorteios de cada partícula (mesmos valores da antiga classe Particle)
+    SIZE_RANGE = (2, 5)  # Raio em pixels (inclusivo)
+    SPEED_RANGE = (0.5, 3)  # Pixels por quadro a 60 FPS
+    LIFETIME_RANGE = (300, 800)  # ms (inclusivo)
+    MAX_LIFETIME = 800  # Tempo de vida com opacidade total
+    # Tons de laranja/vermelho (vermelho 200-255, verde 50-150, sem azul)
+    PALETTE = tuple((red, green, 0) for red in (200, 218, 237, 255) for green in (50, 100, 150))
+    ALPHA_LEVELS = 16  # Faixas de opacidade com sprite próprio
+
+    def __init__(self, rng=None):
+        """
+        Args:
+            rng: numpy.random.Generator dos sorteios (None = sem semente)
+        """
+        self.rng = rng if rng is not None else np.random.default_rng()
+        capacity = self.CAPACITY
+        self.x = np.zeros(capacity)
+        self.y = np.zeros(capacity)
+        self.speed_x = np.zeros(capacity)
+        self.speed_y = np.zeros(capacity)
+        self.lifetime = np.zeros(capacity)
+        self.size = np.zeros(capacity, dtype=int)
+        self.color = np.zeros(capacity, dtype=int)  # Índice na PALETTE
+        self.count = 0
+        self.sprites = {}  # (tamanho, cor, faixa de opacidade) -> Surface
+
+    def __len__(self):
+        return self.count
+
+    def clear(self):
+        self.count = 0
+
+    def emit(self, x, y, count):
+        """
+        Cria count partículas em (x, y), espalhando em direções aleatórias.
+
+        Se não couberem todas, as partículas com menos vida restante são
+        substituídas.
+        """
+        count = min(count, self.CAPACITY)
+        if count <= 0:
+            return
+        free = self.CAPACITY - self.count
+        if count > free:
+            self._drop_oldest(count - free)
+
+        rows = slice(self.count, self.count + count)
+        rng = self.rng
+        angle = rng.uniform(0, math.pi * 2, count)
+        speed = rng.uniform(*self.SPEED_RANGE, count)
+        self.x[rows] = x
+        self.y[rows] = y
+        self.speed_x[rows] = np.cos(angle) * speed
+        self.speed_y[rows] = np.sin(angle) * speed
+        low, high = self.LIFETIME_RANGE
+        self.lifetime[rows] = rng.integers(low, high + 1, count)
+        low, high = self.SIZE_RANGE
+        self.size[rows] = rng.integers(low, high + 1, count)
+        self.color[rows] = rng.integers(0, len(self.PALETTE), count)
+        self.count += count
+
+    def _drop_oldest(self, amount):
+        """Abre espaço tirando as amount partículas mais perto do fim"""
+        keep = np.ones(self.count, dtype=bool)
+        keep[np.argpartition(self.lifetime[:self.count], amount - 1)[:amount]] = False
+        self._compact(keep)
+
+    def update(self, dt=1/60):
+        count = self.count
+        if count == 0:
+            return
+        rows = slice(0, count)
+        # Velocidade multiplicada por 60 para manter mesma velocidade em 60 FPS
+        step = 60 * dt
+        self.x[rows] += self.speed_x[rows] * step
+        self.y[rows] += self.speed_y[rows] * step
+        # Decremento de lifetime ajustado por dt (normalizado para 60 FPS)
+        self.lifetime[rows] -= 16 * step
+
+        keep = self.lifetime[rows] > 0
+        if not keep.all():
+            self._compact(keep)
+
+    def _compact(self, keep):
+        """Leva as partículas onde keep é True para o começo dos arrays"""
+        count = self.count
+        remaining = int(keep.sum())
+        for array in (
+            self.x, self.y, self.speed_x, self.speed_y, self.lifetime, self.size, self.color
+        ):
+            array[:remaining] = array[:count][keep]
+        self.count = remaining
+
+    # === DESENHO ===
+
+    def draw(self, surface):
+        count = self.count
+        if count == 0:
+            return
+        rows = slice(0, count)
+        alpha = (self.lifetime[rows] / self.MAX_LIFETIME * 255).astype(int)
+        visible = alpha > 0
+        if not visible.any():
+            return
+
+        size = self.size[rows][visible]
+        level = np.minimum(alpha[visible] * self.ALPHA_LEVELS // 256, self.ALPHA_LEVELS - 1)
+        xs = (self.x[rows][visible] - size).astype(int).tolist()
+        ys = (self.y[rows][visible] - size).astype(int).tolist()
+
+        sprites = self.sprites
+        blits = []
+        for key, x, y in zip(
+            zip(size.tolist(), self.color[rows][visible].tolist(), level.tolist()), xs, ys
+        ):
+            sprite = sprites.get(key)
+            if sprite is None:
+                sprite = sprites[key] = self._render_sprite(*key)
+            blits.append((sprite, (x, y)))
+        surface.blits(blits, doreturn=False)
+
+    def _render_sprite(self, size, color, level):
+        """Círculo de raio size, na cor da paleta, com a opacidade da faixa"""
+        alpha = (level + 1) * 256 // self.ALPHA_LEVELS - 1
+        sprite = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+        pygame.draw.circle(sprite, (*self.PALETTE[color], alpha), (size, size), size)
+        return sprite
@@ -0,0 +1,115 @@
+import numpy as np
+import pygame
+
+
+class RocketTrail:
+    """
+    Rastro de fumaça de todos os foguetes de um jogador.
+
+    As partículas ficam num buffer circular de tamanho fixo (arrays NumPy de
+    floats): cada partícula nova sobrescreve a mais antiga, sem criar nem
+    remover nada. Todas andam de uma vez em update() e são desenhadas com
+    um só blits(), então o custo por quadro é o mesmo com um ou vários
+    foguetes no ar.
+
+    Tamanho, cor e opacidade de uma partícula só dependem de quanto da vida
+    ela já gastou: as rampas são calculadas uma vez, com um sprite por
+    degrau, e compartilhadas por todos os rastros.
+
+    O rastro é só visual: não entra nos snapshots.
+    """
+
+    CAPACITY = 128  # Partículas no buffer (~15 por foguete no ar)
+    LIFETIME = 25  # Duração em frames (a 60 FPS)
+    BASE_COLOR = (255, 100, 0)  # Laranja mais forte no início
+    MAX_SIZE = 8  # Tamanho máximo inicial das partículas
+    MIN_SIZE = 1  # Tamanho mínimo no final
+    STEPS = 32  # Degraus das rampas de tamanho/cor/opacidade ao longo da vida
+    _sprites = None  # (sprite, raio) por degrau, compartilhados por todos os rastros
+
+    def __init__(self):
+        capacity = self.CAPACITY
+        self.x = np.zeros(capacity)
+        self.y = np.zeros(capacity)
+        self.drift = np.zeros(capacity)  # Movimento horizontal aleatório
+        self.lifetime = np.zeros(capacity)  # 0: posição livre
+        self.head = 0  # Onde entra a próxima partícula (a mais antiga)
+        self._slots = np.arange(capacity)
+
+    @classmethod
+    def _get_sprites(cls):
+        if cls._sprites is None:
+            red, green, blue = cls.BASE_COLOR
+            sprites = []
+            for step in range(cls.STEPS):
+                life_progress = step / cls.STEPS
+
+                # Diminuição do tamanho
+                size = max(1, int(cls.MAX_SIZE - life_progress * (cls.MAX_SIZE - cls.MIN_SIZE)))
+
+                # Mudança de cor (de laranja para amarelo)
+                fade_progress = life_progress**0.5  # Suaviza a transição
+                color = (
+                    int(red * (1 - fade_progress * 0.7)),
+                    int(green * (0.8 + fade_progress * 0.5)),
+                    int(blue * (0.3 + fade_progress * 0.7)),
+                )
+
+                # Alpha baseado no tempo de vida restante
+                alpha = int(255 * (1 - life_progress) ** 0.7)
+
+                sprite = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+                pygame.draw.circle(sprite, (*color, alpha), (size, size), size)
+                sprites.append((sprite, size))
+            cls._sprites = sprites
+        return cls._sprites
+
+    def __len__(self):
+        return int(np.count_nonzero(self.lifetime))
+
+    def clear(self):
+        self.lifetime.fill(0)
+        self.head = 0
+
+    def emit(self, x, y, drift):
+        """Adiciona uma partícula em (x, y) no lugar da mais antiga"""
+        head = self.head
+        self.x[head] = x
+        self.y[head] = y
+        self.drift[head] = drift
+        self.lifetime[head] = self.LIFETIME
+        self.head = (head + 1) % self.CAPACITY
+
+    def update(self, dt=1/60):
+        step = 60 * dt  # Normalizado para 60 FPS
+        lifetime = self.lifetime
+        lifetime -= step
+        np.maximum(lifetime, 0, out=lifetime)
+
+        # Progressão da vida (0 a 1); as posições livres também andam,
+        # mas não são desenhadas
+        life_progress = 1 - lifetime / self.LIFETIME
+
+        # Movimento para baixo com desaceleração
+        self.y += (1 + 2 * life_progress) * step
+
+        # Movimento horizontal aleatório suave
+        self.x += self.drift * (0.5 + life_progress) * step
+
+    def draw(self, surface):
+        # Da partícula mais antiga para a mais nova
+        order = (self._slots + self.head) % self.CAPACITY
+        lifetime = self.lifetime[order]
+        alive = lifetime > 0
+        if not alive.any():
+            return
+        order = order[alive]
+        steps = ((1 - lifetime[alive] / self.LIFETIME) * self.STEPS).astype(int)
+        np.minimum(steps, self.STEPS - 1, out=steps)
+
+        sprites = self._get_sprites()
+        blits = []
+        for step, x, y in zip(steps.tolist(), self.x[order].tolist(), self.y[order].tolist()):
+            sprite, size = sprites[step]
+            blits.append((sprite, (int(x - size), int(y - size))))
+        surface.blits(blits, doreturn=False)
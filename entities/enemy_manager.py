@@ -0,0 +1,1005 @@
+import math
+from bisect import bisect_left, bisect_right
+from functools import partial
+from operator import attrgetter
+
+import numpy as np
+
+from config.constants import SHOW_HITBOX
+from entities.enemy_car import EnemyCar, MOVEMENT_PATTERNS, PATTERN_WAVES
+from entities.traffic_lanes import TrafficLanes
+from utils.object_pool import ObjectPool
+from utils.spatial_hash import SpatialHash
+
+
+def wave_tables():
+    """
+    Converte PATTERN_WAVES em duas tabelas (padrão x onda) para o NumPy.
+
+    Padrões com menos ondas são completados com fator 0, que não muda a soma.
+
+    Returns:
+        (frequências, fatores), arrays float com uma linha por padrão
+        (na ordem de MOVEMENT_PATTERNS)
+    """
+    count = max(len(waves) for waves in PATTERN_WAVES.values())
+    rows = [PATTERN_WAVES[name] + ((0, 0),) * (count - len(PATTERN_WAVES[name])) for name in MOVEMENT_PATTERNS]
+    frequency = np.array([[wave[0] for wave in row] for row in rows], dtype=float)
+    factor = np.array([[wave[1] for wave in row] for row in rows], dtype=float)
+    return frequency, factor
+
+
+_by_index = attrgetter("index")
+
+
+class EnemyManager:
+    """
+    Guarda os carros inimigos de um GameWorld em arrays NumPy.
+
+    Cada inimigo é uma linha dos arrays (y, base_x, offset lateral, fase,
+    oscilação, padrão...) e todos são atualizados de uma vez por update().
+    Os objetos EnemyCar viram "vistas" de uma linha: têm imagem e rect para
+    desenho e colisão, mas o estado mora aqui.
+
+    As linhas ficam na ordem de criação, igual à antiga lista de inimigos,
+    e update() segue as mesmas regras do antigo EnemyCar.update() chamado
+    carro por carro (inclusive a ordem dos sorteios), então partidas com a
+    mesma semente e replays gravados antes continuam iguais.
+
+    Para o resto do jogo o manager se comporta como a lista de antes:
+    len(), for, [índice] e remove() funcionam normalmente.
+
+    O manager também mantém um índice espacial (SpatialHash) com o rect de
+    cada carro, para que colisões com foguetes e com o jogador consultem só
+    os carros próximos (ver colliding e nearby).
+
+    As vistas dos carros que saem do jogo vão para um ObjectPool e são
+    reaproveitadas pelos próximos spawns (com o mesmo rect e hitbox).
+    """
+
+    # Campos de cada inimigo (um array por campo)
+    FLOAT_FIELDS = (
+        "x",
+        "y",
+        "prev_x",
+        "prev_y",
+        "speed",
+        "base_x",
+        "lateral_offset",
+        "oscillation_speed",
+        "oscillation_amplitude",
+        "time_offset",
+        "time",
+        "target_lane",  # NaN = não está trocando de faixa
+        "lane_change_speed",
+        "lane_change_trigger_y",  # NaN = carro que não troca de faixa
+    )
+    INT_FIELDS = (
+        "pattern",
+        "width",
+        "height",
+        "rect_x",
+        "rect_y",
+        # Células do índice espacial onde o carro foi registrado por último
+        "cell_left",
+        "cell_top",
+        "cell_right",
+        "cell_bottom",
+    )
+    BOOL_FIELDS = ("is_changing_lane", "can_change_lane", "frozen")
+    # Ondas do padrão de cada carro (uma coluna por onda, ver wave_tables)
+    WAVE_FIELDS = ("wave_frequency", "wave_amplitude")
+
+    INITIAL_CAPACITY = 16
+    # A partir de quantos carros compensa atualizar com NumPy (ver update)
+    VECTORIZE_MIN_ENEMIES = 48
+    # Lado das células do índice espacial (da ordem da largura de um carro)
+    GRID_CELL_SIZE = 64
+    # A partir de quantos carros compensa consultar o índice espacial.
+    # Abaixo disso, testar todos os rects de uma vez (collidelistall, em C)
+    # é mais barato que a consulta em Python: ~1 µs por foguete com 128
+    # carros, contra ~1,4 µs da grade mais a atualização dela a cada passo
+    GRID_MIN_ENEMIES = 256
+
+    def __init__(self, lanes, screen_height, rng):
+        """
+        Args:
+            lanes: Posições X das faixas (para a troca de faixa)
+            screen_height: Altura da tela (inimigos abaixo dela são removidos)
+            rng: Gerador aleatório da IA (stream "enemy_ai" da partida)
+        """
+        self.lanes = list(lanes)
+        self.lanes_array = np.array(self.lanes, dtype=float)
+        self.screen_height = screen_height
+        self.rng = rng
+        self.pattern_frequency, self.pattern_factor = wave_tables()
+        # Fila de cada faixa ordenada por y (regra do carro da frente)
+        self.traffic = TrafficLanes(
+            self.lanes, EnemyCar.SAME_LANE_DISTANCE, EnemyCar.MAX_LATERAL_MOVEMENT
+        )
+        self.grid = SpatialHash(self.GRID_CELL_SIZE)
+        self.grid_dirty = False  # Algum rect mudou desde a última consulta
+        self.lanes_dirty = False  # Algum y mudou desde a última ordenação das filas
+
+        self.max_speed = 0.0  # Maior velocidade já vista (limite do passo de um carro)
+        self.cars = []  # Vistas EnemyCar, uma por linha, na mesma ordem
+        # Vistas de carros que saíram, reaproveitadas pelos próximos spawns
+        self.view_pool = ObjectPool(partial(EnemyCar, self))
+        self.rects = []  # rect de cada vista (para collidelistall)
+        self.count = 0
+        self._allocate(self.INITIAL_CAPACITY)
+
+    def _allocate(self, capacity):
+        """Cria (ou aumenta) os arrays, mantendo as linhas existentes"""
+        waves = self.pattern_frequency.shape[1]
+        for fields, shape, dtype, fill in (
+            (self.FLOAT_FIELDS, capacity, float, 0.0),
+            (self.INT_FIELDS, capacity, int, 0),
+            (self.BOOL_FIELDS, capacity, bool, False),
+            (self.WAVE_FIELDS, (capacity, waves), float, 0.0),
+        ):
+            for name in fields:
+                array = np.full(shape, fill, dtype=dtype)
+                if self.count:
+                    array[:self.count] = getattr(self, name)[:self.count]
+                setattr(self, name, array)
+        self.capacity = capacity
+
+        # memoryviews dos campos que o caminho carro por carro lê e grava:
+        # cada item é lido/escrito como float/int/bool do Python, direto no
+        # array, sem copiar os arrays para listas e de volta a cada passo
+        self.item_views = tuple(
+            memoryview(getattr(self, name))
+            for name in (
+                "x",
+                "y",
+                "base_x",
+                "lateral_offset",
+                "time",
+                "target_lane",
+                "rect_x",
+                "rect_y",
+                "is_changing_lane",
+                "can_change_lane",
+                "frozen",
+            )
+        )
+
+    # === INTERFACE DE LISTA ===
+
+    def __len__(self):
+        return self.count
+
+    def __iter__(self):
+        return iter(self.cars)
+
+    def __getitem__(self, index):
+        # Fatias devolvem uma lista (cópia), como enemies[:] fazia antes
+        return self.cars[index]
+
+    def remove(self, enemy):
+        """Remove um inimigo (ex: atingido por um foguete)"""
+        keep = np.ones(self.count, dtype=bool)
+        keep[enemy.index] = False
+        self._compact(keep)
+
+    def clear(self):
+        self.traffic.clear()
+        self.view_pool.release_all(self.cars)
+        self.cars = []
+        self.rects = []
+        self.count = 0
+        self.grid.clear()
+        self.grid_dirty = False
+
+    # === CONSULTAS DE COLISÃO ===
+
+    def nearby(self, rect):
+        """
+        Inimigos que podem colidir com o rect.
+
+        Com poucos carros devolve todos; com muitos, só os que estão nas
+        células do índice espacial que o rect cobre.
+
+        Returns:
+            Candidatos na ordem da lista (a colisão exata fica com quem chama)
+        """
+        if self.count < self.GRID_MIN_ENEMIES:
+            return list(self.cars)
+
+        if self.grid_dirty:
+            self._refresh_grid()
+        return sorted(self.grid.query(rect), key=_by_index)
+
+    def colliding(self, rect):
+        """
+        Returns:
+            Inimigos cujo rect colide com rect, na ordem da lista
+        """
+        if self.count < self.GRID_MIN_ENEMIES:
+            cars = self.cars
+            return [cars[index] for index in rect.collidelistall(self.rects)]
+
+        if self.grid_dirty:
+            self._refresh_grid()
+        hits = [enemy for enemy in self.grid.query(rect) if rect.colliderect(enemy.rect)]
+        if len(hits) > 1:
+            hits.sort(key=_by_index)
+        return hits
+
+    def _refresh_grid(self):
+        """
+        Leva as posições atuais para o índice espacial.
+
+        Feito só na primeira consulta depois que os carros andaram (uma vez
+        por passo, não importa quantos foguetes consultem). As células de
+        todos os carros são calculadas de uma vez com NumPy, e só quem
+        trocou de célula (um carro leva vários passos para atravessar uma)
+        mexe na grade.
+        """
+        count = self.count
+        rows = slice(0, count)
+        size = self.GRID_CELL_SIZE
+        left = self.rect_x[rows]
+        top = self.rect_y[rows]
+        cells = (
+            left // size,
+            top // size,
+            (left + self.width[rows] - 1) // size,
+            (top + self.height[rows] - 1) // size,
+        )
+        stored = (self.cell_left, self.cell_top, self.cell_right, self.cell_bottom)
+
+        moved = np.zeros(count, dtype=bool)
+        for new, old in zip(cells, stored):
+            moved |= new != old[rows]
+        if moved.any():
+            for new, old in zip(cells, stored):
+                old[rows] = new
+            grid = self.grid
+            cars = self.cars
+            for index in np.flatnonzero(moved).tolist():
+                grid.update(cars[index], cars[index].rect)
+        self.grid_dirty = False
+
+    # === OCUPAÇÃO DAS FAIXAS (REGRAS DE SPAWN) ===
+
+    def lane_taken(self, lane, above_y):
+        """
+        Algum inimigo está exatamente na faixa (rect.x == lane) acima de
+        above_y (rect.y < above_y)?
+
+        Olha só o começo (topo) das filas perto da faixa: quem está com o
+        rect em lane tem a faixa a no máximo MAX_LATERAL_MOVEMENT (+1 do
+        arredondamento), e as filas estão em ordem de y.
+        """
+        self._sort_lanes()
+        queues = self.traffic.queues
+        reach = EnemyCar.MAX_LATERAL_MOVEMENT + 1
+        first, last = self.traffic.lanes_between(lane - reach, lane + reach)
+        for lane_index in range(first, last + 1):
+            for car in queues[lane_index]:
+                rect = car.rect
+                if rect.y >= above_y:
+                    break
+                if rect.x == lane:
+                    return True
+        return False
+
+    def visible(self, top, bottom):
+        """
+        Inimigos com top < rect.y < bottom.
+
+        Returns:
+            Lista na ordem da lista de inimigos (ordem de criação)
+        """
+        self._sort_lanes()
+        found = []
+        for queue, keys in zip(self.traffic.queues, self.traffic.keys):
+            # rect.y é o y arredondado: quem tem y <= top - 1 fica de fora
+            position = bisect_right(keys, top - 1)
+            while position < len(queue):
+                car = queue[position]
+                rect_y = car.rect.y
+                if rect_y >= bottom:
+                    break
+                if rect_y > top:
+                    found.append(car)
+                position += 1
+        # Quem está trocando de faixa aparece em mais de uma fila
+        return sorted(set(found), key=_by_index)
+
+    # === CRIAÇÃO ===
+
+    def spawn(self, image, x_pos, speed=EnemyCar.BASE_SPEED):
+        """
+        Cria um inimigo acima da tela, na faixa x_pos.
+
+        Os sorteios são feitos na mesma ordem do antigo construtor do
+        EnemyCar, para não mudar o tráfego de uma semente.
+
+        Returns:
+            A vista EnemyCar do novo inimigo
+        """
+        rng = self.rng
+
+        # Cada carro tem velocidade única (70% a 130% da base), criando tráfego realista
+        varied_speed = speed * rng.uniform(*EnemyCar.SPEED_VARIATION)
+
+        # Parâmetros de oscilação (únicos para cada carro)
+        oscillation_speed = rng.uniform(*EnemyCar.OSCILLATION_SPEED_RANGE)
+        oscillation_amplitude = rng.uniform(*EnemyCar.OSCILLATION_AMPLITUDE_RANGE)
+        time_offset = rng.uniform(0, math.pi * 2)  # Fase inicial (para variar)
+
+        # Padrão de movimento (cada carro tem um estilo diferente)
+        movement_pattern = rng.choice(MOVEMENT_PATTERNS)
+        if movement_pattern in EnemyCar.PATTERN_TUNING:
+            speed_factor, amplitude_factor = EnemyCar.PATTERN_TUNING[movement_pattern]
+            oscillation_speed *= speed_factor
+            oscillation_amplitude *= amplitude_factor
+
+        # Apenas alguns carros podem trocar de faixa
+        can_change_lane = rng.random() < EnemyCar.LANE_CHANGE_CHANCE
+        trigger_y = None
+        if can_change_lane:
+            trigger_y = rng.randint(*EnemyCar.LANE_CHANGE_TRIGGER_RANGE)
+
+        state = (
+            x_pos,
+            -image.get_height(),  # Começa logo acima da tela
+            varied_speed,
+            x_pos,
+            0,
+            oscillation_speed,
+            oscillation_amplitude,
+            time_offset,
+            0,
+            movement_pattern,
+            False,
+            None,
+            varied_speed * EnemyCar.LANE_CHANGE_SPEED_FACTOR,
+            can_change_lane,
+            trigger_y,
+            False,
+        )
+        return self.add(image, state)
+
+    def add(self, image, state):
+        """
+        Cria um inimigo a partir de um estado salvo (ver get_state).
+
+        Returns:
+            A vista EnemyCar do novo inimigo
+        """
+        if self.count == self.capacity:
+            self._allocate(self.capacity * 2)
+        index = self.count
+        self.count += 1
+
+        self.width[index], self.height[index] = image.get_size()
+        self.set_state(index, state)
+
+        enemy = self.view_pool.acquire(index, image)
+        self.cars.append(enemy)
+        self.rects.append(enemy.rect)
+        self.traffic.note_width(int(self.width[index]))
+        self._place_in_lanes(enemy)
+        self.grid_dirty = True
+        return enemy
+
+    def read_fixed_params(self, index):
+        """
+        Parâmetros que não mudam depois da criação, já como números Python.
+
+        Guardados na vista para que a atualização carro por carro não precise
+        ler esses arrays a cada passo. As ondas vêm como pares (frequência,
+        amplitude), só as do padrão do carro (sem as de fator 0 que
+        completam a tabela, ver wave_tables).
+        """
+        waves = len(PATTERN_WAVES[MOVEMENT_PATTERNS[self.pattern[index]]])
+        return (
+            float(self.speed[index]),
+            float(self.lane_change_trigger_y[index]),
+            float(self.lane_change_speed[index]),
+            float(self.oscillation_speed[index]),
+            float(self.time_offset[index]),
+            list(
+                zip(
+                    self.wave_frequency[index, :waves].tolist(),
+                    self.wave_amplitude[index, :waves].tolist(),
+                )
+            ),
+            int(self.height[index]) + EnemyCar.FOLLOW_DISTANCE,
+        )
+
+    # === SNAPSHOTS ===
+
+    def get_state(self, index):
+        """
+        Estado de um inimigo para snapshots (ver GameWorld.snapshot).
+
+        Mesma tupla que o EnemyCar guardava antes do manager, para que os
+        keyframes de replays antigos continuem carregando.
+        """
+        target_lane = self.target_lane[index]
+        trigger_y = self.lane_change_trigger_y[index]
+        return (
+            float(self.x[index]),
+            float(self.y[index]),
+            float(self.speed[index]),
+            float(self.base_x[index]),
+            float(self.lateral_offset[index]),
+            float(self.oscillation_speed[index]),
+            float(self.oscillation_amplitude[index]),
+            float(self.time_offset[index]),
+            float(self.time[index]),
+            MOVEMENT_PATTERNS[self.pattern[index]],
+            bool(self.is_changing_lane[index]),
+            None if math.isnan(target_lane) else float(target_lane),
+            float(self.lane_change_speed[index]),
+            bool(self.can_change_lane[index]),
+            None if math.isnan(trigger_y) else int(trigger_y),
+            bool(self.frozen[index]),
+        )
+
+    def set_state(self, index, state):
+        (
+            x,
+            y,
+            self.speed[index],
+            self.base_x[index],
+            self.lateral_offset[index],
+            self.oscillation_speed[index],
+            self.oscillation_amplitude[index],
+            self.time_offset[index],
+            self.time[index],
+            movement_pattern,
+            self.is_changing_lane[index],
+            target_lane,
+            self.lane_change_speed[index],
+            self.can_change_lane[index],
+            trigger_y,
+            self.frozen[index],
+        ) = state
+        self.max_speed = max(self.max_speed, float(self.speed[index]))
+        pattern = self.pattern[index] = MOVEMENT_PATTERNS.index(movement_pattern)
+        self.wave_frequency[index] = self.pattern_frequency[pattern]
+        self.wave_amplitude[index] = self.oscillation_amplitude[index] * self.pattern_factor[pattern]
+        self.target_lane[index] = math.nan if target_lane is None else target_lane
+        self.lane_change_trigger_y[index] = math.nan if trigger_y is None else trigger_y
+
+        # Teletransporte: sem interpolação a partir da posição antiga
+        self.x[index] = self.prev_x[index] = x
+        self.y[index] = self.prev_y[index] = y
+        self.rect_x[index] = round(x)
+        self.rect_y[index] = round(y)
+        # Intervalo vazio: o próximo _refresh_grid registra o carro de novo
+        self.cell_left[index], self.cell_right[index] = 0, -1
+        if index < len(self.cars):
+            enemy = self.cars[index]
+            enemy.rect.topleft = (int(self.rect_x[index]), int(self.rect_y[index]))
+            enemy.fixed_params = self.read_fixed_params(index)
+            self.grid_dirty = True
+            self.lanes_dirty = True
+            self._place_in_lanes(enemy)
+
+    def _sort_lanes(self):
+        """
+        Deixa as filas das faixas em ordem do y atual (inclusive quem foi
+        teletransportado com set_position); quase sempre já estão, e a
+        ordenação é linear.
+        """
+        if not self.lanes_dirty:
+            return
+        self.traffic.resort(self.y[:self.count].tolist())
+        self.lanes_dirty = False
+
+    def _place_in_lanes(self, car):
+        """Coloca um carro nas filas das faixas que ele ocupa (ver TrafficLanes)"""
+        index = car.index
+        self.traffic.place(
+            car,
+            float(self.base_x[index]),
+            float(self.target_lane[index]),
+            float(self.y[index]),
+        )
+
+    # === ATUALIZAÇÃO ===
+
+    def save_previous_positions(self):
+        """Guarda as posições antes do passo de simulação (para interpolar)"""
+        count = self.count
+        self.prev_x[:count] = self.x[:count]
+        self.prev_y[:count] = self.y[:count]
+
+    def update(self, player_rect=None, dt=1 / 60):
+        """
+        Move todos os inimigos um passo e remove os que saíram da tela.
+
+        Regras (as mesmas do EnemyCar.update() de antes, carro por carro):
+        1. Desce speed * 60 * dt, a menos que fique perto demais de um carro
+           à frente na mesma faixa
+        2. Passando da altura de trigger (e longe do jogador), começa a
+           trocar de faixa
+        3. Trocando de faixa, desliza até a outra faixa; senão oscila
+           seguindo as ondas do seu padrão (PATTERN_WAVES)
+
+        Com poucos carros (o normal no jogo) cada operação NumPy custa mais
+        do que o cálculo em si, então abaixo de VECTORIZE_MIN_ENEMIES os
+        carros são atualizados um a um, com as mesmas regras. Os passos em
+        que a ordem carro a carro decide uma troca de faixa também vão por
+        esse caminho (ver _update_vectorized).
+
+        Args:
+            player_rect: Rect do jogador (não troca de faixa perto dele)
+            dt: Delta time (tempo desde o último frame)
+        """
+        if self.count == 0:
+            return
+        self.grid_dirty = True
+
+        if self.count >= self.VECTORIZE_MIN_ENEMIES:
+            self._sort_lanes()
+            if self._update_vectorized(player_rect, dt):
+                self._sync_rects()
+            else:
+                self._update_each(player_rect, dt)
+        else:
+            self._update_each(player_rect, dt)
+        self.lanes_dirty = True
+
+    def _update_each(self, player_rect, dt):
+        """
+        update() carro por carro (rápido com poucos carros).
+
+        Lê e grava os arrays item a item pelas memoryviews de item_views:
+        com 2 ou 3 carros, converter cada array para lista e de volta
+        custaria mais do que o passo inteiro.
+        """
+        (
+            x,
+            y,
+            base_x,
+            lateral_offset,
+            time,
+            target_lane,
+            rect_x,
+            rect_y,
+            changing,
+            can_change,
+            frozen,
+        ) = self.item_views
+        limit = EnemyCar.MAX_LATERAL_MOVEMENT
+        same_lane_distance = EnemyCar.SAME_LANE_DISTANCE
+        screen_height = self.screen_height
+
+        # As filas das faixas ficam na ordem de y do início do passo; quem já
+        # andou neste passo desceu no máximo max_step (+1 de folga)
+        traffic = self.traffic
+        queues = traffic.queues
+        lane_keys = traffic.keys
+        query_ranges = traffic.query_ranges
+        start_y = self.y[:self.count].tolist()
+        if self.lanes_dirty:
+            traffic.resort(start_y)
+            self.lanes_dirty = False
+        max_step = self.max_speed * 60 * dt + 1
+
+        cars = self.cars
+        present = [True] * len(cars)  # False = saiu da tela (já removido da lista)
+        any_gone = False
+        for index, car in enumerate(cars):
+            if not frozen[index]:
+                (
+                    speed,
+                    trigger_y,
+                    lane_change_speed,
+                    oscillation_speed,
+                    phase,
+                    waves,
+                    follow_limit,
+                ) = car.fixed_params
+                rect = car.rect
+                # Só desce se não ficar perto demais de um carro à frente.
+                # Os candidatos são os vizinhos de baixo na fila de cada faixa
+                # consultada, até passar da distância de seguimento. O rect
+                # de quem já andou neste passo já está na posição nova
+                new_y = y[index] + speed * 60 * dt
+                centerx = rect.centerx
+                blocked = False
+                for lane in query_ranges[car]:
+                    queue = queues[lane]
+                    # (filas curtas: mais barato começar do início)
+                    position = (
+                        bisect_left(lane_keys[lane], new_y - max_step)
+                        if len(queue) > 8
+                        else 0
+                    )
+                    while position < len(queue):
+                        other_car = queue[position]
+                        other = other_car.index
+                        if start_y[other] - new_y >= follow_limit:
+                            break  # Fila em ordem: os próximos estão mais longe
+                        if (
+                            other != index
+                            and present[other]
+                            and abs(centerx - other_car.rect.centerx) < same_lane_distance
+                            and 0 < y[other] - new_y < follow_limit
+                        ):
+                            blocked = True
+                            break
+                        position += 1
+                    if blocked:
+                        break
+                if not blocked:
+                    y[index] = new_y
+                car_y = y[index]
+
+                # Começa a trocar de faixa (longe do jogador)
+                if (
+                    can_change[index]
+                    and not changing[index]
+                    and car_y >= trigger_y
+                    and car_y >= EnemyCar.MIN_Y_FOR_LANE_CHANGE
+                    and (
+                        player_rect is None
+                        or abs(car_y - player_rect.y) >= EnemyCar.SAFE_DISTANCE_FROM_PLAYER
+                    )
+                ):
+                    other_lanes = [lane for lane in self.lanes if lane != base_x[index]]
+                    if other_lanes:
+                        target_lane[index] = self.rng.choice(other_lanes)
+                        changing[index] = True
+                        can_change[index] = False
+                        # Entra nas filas do caminho até a faixa alvo
+                        traffic.place(
+                            car, base_x[index], target_lane[index], start_y[index]
+                        )
+
+                if changing[index]:
+                    # Desliza até a faixa alvo
+                    diff = target_lane[index] - base_x[index]
+                    step = lane_change_speed * 60 * dt
+                    if abs(diff) > step:
+                        base_x[index] += (1 if diff > 0 else -1) * step
+                    else:
+                        base_x[index] = target_lane[index]
+                        changing[index] = False
+                        target_lane[index] = math.nan
+                        lateral_offset[index] = 0.0
+                        time[index] = 0.0
+                        # Chegou: fica só na fila da faixa nova
+                        traffic.place(car, base_x[index], math.nan, start_y[index])
+                else:
+                    # Oscila somando as ondas do padrão
+                    car_time = time[index] = time[index] + oscillation_speed * 60 * dt
+                    offset = 0.0
+                    for frequency, amplitude in waves:
+                        offset += math.sin(car_time * frequency + phase) * amplitude
+                    if offset > limit:
+                        offset = limit
+                    elif offset < -limit:
+                        offset = -limit
+                    lateral_offset[index] = offset
+
+                car_x = x[index] = base_x[index] + lateral_offset[index]
+                left = rect_x[index] = round(car_x)
+                top = rect_y[index] = round(car_y)
+                rect.topleft = (left, top)
+
+            if y[index] > screen_height:
+                present[index] = False
+                any_gone = True
+
+        if any_gone:
+            self._compact(np.array(present))
+
+    def _update_vectorized(self, player_rect, dt):
+        """
+        update() com todos os carros de uma vez (arrays NumPy).
+
+        Returns:
+            False se o passo precisa da ordem carro a carro (nada foi
+            mudado, e update() usa _update_each)
+        """
+        count = self.count
+        rows = slice(0, count)
+        active = ~self.frozen[rows]
+        y = self.y[rows]
+
+        # Converte a velocidade para delta time (mantém 60 FPS como base)
+        moved_y = y + self.speed[rows] * 60 * dt
+
+        # Oscilação lateral de quem não está trocando de faixa (ver PATTERN_WAVES)
+        new_time = self.time[rows] + self.oscillation_speed[rows] * 60 * dt
+        waves = np.sin(
+            new_time[:, None] * self.wave_frequency[rows] + self.time_offset[rows, None]
+        ) * self.wave_amplitude[rows]
+        limit = EnemyCar.MAX_LATERAL_MOVEMENT
+        wave_offset = np.maximum(np.minimum(waves.sum(axis=1), limit), -limit)
+
+        # Só calcula troca de faixa se algum carro pode começar ou está trocando
+        # (quem desce no máximo até moved_y não passa da altura de trigger)
+        changing = self.is_changing_lane[rows]
+        may_start = (
+            active
+            & self.can_change_lane[rows]
+            & ~changing
+            & (moved_y >= self.lane_change_trigger_y[rows])
+            & (moved_y >= EnemyCar.MIN_Y_FOR_LANE_CHANGE)
+        )
+        lane_changes = bool(may_start.any() or changing.any())
+
+        # Quem começa a trocar de faixa depende de ter descido, e quem desce
+        # depende da posição x dos carros da frente (que muda se eles
+        # começarem a trocar). Se algum carro começa só em um dos casos
+        # ("desceu" ou "ficou"), a ordem carro a carro importa: esse passo
+        # (raro, um por troca de faixa) vai para o caminho carro por carro
+        if lane_changes:
+            starts = self._lane_change_starts(may_start, moved_y, player_rect)
+            if (starts != self._lane_change_starts(may_start, y, player_rect)).any():
+                return False
+            lateral = self._lane_changes(starts, wave_offset, dt)
+            new_x = np.where(active, lateral[0] + lateral[1], self.x[rows])
+        else:
+            new_x = np.where(active, self.base_x[rows] + wave_offset, self.x[rows])
+
+        moved = self._resolve_following(active, moved_y, new_x) if count > 1 else active
+        new_y = np.where(moved, moved_y, y)
+
+        # === GRAVA O PASSO ===
+        if lane_changes:
+            new_base_x, new_offset, new_target, arrived, still_changing = lateral
+            self.time[rows] = np.where(
+                arrived, 0.0, np.where(active & ~(changing | starts), new_time, self.time[rows])
+            )
+            self.lateral_offset[rows] = np.where(active, new_offset, self.lateral_offset[rows])
+            self.base_x[rows] = new_base_x
+            self.target_lane[rows] = new_target
+            self.is_changing_lane[rows] = still_changing
+            self.can_change_lane[rows] &= ~starts
+        else:
+            self.time[rows] = np.where(active, new_time, self.time[rows])
+            self.lateral_offset[rows] = np.where(active, wave_offset, self.lateral_offset[rows])
+        self.x[rows] = new_x
+        self.y[rows] = new_y
+        self.rect_x[rows] = np.rint(new_x)
+        self.rect_y[rows] = np.rint(new_y)
+
+        # Quem começou ou terminou uma troca de faixa muda de fila
+        if lane_changes:
+            for index in np.flatnonzero(starts | arrived).tolist():
+                self._place_in_lanes(self.cars[index])
+
+        gone = new_y > self.screen_height
+        if gone.any():
+            self._compact(~gone)
+        return True
+
+    def _resolve_following(self, active, moved_y, new_x):
+        """
+        Decide quem desce neste passo (regra de distância do carro da frente).
+
+        Carro por carro, o carro i via os carros anteriores (j < i) já
+        atualizados e os posteriores ainda na posição antiga. A posição x
+        nova de cada carro já é conhecida; a y depende de ele ter descido.
+        Então cada par (i, j < i) é avaliado nos dois casos, "j desceu" e
+        "j ficou": se os dois bloqueiam (ou nenhum), o resultado já está
+        decidido, e só os pares que dependem de j são resolvidos em ordem.
+
+        Só entram os pares vizinhos nas filas das faixas (ver
+        _following_pairs), não todos contra todos.
+
+        Returns:
+            Array booleano: True para quem desce
+        """
+        count = self.count
+        rows = slice(0, count)
+        y = self.y[rows]
+        half_width = self.width[rows] // 2
+        follow_limit = self.height[rows] + EnemyCar.FOLLOW_DISTANCE
+        pair_i, pair_j = self._following_pairs(moved_y, follow_limit)
+        if len(pair_i) == 0:
+            return active
+        before = pair_j < pair_i
+        limit = follow_limit[pair_i]
+
+        # Mesma faixa: carros anteriores no x novo, os outros no x antigo
+        centerx = self.rect_x[rows] + half_width
+        new_centerx = np.rint(new_x).astype(int) + half_width
+        ahead_centerx = np.where(before, new_centerx[pair_j], centerx[pair_j])
+        same_lane = np.abs(centerx[pair_i] - ahead_centerx) < EnemyCar.SAME_LANE_DISTANCE
+
+        # Carros anteriores que saíram da tela já tinham sido removidos
+        gap = y[pair_j] - moved_y[pair_i]
+        block_stayed = (
+            same_lane
+            & (gap > 0)
+            & (gap < limit)
+            & ~(before & (y[pair_j] > self.screen_height))
+        )
+        gap = moved_y[pair_j] - moved_y[pair_i]
+        block_moved = (
+            same_lane
+            & before
+            & active[pair_j]
+            & (gap > 0)
+            & (gap < limit)
+            & ~(moved_y[pair_j] > self.screen_height)
+        )
+
+        blocked = np.zeros(count, dtype=bool)
+        blocked[pair_i[(block_stayed & ~before) | (block_stayed & block_moved)]] = True
+        moved = active & ~blocked
+
+        depends = before & (block_stayed ^ block_moved)
+        if depends.any():
+            # Pares em ordem crescente de i (e de j), como o laço carro a carro
+            moved = moved.tolist()
+            for i, j, blocks_if_moved in zip(
+                pair_i[depends].tolist(), pair_j[depends].tolist(), block_moved[depends].tolist()
+            ):
+                if moved[i] and moved[j] == blocks_if_moved:
+                    moved[i] = False
+            moved = np.array(moved)
+        return moved
+
+    def _following_pairs(self, moved_y, follow_limit):
+        """
+        Pares (i, j) em que o carro j pode bloquear o carro i.
+
+        Para cada faixa, os carros que consultam a fila dela buscam (com
+        searchsorted na fila, que está em ordem de y) só os carros entre
+        "logo atrás" (j pode ter descido até max_step neste passo) e a
+        distância de seguimento à frente, com 1 pixel de folga dos dois
+        lados (a regra exata é aplicada depois, em _resolve_following).
+
+        Returns:
+            (i, j): arrays de índices, sem repetição, ordenados por i e j
+        """
+        count = self.count
+        y = self.y[:count]
+        max_step = float((moved_y - y).max()) + 1  # +1 de folga de arredondamento
+
+        queriers = [[] for _ in self.traffic.queues]
+        for car in self.cars:
+            for lane in self.traffic.query_ranges[car]:
+                queriers[lane].append(car.index)
+
+        chunks = []
+        for queue, lane_queriers in zip(self.traffic.queues, queriers):
+            if not queue or not lane_queriers:
+                continue
+            members = np.array([car.index for car in queue])
+            member_y = y[members]
+            lane_queriers = np.array(lane_queriers)
+            low = np.searchsorted(member_y, moved_y[lane_queriers] - max_step, "left")
+            high = np.searchsorted(
+                member_y, moved_y[lane_queriers] + follow_limit[lane_queriers] + 1, "left"
+            )
+            sizes = high - low
+            total = int(sizes.sum())
+            if total == 0:
+                continue
+            # Junta os intervalos [low, high) de todos os carros em um array só
+            starts = np.repeat(low - np.cumsum(sizes) + sizes, sizes)
+            chunks.append(
+                np.repeat(lane_queriers, sizes) * count
+                + members[np.arange(total) + starts]
+            )
+        if not chunks:
+            return np.empty(0, dtype=int), np.empty(0, dtype=int)
+
+        keys = np.unique(np.concatenate(chunks))  # Ordena por (i, j) e tira repetidos
+        pair_i, pair_j = np.divmod(keys, count)
+        others = pair_i != pair_j
+        return pair_i[others], pair_j[others]
+
+    def _lane_change_starts(self, may_start, new_y, player_rect):
+        """Quem começa a trocar de faixa neste passo (já tendo descido até new_y)"""
+        rows = slice(0, self.count)
+        starts = (
+            may_start
+            & (new_y >= self.lane_change_trigger_y[rows])
+            & (new_y >= EnemyCar.MIN_Y_FOR_LANE_CHANGE)
+            # Precisa existir outra faixa para onde ir
+            & (self.lanes_array != self.base_x[rows, None]).any(axis=1)
+        )
+        if player_rect is not None:
+            # Não troca de faixa perto do jogador
+            starts &= np.abs(new_y - player_rect.y) >= EnemyCar.SAFE_DISTANCE_FROM_PLAYER
+        return starts
+
+    def _lane_changes(self, starts, wave_offset, dt):
+        """
+        Parte lateral do passo para quem troca de faixa.
+
+        Sorteia a faixa de destino de quem começa a trocar agora (na ordem
+        dos carros, como antes) e desliza quem está trocando.
+
+        Returns:
+            (base_x, offset lateral, faixa alvo, chegou, continua trocando),
+            um array por item
+        """
+        rows = slice(0, self.count)
+        base_x = self.base_x[rows]
+
+        target = self.target_lane[rows].copy()
+        for index in np.flatnonzero(starts).tolist():
+            target[index] = self.rng.choice([lane for lane in self.lanes if lane != base_x[index]])
+
+        changing = self.is_changing_lane[rows] | starts
+        lane_step = self.lane_change_speed[rows] * 60 * dt
+        diff = target - base_x
+        arrived = changing & (np.abs(diff) <= lane_step)
+        still_changing = changing & ~arrived
+
+        new_base_x = np.where(
+            arrived, target, np.where(still_changing, base_x + np.sign(diff) * lane_step, base_x)
+        )
+        # Chegando na nova faixa o offset lateral volta a zero
+        new_offset = np.where(
+            changing, np.where(arrived, 0.0, self.lateral_offset[rows]), wave_offset
+        )
+        return (
+            new_base_x,
+            new_offset,
+            np.where(still_changing, target, np.nan),
+            arrived,
+            still_changing,
+        )
+
+    def _compact(self, keep):
+        """
+        Remove as linhas onde keep é False, mantendo a ordem das outras.
+
+        Args:
+            keep: Array booleano com uma posição por inimigo
+        """
+        count = self.count
+        remaining = int(keep.sum())
+        for name in self.FLOAT_FIELDS + self.INT_FIELDS + self.BOOL_FIELDS + self.WAVE_FIELDS:
+            array = getattr(self, name)
+            array[:remaining] = array[:count][keep]
+
+        cars = []
+        gone = []
+        for car, kept in zip(self.cars, keep.tolist()):
+            if kept:
+                cars.append(car)
+            else:
+                gone.append(car)
+                self.grid.remove(car)
+        self.traffic.discard(gone)
+        self.view_pool.release_all(gone)
+        self.cars = cars
+        self.rects = [car.rect for car in cars]
+        for index, car in enumerate(self.cars):
+            car.index = index
+        self.count = remaining
+
+    def _sync_rects(self):
+        """Copia as posições inteiras para o rect de cada vista"""
+        count = self.count
+        for car, rect_x, rect_y in zip(
+            self.cars, self.rect_x[:count].tolist(), self.rect_y[:count].tolist()
+        ):
+            car.rect.topleft = (rect_x, rect_y)
+
+    # === DESENHO ===
+
+    def draw(self, surface, alpha=1.0):
+        """Desenha todos os inimigos (posições interpoladas) com um só blits()"""
+        count = self.count
+        if count == 0:
+            return
+        prev_x = self.prev_x[:count]
+        prev_y = self.prev_y[:count]
+        xs = np.rint(prev_x + (self.x[:count] - prev_x) * alpha).astype(int).tolist()
+        ys = np.rint(prev_y + (self.y[:count] - prev_y) * alpha).astype(int).tolist()
+        surface.blits(
+            [(car.image, (x, y)) for car, x, y in zip(self.cars, xs, ys)], doreturn=False
+        )
+        if SHOW_HITBOX:
+            for car in self.cars:
+                car.hitbox.draw_hitbox(surface)
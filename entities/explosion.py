@@ -1,41 +1,143 @@
+import weakref
+
 import pygame
-from entities.effects.particula import Particle
+from entities.effects.particle_system import ParticleSystem
+
 
 class Explosion:
-    def __init__(self, img_config):
-        self.animation_frames = [
-            pygame.transform.scale(img_config.explosion_1, (80, 80)),
-            pygame.transform.scale(img_config.explosion_2, (120, 120)),
-            pygame.transform.scale(img_config.explosion_3, (160, 160))
-        ]
+    """
+    Uma animação de explosão (um slot do ExplosionManager).
+
+    Os quadros já vêm escalados e são os mesmos para todos os slots; cada
+    slot só guarda o quadro atual, a posição e o seu próprio relógio (o
+    tempo da última troca de quadro).
+    """
+
+    ANIMATION_SPEED = 100  # ms entre frames
+
+    def __init__(self, frames):
+        """
+        Args:
+            frames: Quadros da animação, já escalados (compartilhados)
+        """
+        self.animation_frames = frames
         self.current_frame = 0
         self.active = False
         self.position = (0, 0)
-        self.animation_speed = 100  # ms entre frames
         self.last_update = 0
 
-    def trigger(self, x, y, particle_count=30):
+    def trigger(self, x, y, now):
         self.active = True
         self.current_frame = 0
-        self.last_update = pygame.time.get_ticks()
+        self.last_update = now
         self.position = (x, y)
 
-    def update(self, dt=1/60):
+    def get_state(self):
+        """Estado mínimo para snapshots (ver GameWorld.snapshot)"""
+        return (self.active, self.current_frame, self.position, self.last_update)
+
+    def set_state(self, state):
+        self.active, self.current_frame, self.position, self.last_update = state
+
+    def update(self, now):
         if not self.active:
             return
-            
-        now = pygame.time.get_ticks()
-        if now - self.last_update > self.animation_speed:
+
+        if now - self.last_update > self.ANIMATION_SPEED:
             self.last_update = now
             self.current_frame += 1
-            
+
             if self.current_frame >= len(self.animation_frames):
                 self.active = False
 
     def draw(self, surface):
         if not self.active:
             return
-            
+
         frame = self.animation_frames[self.current_frame]
         rect = frame.get_rect(center=self.position)
-        surface.blit(frame, rect)
\ No newline at end of file
+        surface.blit(frame, rect)
+
+
+class ExplosionManager:
+    """
+    Várias explosões ao mesmo tempo, em um número fixo de slots.
+
+    Uma rajada de foguetes que destrói três carros mostra três explosões,
+    cada uma no seu lugar e no seu tempo. Com todos os slots ocupados, a
+    explosão mais antiga dá lugar à nova, então o custo por quadro tem um
+    teto. Os quadros são escalados uma vez e reaproveitados por todos os
+    slots (e pelos próximos GameWorld criados com o mesmo ImgConfig).
+    """
+
+    MAX_EXPLOSIONS = 8  # Slots de animação
+    FRAME_SIZES = (80, 120, 160)  # Tamanho de cada quadro da animação
+    _frame_cache = weakref.WeakKeyDictionary()  # ImgConfig -> quadros escalados
+
+    def __init__(self, img_config, clock, particles=None):
+        """
+        Args:
+            img_config: Configuração de imagens (quadros da explosão)
+            clock: Relógio da simulação
+            particles: ParticleSystem das faíscas (None = cria um sem semente)
+        """
+        self.clock = clock
+        self.particles = particles if particles is not None else ParticleSystem()
+        frames = self._scaled_frames(img_config)
+        self.explosions = []  # Slots em uso, do mais antigo para o mais novo
+        self.free = [Explosion(frames) for _ in range(self.MAX_EXPLOSIONS)]
+
+    @classmethod
+    def _scaled_frames(cls, img_config):
+        frames = cls._frame_cache.get(img_config)
+        if frames is None:
+            images = (img_config.explosion_1, img_config.explosion_2, img_config.explosion_3)
+            frames = cls._frame_cache[img_config] = [
+                pygame.transform.scale(image, (size, size))
+                for image, size in zip(images, cls.FRAME_SIZES)
+            ]
+        return frames
+
+    def __len__(self):
+        return len(self.explosions)
+
+    def trigger(self, x, y, particle_count=30):
+        """Começa uma explosão em (x, y) com particle_count faíscas"""
+        if self.free:
+            explosion = self.free.pop()
+        else:
+            explosion = self.explosions.pop(0)  # A mais antiga dá lugar à nova
+        explosion.trigger(x, y, self.clock.get_ticks())
+        self.explosions.append(explosion)
+        self.particles.emit(x, y, particle_count)
+
+    def get_state(self):
+        """Estado das explosões em andamento (da mais antiga para a mais nova)"""
+        return [explosion.get_state() for explosion in self.explosions]
+
+    def set_state(self, states):
+        self.free.extend(self.explosions)
+        self.explosions.clear()
+        for state in states:
+            explosion = self.free.pop()
+            explosion.set_state(state)
+            self.explosions.append(explosion)
+        # Partículas são só visuais e não entram no snapshot
+        self.particles.clear()
+
+    def update(self, dt=1/60):
+        self.particles.update(dt)
+
+        # Explosões que terminaram voltam para os slots livres
+        now = self.clock.get_ticks()
+        for explosion in self.explosions[:]:
+            explosion.update(now)
+            if not explosion.active:
+                self.explosions.remove(explosion)
+                self.free.append(explosion)
+
+    def draw(self, surface):
+        for explosion in self.explosions:
+            explosion.draw(surface)
+        # As faíscas continuam depois que a animação termina
+        self.particles.draw(surface)
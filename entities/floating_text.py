@@ -1,36 +1,62 @@
-import pygame
+from utils.font_registry import get_font
 
 
 class FloatingText:
-    """Texto flutuante que sobe e desaparece (ex: pontos ganhos)"""
+    """
+    Texto flutuante que sobe e desaparece (ex: pontos ganhos).
 
-    def __init__(self, text, x, y, color=(255, 215, 0), font_size=24, duration=1500):
+    O texto é renderizado uma vez por (texto, tamanho, cor) e a mesma
+    superfície é compartilhada por todos os textos iguais na tela; o
+    esmaecimento só muda o alpha da superfície na hora do blit.
+    """
+
+    _surfaces = {}  # (texto, tamanho, cor) -> superfície renderizada
+
+    def __init__(self, text, x, y, clock, color=(255, 215, 0), font_size=24, duration=1500):
         """
         text: texto a ser exibido (ex: "+20")
         x, y: posição inicial
+        clock: relógio da simulação (GameClock)
         color: cor do texto (padrão: dourado)
         font_size: tamanho da fonte
         duration: duração em ms até desaparecer
         """
+        self.reset(text, x, y, clock, color, font_size, duration)
+
+    @classmethod
+    def _render(cls, text, font_size, color):
+        """Superfície do texto, renderizada só na primeira vez"""
+        key = (text, font_size, color)
+        surface = cls._surfaces.get(key)
+        if surface is None:
+            surface = cls._surfaces[key] = get_font(font_size).render(text, True, color)
+        return surface
+
+    def reset(self, text, x, y, clock, color=(255, 215, 0), font_size=24, duration=1500):
+        """
+        Deixa um texto novo ou reaproveitado (ObjectPool do GameWorld) igual
+        a um recém-criado.
+        """
         self.text = text
         self.x = x
         self.y = y
+        self.prev_y = y  # Posição no passo anterior (para interpolar o desenho)
         self.start_y = y
         self.color = color
         self.font_size = font_size
         self.duration = duration
-        self.birth_time = pygame.time.get_ticks()
+        self.clock = clock
+        self.birth_time = self.clock.get_ticks()
         self.alpha = 255  # Opacidade inicial
         self.rise_speed = 0.5  # Velocidade de subida
         
-        # Cria a fonte e renderiza o texto
-        self.font = pygame.font.Font(None, font_size)
-        self.surface = self.font.render(text, True, color)
+        # Superfície compartilhada (renderizada uma vez por texto/tamanho/cor)
+        self.surface = self._render(text, font_size, color)
         self.rect = self.surface.get_rect(center=(x, y))
 
     def update(self, dt=1/60):
         """Atualiza a posição e opacidade do texto"""
-        current_time = pygame.time.get_ticks()
+        current_time = self.clock.get_ticks()
         elapsed = current_time - self.birth_time
         
         # Move o texto para cima (velocidade multiplicada por 60 para manter mesma velocidade em 60 FPS)
@@ -40,16 +66,40 @@ class FloatingText:
         # Calcula a opacidade (fade out)
         progress = elapsed / self.duration
         self.alpha = int(255 * (1 - progress))
-        
-        # Atualiza a superfície com a nova opacidade
-        self.surface = self.font.render(self.text, True, self.color)
-        self.surface.set_alpha(self.alpha)
-        
+
+    def get_state(self):
+        """Estado mínimo para snapshots (ver GameWorld.snapshot)"""
+        return (self.text, self.x, self.start_y, self.y, self.birth_time)
+
+    @classmethod
+    def from_state(cls, state, clock, **style):
+        """Recria um texto salvo com get_state()"""
+        text, x, start_y, _, _ = state
+        floating_text = cls(text, x, start_y, clock, **style)
+        floating_text.set_state(state)
+        return floating_text
+
+    def set_state(self, state):
+        """Volta para um estado salvo com get_state() (mesmo relógio e estilo)"""
+        text, x, start_y, y, birth_time = state
+        self.reset(text, x, start_y, self.clock, self.color, self.font_size, self.duration)
+        self.y = self.prev_y = y
+        self.rect.centery = int(y)
+        self.birth_time = birth_time
+
+    def save_previous_position(self):
+        """Guarda a posição atual antes de um novo passo de simulação"""
+        self.prev_y = self.y
+
     def is_expired(self):
         """Verifica se o texto já expirou"""
-        current_time = pygame.time.get_ticks()
+        current_time = self.clock.get_ticks()
         return (current_time - self.birth_time) >= self.duration
     
-    def draw(self, surface):
-        """Desenha o texto na tela"""
-        surface.blit(self.surface, self.rect)
+    def draw(self, surface, alpha=1.0):
+        """Desenha o texto na tela (posição interpolada)"""
+        y = self.prev_y + (self.y - self.prev_y) * alpha
+        # A superfície é compartilhada: a opacidade deste texto vale só
+        # para este blit
+        self.surface.set_alpha(self.alpha)
+        surface.blit(self.surface, self.rect.move(0, round(y) - self.rect.centery))
@@ -8,7 +8,11 @@ class Hitbox:
         self.rect = None
 
     def set_rect(self, width, height, x=0, y=0):
-        self.rect = pygame.Rect(x, y, width, height)
+        if self.rect is None:
+            self.rect = pygame.Rect(x, y, width, height)
+        else:
+            # Chamado a cada quadro: atualiza o mesmo rect em vez de criar outro
+            self.rect.update(x, y, width, height)
 
     def set_from_image(self, image, x=0, y=0):
         self.rect = image.get_rect(topleft=(x, y))
@@ -13,6 +13,16 @@ class BasePickup(BaseEntity):
         
         self.frozen = False 
 
+    def reset(self, x_pos, y_pos, speed=5):
+        """
+        Deixa um pickup reaproveitado (ObjectPool) igual a um recém-criado
+        na posição dada. A imagem, o rect e a hitbox continuam os mesmos.
+        """
+        self.speed = speed
+        self.frozen = False
+        self.set_position(x_pos, y_pos)
+        self.update_hitbox()
+
     def update_hitbox(self):
             self.hitbox.set_rect(
                 self.rect.width,
@@ -24,7 +34,17 @@ class BasePickup(BaseEntity):
     def update(self, dt=1/60):
         if not self.frozen:
             # Velocidade multiplicada por 60 para manter a mesma velocidade em 60 FPS
-            self.rect.y += self.speed * 60 * dt
+            self.y += self.speed * 60 * dt
+            self.sync_rect()
+        self.update_hitbox()
+
+    def get_state(self):
+        """Estado mínimo para snapshots (ver GameWorld.snapshot)"""
+        return (self.x, self.y, self.frozen)
+
+    def set_state(self, state):
+        x, y, self.frozen = state
+        self.set_position(x, y)
         self.update_hitbox()
 
     def check_collision(self, player):
@@ -33,8 +53,8 @@ class BasePickup(BaseEntity):
 
     def off_screen(self, screen_height):
         """Se saiu da tela"""
-        return self.rect.y > screen_height
+        return self.y > screen_height
 
-    def draw(self, surface):
-        super().draw(surface)
+    def draw(self, surface, alpha=1.0):
+        super().draw(surface, alpha)
         self.hitbox.draw_hitbox(surface) 
@@ -91,6 +91,17 @@ class GhostPickupEffect:
             else:
                 self.entity.image = self.blank_image
 
+    def get_state(self):
+        """Estado mínimo para snapshots (ver GameWorld.snapshot)"""
+        return (self.is_ghost, self.is_blinking, self.blink_visible, self.last_blink_time)
+
+    def set_state(self, state):
+        is_ghost, is_blinking, blink_visible, self.last_blink_time = state
+        self.set_ghost_mode(is_ghost, is_blinking)
+        self.blink_visible = blink_visible
+        if is_ghost and not blink_visible:
+            self.entity.image = self.blank_image
+
     def check_collision(self, other):
         """
         Verifica colisão, ignorando se estiver no modo fantasma.
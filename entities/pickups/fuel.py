@@ -3,4 +3,8 @@ from entities.pickups.base_pickup import BasePickup
 class FuelPickup(BasePickup):
     def __init__(self, image, x_pos, screen_height):
         super().__init__(image, x_pos, y_pos=0, speed=5)
-        self.screen_height = screen_height
\ No newline at end of file
+        self.screen_height = screen_height
+
+    def reset(self, x_pos, screen_height):
+        super().reset(x_pos, y_pos=0, speed=5)
+        self.screen_height = screen_height
@@ -6,3 +6,7 @@ class GhostPickup(BasePickup):
         super().__init__(image, x_pos, y_pos=0, speed=5)
         self.screen_height = screen_height
 
+    def reset(self, x_pos, screen_height):
+        super().reset(x_pos, y_pos=0, speed=5)
+        self.screen_height = screen_height
+
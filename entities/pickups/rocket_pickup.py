@@ -5,4 +5,9 @@ class RocketPickup(BasePickup):
     def __init__(self, image, x_pos, screen_height):
         super().__init__(image, x_pos, y_pos=0, speed=5)
         self.screen_height = screen_height
-        self.weapon_icon = pygame.transform.scale(image, (30, 30))
\ No newline at end of file
+        self.weapon_icon = pygame.transform.scale(image, (30, 30))
+
+    def reset(self, x_pos, screen_height):
+        # A imagem não muda, então o ícone escalado também é reaproveitado
+        super().reset(x_pos, y_pos=0, speed=5)
+        self.screen_height = screen_height
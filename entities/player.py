@@ -1,6 +1,8 @@
 import pygame
 from entities.carro import Carro
 from entities.rocket import Rocket
+from entities.effects.rocket_trail import RocketTrail
+from utils.object_pool import ObjectPool
 
 
 class Player(Carro):
@@ -15,9 +17,17 @@ class Player(Carro):
     - Tocar sons de motor
     """
     
-    def __init__(self, image, screen_width, screen_height, x_pos, y_pos, rocket_icon=None):
+    def __init__(self, image, screen_width, screen_height, x_pos, y_pos, clock, cosmetic_rng, rocket_img=None, rocket_icon=None):
         # Inicializa a classe pai (Carro)
         super().__init__(image, x_pos, y_pos)
+
+        # Relógio da simulação (cooldowns e power-ups usam tempo simulado)
+        self.clock = clock
+        # Gerador aleatório dos efeitos visuais (rastro dos foguetes)
+        self.cosmetic_rng = cosmetic_rng
+        # Sprite do foguete (vem do GameWorld, não do GameManager, para que
+        # o jogo com janela e o headless disparem foguetes do mesmo tamanho)
+        self.rocket_img = rocket_img
         
         # === CONFIGURAÇÕES DE TELA ===
         self.screen_width = screen_width
@@ -35,6 +45,16 @@ class Player(Carro):
         
         # === SISTEMA DE FOGUETES ===
         self.rockets = []  # Lista de foguetes ativos na tela
+        # Foguetes que saíram da tela ou acertaram um inimigo voltam para o
+        # pool e são reaproveitados nos próximos disparos
+        self.rocket_pool = ObjectPool(Rocket)
+        # Fumaça de todos os foguetes num buffer só (continua esmaecendo
+        # depois que o foguete some)
+        self.rocket_trail = RocketTrail()
+        # Sprite do foguete já no tamanho final (escalado uma vez só)
+        self.rocket_sprite = (
+            pygame.transform.scale(rocket_img, (30, 60)) if rocket_img is not None else None
+        )
         self.rocket_cooldown = 0  # Tempo até poder disparar novamente
         self.has_rocket = False  # Se tem power-up de foguete ativo
         self.rocket_end_time = 0  # Quando o power-up de foguete acaba
@@ -98,7 +118,7 @@ class Player(Carro):
             self.stop_sounds()
             return
         
-        current_time = pygame.time.get_ticks()
+        current_time = self.clock.get_ticks()
         
         # Atualiza cada sistema do jogador
         self._handle_movement(keys, dt)  # Movimento com teclas
@@ -163,8 +183,8 @@ class Player(Carro):
         self.rocket_end_time = current_time + 10000  # 10 segundos
         self.rocket_blink_visible = True
 
-        if hasattr(self, "game_manager") and hasattr(self.game_manager, "img_config"):
-            original_img = self.game_manager.img_config.rocket_pickup_img
+        if self.rocket_img is not None:
+            original_img = self.rocket_img
 
             # Aumenta o fator de escala (de 0.7 para 0.9 por exemplo)
             self.rocket_scale_factor = 1.5  # Ajuste este valor conforme necessário
@@ -225,22 +245,24 @@ class Player(Carro):
         # Velocidade base multiplicada por 60 para manter a mesma velocidade em 60 FPS
         speed_dt = self.speed * 60 * dt
         
-        if keys[pygame.K_LEFT] and self.rect.x > self.left_limit:
-            self.rect.x -= speed_dt
-        if keys[pygame.K_RIGHT] and self.rect.x < self.right_limit:
-            self.rect.x += speed_dt
-        if keys[pygame.K_UP] and self.rect.y > 0:
-            self.rect.y -= speed_dt
-        if keys[pygame.K_DOWN] and self.rect.y < self.screen_height - self.rect.height:
-            self.rect.y += speed_dt
-
+        # Move a posição float; o rect inteiro é sincronizado uma vez no final
+        if keys[pygame.K_LEFT] and self.x > self.left_limit:
+            self.x -= speed_dt
+        if keys[pygame.K_RIGHT] and self.x < self.right_limit:
+            self.x += speed_dt
+        if keys[pygame.K_UP] and self.y > 0:
+            self.y -= speed_dt
+        if keys[pygame.K_DOWN] and self.y < self.screen_height - self.rect.height:
+            self.y += speed_dt
+
+        self.sync_rect()
         self.hitbox.set_rect(
             self.rect.width, self.rect.height, self.rect.x, self.rect.y
         )
 
     def _handle_rockets(self, keys, dt):
         """Controla o disparo de foguetes"""
-        current_time = pygame.time.get_ticks()
+        current_time = self.clock.get_ticks()
         if (
             self.has_rocket
             and keys[pygame.K_SPACE]
@@ -255,6 +277,8 @@ class Player(Carro):
             rocket.update(dt)
             if rocket.rect.bottom < 0:  # Remove se sair da tela
                 self.rockets.remove(rocket)
+                self.rocket_pool.release(rocket)
+        self.rocket_trail.update(dt)
 
     def _update_fuel(self, dt):
         """Atualiza o sistema de combustível"""
@@ -265,48 +289,46 @@ class Player(Carro):
 
     def fire_rocket(self):
         """Dispara um novo foguete com sprite personalizada"""
-        if hasattr(self, "game_manager") and hasattr(self.game_manager, "img_config"):
-            # Usa a imagem do foguete do img_config
-            original_img = self.game_manager.img_config.rocket_pickup_img
-            # Redimensiona para o tamanho desejado
-            rocket_img = pygame.transform.scale(original_img, (30, 60))
-            # Rotaciona se necessário (90 graus para ficar vertical)
-            rocket_img = pygame.transform.rotate(rocket_img, 0)
-        else:
-            # Fallback caso não tenha acesso ao game_manager
-            rocket_img = None
-
-        new_rocket = Rocket(self.rect.centerx, self.rect.top)
-
-        # Atribui a imagem personalizada se disponível
-        if rocket_img:
-            new_rocket.image = rocket_img
-            new_rocket.rect = new_rocket.image.get_rect(center=new_rocket.rect.center)
-
-        self.rockets.append(new_rocket)
+        self.rockets.append(self._create_rocket())
 
         # Toca o som do foguete
         if hasattr(self, "game_manager") and hasattr(self.game_manager, "rocket_sound"):
             self.game_manager.rocket_sound.play()
 
-    def draw(self, screen):
+    def _create_rocket(self):
+        """Cria (ou reaproveita do pool) um foguete saindo do topo do carro"""
+        # Sem rocket_sprite o foguete usa o fallback (retângulo transparente)
+        return self.rocket_pool.acquire(
+            self.rect.centerx,
+            self.rect.top,
+            self.clock,
+            self.cosmetic_rng,
+            image=self.rocket_sprite,
+            trail=self.rocket_trail,
+        )
+
+    def draw(self, screen, alpha=1.0):
         """
         Desenha o jogador e seus componentes na tela com a bazuca equipada
+
+        Args:
+            alpha: Fração do passo de simulação para interpolar as posições
         """
         # 1. Desenha o carro base
-        super().draw(screen)
+        super().draw(screen, alpha)
 
-        # 2. Desenha foguetes ativos
-        for rocket in self.rockets[:]:  # Usando slice para segurança
-            rocket.draw(screen)
+        # 2. Desenha foguetes ativos (rastro atrás dos foguetes)
+        self.rocket_trail.draw(screen)
+        for rocket in self.rockets:
+            rocket.draw(screen, alpha)
 
         # 3. Desenha a bazuca no telhado (se equipada)
-        self._draw_rocket_on_car(screen)
+        self._draw_rocket_on_car(screen, alpha)
 
         # 4. Desenha o HUD (ícone + combustível)
         self._draw_hud_elements(screen)
 
-    def _draw_rocket_on_car(self, screen):
+    def _draw_rocket_on_car(self, screen, alpha=1.0):
         """Desenha a bazuca equipada no telhado do carro"""
         if not (self.has_rocket and self.rocket_on_car_img):
             return
@@ -317,13 +339,14 @@ class Player(Carro):
             return
 
         # Calcula a posição para colocar no telhado do carro
-        rocket_x = self.rect.x + self.rocket_on_car_offset[0]
-        rocket_y = self.rect.y + self.rocket_on_car_offset[1]
+        car_x, car_y = self.render_position(alpha)
+        rocket_x = car_x + self.rocket_on_car_offset[0]
+        rocket_y = car_y + self.rocket_on_car_offset[1]
 
         # Aplica efeito visual se estiver perto de acabar
         if (
             hasattr(self, "last_rocket_blink_time")
-            and pygame.time.get_ticks() - self.last_rocket_blink_time < 100
+            and self.clock.get_ticks() - self.last_rocket_blink_time < 100
         ):
             # Cria uma cópia da imagem para aplicar transparência
             temp_img = self.rocket_on_car_img.copy()
@@ -375,12 +398,72 @@ class Player(Carro):
 
     def reset_position(self):
         """Reseta a posição do jogador"""
-        self.rect.x = self.screen_width // 2 - self.rect.width // 2
-        self.rect.y = self.screen_height - self.rect.height - 20
+        self.set_position(
+            self.screen_width // 2 - self.rect.width // 2,
+            self.screen_height - self.rect.height - 20,
+        )
         self.hitbox.set_rect(
             self.rect.width, self.rect.height, self.rect.x, self.rect.y
         )
 
+    # === SNAPSHOTS ===
+
+    def get_state(self):
+        """Estado mínimo para snapshots (ver GameWorld.snapshot)"""
+        return (
+            self.x,
+            self.y,
+            self.fuel,
+            self.frozen,
+            self.rocket_cooldown,
+            self.has_rocket,
+            self.rocket_end_time,
+            self.last_rocket_blink_time,
+            self.rocket_blink_visible,
+            self.ghost_power_active,
+            self.ghost_power_end_time,
+            self.ghost_effect.get_state() if self.ghost_effect else None,
+            [rocket.get_state() for rocket in self.rockets],
+        )
+
+    def set_state(self, state):
+        (
+            x,
+            y,
+            self.fuel,
+            self.frozen,
+            self.rocket_cooldown,
+            has_rocket,
+            rocket_end_time,
+            self.last_rocket_blink_time,
+            rocket_blink_visible,
+            self.ghost_power_active,
+            self.ghost_power_end_time,
+            ghost_state,
+            rocket_states,
+        ) = state
+
+        self.set_position(x, y)
+        self.hitbox.set_rect(self.rect.width, self.rect.height, self.rect.x, self.rect.y)
+
+        # Reativar o poder recria a bazuca desenhada no teto do carro
+        self.has_rocket = False
+        if has_rocket:
+            self.activate_rocket_power(rocket_end_time - 10000)
+        self.rocket_end_time = rocket_end_time
+        self.rocket_blink_visible = rocket_blink_visible
+
+        if self.ghost_effect and ghost_state is not None:
+            self.ghost_effect.set_state(ghost_state)
+
+        self.rocket_pool.release_all(self.rockets)
+        self.rockets = []
+        self.rocket_trail.clear()  # O rastro não entra no snapshot
+        for rocket_state in rocket_states:
+            rocket = self._create_rocket()
+            rocket.set_state(rocket_state)
+            self.rockets.append(rocket)
+
     def load_sounds(self, acceleration_sound_path, idle_sound_path):
         """Carrega os sons do carro"""
         try:
@@ -1,14 +1,14 @@
-import random
 import pygame
 
 
 class SideGif:
     """GIF lateral que desce verticalmente, com tamanho customizável"""
 
-    def __init__(self, frames, x, y, speed=5, frame_duration=300, size=None):
+    def __init__(self, frames, x, y, clock, speed=5, frame_duration=300, size=None):
         """
         frames: lista de imagens do GIF
         x, y: posição inicial
+        clock: relógio da simulação (GameClock)
         speed: velocidade vertical
         frame_duration: tempo (ms) entre frames
         size: tupla (largura, altura) opcional para redimensionar cada GIF
@@ -18,20 +18,26 @@ class SideGif:
             self.frames = [pygame.transform.scale(f, size) for f in frames]
         self.x = x
         self.y = y
+        self.prev_y = y  # Posição no passo anterior (para interpolar o desenho)
         self.speed = speed
         self.frame_duration = frame_duration
         self.current_frame = 0
-        self.last_update = pygame.time.get_ticks()
+        self.clock = clock
+        self.last_update = self.clock.get_ticks()
         self.total_frames = len(self.frames)
         self.screen_height = pygame.display.get_surface().get_height()
         self.frozen = False  # Atributo para congelar o GIF
 
+    def save_previous_position(self):
+        """Guarda a posição atual antes de um novo passo de simulação"""
+        self.prev_y = self.y
+
     def update(self, dt=1/60):
         # Não atualiza se estiver congelado
         if self.frozen:
             return
             
-        now = pygame.time.get_ticks()
+        now = self.clock.get_ticks()
         if self.total_frames > 0 and now - self.last_update >= self.frame_duration:
             self.current_frame = (self.current_frame + 1) % self.total_frames
             self.last_update = now
@@ -40,7 +46,9 @@ class SideGif:
         self.y += self.speed * 60 * dt
         if self.y > self.screen_height:
             self.y = -50  # reinicia no topo
+            self.prev_y = self.y  # Voltou ao topo: não interpola o salto
 
-    def draw(self, surface):
+    def draw(self, surface, alpha=1.0):
         if self.total_frames > 0:
-            surface.blit(self.frames[self.current_frame], (self.x, self.y))
+            y = self.prev_y + (self.y - self.prev_y) * alpha
+            surface.blit(self.frames[self.current_frame], (self.x, round(y)))
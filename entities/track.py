@@ -11,6 +11,7 @@ class Track:
         self.speed = 5  # Velocidade da pista
         self.screen_height = screen_height
         self.frozen = False
+        self.last_scroll = 0  # Quanto a pista andou no último passo (para interpolar)
 
     def update(self, dt):
         if not hasattr(self, 'frozen'):
@@ -18,6 +19,7 @@ class Track:
         if not self.frozen:
             # Velocidade base multiplicada por 60 para manter a mesma velocidade em 60 FPS
             speed_dt = self.speed * 60 * dt
+            self.last_scroll = speed_dt
             self.y1 += speed_dt
             self.y2 += speed_dt
 
@@ -27,6 +29,22 @@ class Track:
             if self.y2 >= self.screen_height:
                 self.y2 = self.y1 - self.height
 
-    def draw(self, surface):
-        surface.blit(self.image, (self.offset_x, self.y1))
-        surface.blit(self.image, (self.offset_x, self.y2))
+    def get_state(self):
+        """Estado mínimo para snapshots (ver GameWorld.snapshot)"""
+        return (self.y1, self.y2, self.frozen)
+
+    def set_state(self, state):
+        self.y1, self.y2, self.frozen = state
+        self.last_scroll = 0
+
+    def save_previous_position(self):
+        """Zera o deslocamento do passo anterior (pista parada não interpola)"""
+        self.last_scroll = 0
+
+    def draw(self, surface, alpha=1.0):
+        # Volta a pista a parte do último passo que ainda "não aconteceu".
+        # As duas cópias ficam sempre a uma altura de distância, então
+        # usar o resto da divisão evita o salto quando a imagem dá a volta.
+        y = (self.y1 - self.last_scroll * (1 - alpha)) % self.height
+        surface.blit(self.image, (self.offset_x, round(y)))
+        surface.blit(self.image, (self.offset_x, round(y) - self.height))
@@ -0,0 +1,198 @@
+import math
+from bisect import bisect_left, bisect_right
+from operator import attrgetter
+
+_by_index = attrgetter("index")
+
+
+class TrafficLanes:
+    """
+    Fila de inimigos de cada faixa, ordenada por y (de cima para baixo).
+
+    Usada pelo EnemyManager na regra de distância do carro da frente: em vez
+    de comparar cada carro com todos os outros, cada carro olha só a fila
+    da sua faixa, a partir da própria posição, até passar da distância de
+    seguimento (normalmente só o vizinho da frente).
+
+    Um carro trocando de faixa fica na fila de todas as faixas por onde
+    passa (da origem ao destino) até chegar; aí sai das outras e fica só
+    na de destino.
+
+    A regra de "mesma faixa" continua sendo a diferença de centro (x) menor
+    que same_lane_distance; as filas só escolhem quem precisa ser testado.
+    Duas faixas só ficam separadas se nenhum carro de uma pode chegar tão
+    perto de um carro da outra (ver _reach_distance); caso contrário a
+    consulta de uma inclui a fila da outra, e o resultado não muda.
+
+    Ao lado de cada fila fica a lista dos y usados para ordená-la (keys),
+    para buscar nela com bisect sem o argumento key (que só existe a
+    partir do Python 3.10).
+    """
+
+    def __init__(self, lanes, same_lane_distance, max_lateral_movement):
+        """
+        Args:
+            lanes: Posições X das faixas
+            same_lane_distance: Diferença de centro que conta como mesma faixa
+            max_lateral_movement: Maior desvio lateral de um carro na faixa
+        """
+        self.positions = sorted(lanes)
+        self.same_lane_distance = same_lane_distance
+        self.max_lateral_movement = max_lateral_movement
+        # Faixas fora dos inteiros arredondam o rect para mais longe da faixa
+        self.rounding = 0 if all(float(x).is_integer() for x in self.positions) else 1
+
+        self.queues = [[] for _ in self.positions]
+        self.keys = [[] for _ in self.positions]  # y de cada carro das filas
+        self.spans = {}  # carro -> (primeira, última) faixa em que está na fila
+        self.query_ranges = {}  # carro -> range das filas que ele consulta
+        self.min_half_width = None
+        self.max_half_width = None
+
+    def __len__(self):
+        return len(self.spans)
+
+    def clear(self):
+        for queue, keys in zip(self.queues, self.keys):
+            queue.clear()
+            keys.clear()
+        self.spans.clear()
+        self.query_ranges.clear()
+
+    # === LARGURA DOS CARROS ===
+
+    def note_width(self, width):
+        """
+        Registra a largura de um carro novo.
+
+        Carros de larguras diferentes têm centros mais próximos, então a
+        distância entre faixas separadas depende da maior diferença.
+        """
+        half_width = width // 2
+        if self.min_half_width is None:
+            self.min_half_width = self.max_half_width = half_width
+        elif self.min_half_width <= half_width <= self.max_half_width:
+            return
+        else:
+            self.min_half_width = min(self.min_half_width, half_width)
+            self.max_half_width = max(self.max_half_width, half_width)
+        for car, span in self.spans.items():
+            self.query_ranges[car] = self._query_range(span)
+
+    def _reach_distance(self):
+        """
+        Distância entre faixas a partir da qual os carros de uma nunca ficam
+        na "mesma faixa" que os da outra (desvio lateral dos dois lados,
+        diferença de meia largura e arredondamento do rect).
+        """
+        width_slack = (self.max_half_width or 0) - (self.min_half_width or 0)
+        return (
+            self.same_lane_distance
+            + 2 * self.max_lateral_movement
+            + width_slack
+            + self.rounding
+        )
+
+    def _query_range(self, span):
+        """Filas que um carro registrado nas faixas span precisa consultar"""
+        first, last = span
+        reach = self._reach_distance()
+        positions = self.positions
+        return range(
+            bisect_right(positions, positions[first] - reach),
+            bisect_left(positions, positions[last] + reach),
+        )
+
+    # === FILAS ===
+
+    def span_of(self, base_x, target_lane):
+        """
+        Faixas (primeira, última) ocupadas por um carro.
+
+        Args:
+            base_x: Posição da faixa do carro (no meio do caminho, se trocando)
+            target_lane: Faixa de destino, ou NaN/None se não está trocando
+        """
+        if target_lane is None or math.isnan(target_lane):
+            return self.lanes_between(base_x, base_x)
+        return self.lanes_between(min(base_x, target_lane), max(base_x, target_lane))
+
+    def lanes_between(self, low, high):
+        """
+        Faixas (primeira, última) que cobrem o intervalo [low, high] de x.
+
+        Inclui as vizinhas de fora quando low/high caem entre duas faixas.
+        """
+        last_index = len(self.positions) - 1
+        first = max(0, bisect_right(self.positions, low) - 1)
+        last = min(last_index, bisect_left(self.positions, high))
+        return first, last
+
+    def place(self, car, base_x, target_lane, y):
+        """
+        Coloca (ou move) um carro nas filas das faixas que ele ocupa.
+
+        Chamado quando o carro aparece, começa a trocar de faixa e chega
+        na faixa de destino (é aqui que ele passa de uma fila para outra).
+
+        Args:
+            y: Y do carro, no mesmo referencial da última ordenação (resort)
+        """
+        span = self.span_of(base_x, target_lane)
+        old_span = self.spans.get(car)
+        if span == old_span:
+            return
+
+        old_lanes = range(old_span[0], old_span[1] + 1) if old_span else range(0)
+        new_lanes = range(span[0], span[1] + 1)
+        for lane in old_lanes:
+            if lane not in new_lanes:
+                position = self.queues[lane].index(car)
+                del self.queues[lane][position]
+                del self.keys[lane][position]
+        for lane in new_lanes:
+            if lane not in old_lanes:
+                position = bisect_right(self.keys[lane], y)
+                self.queues[lane].insert(position, car)
+                self.keys[lane].insert(position, y)
+
+        self.spans[car] = span
+        self.query_ranges[car] = self._query_range(span)
+
+    def discard(self, cars):
+        """Tira das filas os carros que saíram do jogo"""
+        gone = set(cars)
+        touched = set()
+        for car in gone:
+            span = self.spans.pop(car, None)
+            self.query_ranges.pop(car, None)
+            if span is not None:
+                touched.update(range(span[0], span[1] + 1))
+        for lane in touched:
+            kept = [
+                (car, y)
+                for car, y in zip(self.queues[lane], self.keys[lane])
+                if car not in gone
+            ]
+            self.queues[lane][:] = [car for car, _ in kept]
+            self.keys[lane][:] = [y for _, y in kept]
+
+    def resort(self, ys):
+        """
+        Reordena as filas pelo y atual (antes de cada passo).
+
+        Os carros descem poucos pixels por passo e quase nunca trocam de
+        ordem: quase sempre basta conferir a ordem, e quando é preciso
+        ordenar, a ordenação (timsort) sobre filas quase ordenadas é linear.
+
+        Args:
+            ys: Lista com o y de cada carro, pelo índice (car.index)
+        """
+        for queue, keys in zip(self.queues, self.keys):
+            if len(queue) > 1:
+                keys[:] = map(ys.__getitem__, map(_by_index, queue))
+                if keys != sorted(keys):
+                    queue.sort(key=lambda car: ys[car.index])
+                    keys[:] = map(ys.__getitem__, map(_by_index, queue))
+            elif queue:
+                keys[0] = ys[queue[0].index]
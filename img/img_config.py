@@ -55,7 +55,8 @@ class ImgConfig:
         self.side_gifs = {}  # chave = nome da pasta, valor = lista de frames
         sidegif_base = os.path.join(self.asset_dir, "sidegif")
         if os.path.exists(sidegif_base):
-            for folder_name in os.listdir(sidegif_base):
+            # Ordenado para que a ordem (e o sorteio dos GIFs) seja a mesma em qualquer sistema
+            for folder_name in sorted(os.listdir(sidegif_base)):
                 folder_path = os.path.join(sidegif_base, folder_name)
                 if os.path.isdir(folder_path):
                     frames = self._load_gif_frames(folder_path)
@@ -1,6 +1,89 @@
-from config.constants import WIDTH, HEIGHT, TITLE
-from core.game_manager import GameManager
+import argparse
+
+from config.constants import WIDTH, HEIGHT, TITLE, FPS
+from core.replay import MAX_REPLAY_SPEED, Replay
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=TITLE)
+    parser.add_argument(
+        "--headless",
+        action="store_true",
+        help="Roda a simulação sem janela, sem som e sem desenho",
+    )
+    parser.add_argument(
+        "--duration",
+        type=float,
+        default=600,
+        help="Tempo de jogo simulado no modo headless (segundos)",
+    )
+    parser.add_argument(
+        "--fps",
+        type=int,
+        default=FPS,
+        help="Limite de quadros desenhados por segundo (ex: 144, 240; 0 = sem limite)",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=None,
+        help="Semente dos geradores aleatórios (mesma semente = mesmo tráfego)",
+    )
+    parser.add_argument(
+        "--record",
+        metavar="ARQUIVO",
+        default=None,
+        help="Grava as teclas de cada partida em um arquivo de replay",
+    )
+    parser.add_argument(
+        "--replay",
+        metavar="ARQUIVO",
+        default=None,
+        help="Reproduz um replay gravado com --record (com --headless: velocidade máxima)",
+    )
+    parser.add_argument(
+        "--replay-speed",
+        type=float,
+        default=1.0,
+        help=f"Velocidade do replay desenhado (1 a {MAX_REPLAY_SPEED})",
+    )
+    parser.add_argument(
+        "--replay-start",
+        type=float,
+        default=0.0,
+        help="Começa o replay neste ponto da partida (segundos de jogo)",
+    )
+    args = parser.parse_args()
+    if not 1 <= args.replay_speed <= MAX_REPLAY_SPEED:
+        parser.error(f"--replay-speed precisa estar entre 1 e {MAX_REPLAY_SPEED}")
+    return args
+
 
 if __name__ == "__main__":
-    game = GameManager(WIDTH, HEIGHT, TITLE)
-    game.run() 
\ No newline at end of file
+    args = parse_args()
+    replay = Replay.load(args.replay) if args.replay else None
+
+    if args.headless:
+        from core.headless import HeadlessRunner, print_summary, run_replay
+
+        if replay is not None:
+            start_step = int(args.replay_start * replay.sim_hz)
+            print_summary(run_replay(replay, start_step))
+        else:
+            runner = HeadlessRunner(seed=args.seed)
+            print_summary(runner.run(args.duration))
+    else:
+        from core.game_manager import GameManager
+
+        game = GameManager(
+            WIDTH,
+            HEIGHT,
+            TITLE,
+            fps=args.fps,
+            seed=args.seed,
+            record_path=args.record,
+            replay=replay,
+            replay_speed=args.replay_speed,
+            replay_start=args.replay_start,
+        )
+        game.run()
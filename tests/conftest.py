@@ -0,0 +1,9 @@
+import os
+import sys
+
+# Os testes rodam sem janela e sem som (mesmos drivers do HeadlessRunner)
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+# Permite "import core..." rodando o pytest de qualquer pasta
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,76 @@
+import pickle
+import random
+
+import pygame
+import pytest
+
+from core.headless import HeadlessRunner
+from core.policies import DodgePolicy, RandomPolicy
+from entities.enemy_manager import EnemyManager
+
+
+# Limites de VECTORIZE_MIN_ENEMIES que forçam um dos dois caminhos de update()
+PER_CAR = 10**9
+VECTORIZED = 0
+
+# Tráfego mais denso que o normal: mais carros seguindo e trocando de faixa
+DENSE_TRAFFIC = {"spawn_delay_range": (300, 700), "lane_cooldown": 400}
+
+LANES = [100, 220, 340, 460]
+SCREEN_HEIGHT = 600
+
+
+def _runners(seed, policy):
+    runners = []
+    for threshold in (PER_CAR, VECTORIZED):
+        runner = HeadlessRunner(seed=seed, policy=policy(seed), params=DENSE_TRAFFIC)
+        runner.game_world.enemies.VECTORIZE_MIN_ENEMIES = threshold
+        runners.append(runner)
+    return runners
+
+
+@pytest.mark.parametrize("policy", [RandomPolicy, DodgePolicy])
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_update_paths_match_in_game(seed, policy):
+    """Carro por carro e vetorizado dão o mesmo mundo, passo a passo"""
+    runners = _runners(seed, policy)
+    for step in range(20 * 120):
+        # Sem regras de game over: a partida segue mesmo depois de uma batida
+        for runner in runners:
+            keys = runner.policy(runner.game_world)
+            runner.game_clock.step(runner.dt)
+            runner.game_world.update(keys, runner.dt)
+        per_car, vectorized = (pickle.loads(r.game_world.snapshot()) for r in runners)
+        assert per_car == vectorized, f"passo {step}"
+
+
+def test_update_paths_match_with_many_cars():
+    """Mesma comparação com dezenas de carros em quatro faixas"""
+    pygame.init()
+    images = [pygame.Surface((40, 70)), pygame.Surface((50, 90))]
+    managers = []
+    for threshold in (PER_CAR, VECTORIZED):
+        manager = EnemyManager(LANES, SCREEN_HEIGHT, random.Random("many-cars"))
+        manager.VECTORIZE_MIN_ENEMIES = threshold
+        managers.append(manager)
+
+    spawner = random.Random(7)
+    player = pygame.Rect(LANES[0], 480, 50, 90)
+    most_cars = 0
+    for step in range(3000):
+        if step % 12 == 0:
+            image = spawner.choice(images)
+            lane = spawner.choice(LANES)
+            for manager in managers:
+                manager.spawn(image, lane)
+        player.x = LANES[step // 150 % len(LANES)]
+        for manager in managers:
+            manager.update(player, 1 / 120)
+        per_car, vectorized = (
+            [manager.get_state(index) for index in range(manager.count)]
+            for manager in managers
+        )
+        assert per_car == vectorized, f"passo {step}"
+        most_cars = max(most_cars, managers[0].count)
+
+    assert most_cars >= 40
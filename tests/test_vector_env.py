@@ -0,0 +1,121 @@
+import numpy as np
+import pytest
+
+from config.constants import SIM_HZ
+from core.headless import HeadlessRunner
+from core.input_state import keys_to_mask
+from core.policies import IdlePolicy, RandomPolicy
+from core.vector_env import VectorEnv
+
+# Diferença máxima entre as médias dos dois lados, em erros padrão da
+# diferença (teste z de duas amostras; as sementes são fixas, então o
+# resultado não muda de uma execução para outra)
+MAX_Z = 3.0
+
+# Tráfego mais denso que o normal: com o spawn limitado só pelas regras de
+# espaço, bloqueio e faixa, e não pelo sorteio do atraso
+DENSE_TRAFFIC = {"spawn_delay_range": (300, 700), "lane_cooldown": 400}
+TRAFFIC_SEEDS = 12
+TRAFFIC_STEPS = 45 * SIM_HZ
+SURVIVAL_SEEDS = 48
+SURVIVAL_MAX_STEPS = 120 * SIM_HZ
+
+
+def _z_score(a, b):
+    a, b = np.asarray(a, dtype=float), np.asarray(b, dtype=float)
+    error = np.sqrt(a.var(ddof=1) / len(a) + b.var(ddof=1) / len(b))
+    return (a.mean() - b.mean()) / error
+
+
+def _assert_same_mean(name, headless, vector):
+    z = _z_score(headless, vector)
+    assert abs(z) < MAX_Z, (
+        f"{name}: HeadlessRunner {np.mean(headless):.2f}, "
+        f"VectorEnv {np.mean(vector):.2f} (z = {z:.1f})"
+    )
+
+
+def _count_spawns(world):
+    """Troca world.spawn_enemy por uma versão que conta os inimigos criados"""
+    spawn_enemy = world.spawn_enemy
+    created = [0]
+
+    def counting_spawn():
+        before = len(world.enemies)
+        spawn_enemy()
+        created[0] += len(world.enemies) > before
+
+    world.spawn_enemy = counting_spawn
+    return created
+
+
+def _new_enemies(env, alive_before):
+    """Vagas de inimigo ocupadas neste passo, por mundo"""
+    return (env.enemy_alive & ~alive_before).sum(axis=1)
+
+
+@pytest.fixture(scope="module")
+def runner():
+    # Um só para todas as partidas: carregar as imagens é a parte lenta
+    return HeadlessRunner()
+
+
+def test_traffic_matches_headless(runner):
+    """
+    Inimigos criados por minuto e inimigos na tela, com o jogador parado e
+    sem fim de jogo: é o que as regras de spawn, bloqueio e seguimento
+    reescritas no VectorEnv decidem.
+    """
+    minutes = TRAFFIC_STEPS / SIM_HZ / 60
+    headless_rate, headless_on_screen = [], []
+    for seed in range(TRAFFIC_SEEDS):
+        runner.seed = seed
+        runner.params = DENSE_TRAFFIC
+        runner.reset()
+        world = runner.game_world
+        created = _count_spawns(world)
+        keys = IdlePolicy()(world)
+        on_screen = 0
+        for _ in range(TRAFFIC_STEPS):
+            runner.game_clock.step(runner.dt)
+            world.update(keys, runner.dt)
+            on_screen += len(world.enemies)
+        headless_rate.append(created[0] / minutes)
+        headless_on_screen.append(on_screen / TRAFFIC_STEPS)
+
+    env = VectorEnv(TRAFFIC_SEEDS, seed=0, auto_reset=False, params=DENSE_TRAFFIC)
+    env.reset()
+    spawns = np.zeros(TRAFFIC_SEEDS)
+    on_screen = np.zeros(TRAFFIC_SEEDS)
+    actions = np.zeros(TRAFFIC_SEEDS, dtype=np.int64)
+    for _ in range(TRAFFIC_STEPS):
+        env.done[:] = False  # Batidas e falta de combustível não param o mundo
+        alive_before = env.enemy_alive.copy()
+        env.step(actions)
+        spawns += _new_enemies(env, alive_before)
+        on_screen += env.enemy_alive.sum(axis=1)
+
+    _assert_same_mean("inimigos por minuto", headless_rate, spawns / minutes)
+    _assert_same_mean("inimigos na tela", headless_on_screen, on_screen / TRAFFIC_STEPS)
+
+
+@pytest.mark.parametrize("policy", [IdlePolicy, RandomPolicy])
+def test_survival_matches_headless(runner, policy):
+    """Tempo até o fim de jogo (batida ou falta de combustível)"""
+    headless_steps = []
+    for seed in range(SURVIVAL_SEEDS):
+        runner.seed = seed
+        runner.params = {}
+        runner.policy = policy(seed)
+        runner.reset()
+        runner.run_steps(SURVIVAL_MAX_STEPS)
+        headless_steps.append(runner.steps)
+
+    env = VectorEnv(SURVIVAL_SEEDS, seed=0, auto_reset=False)
+    env.reset()
+    # As políticas usadas aqui não olham o mundo
+    policies = [policy(seed) for seed in range(SURVIVAL_SEEDS)]
+    while not env.done.all() and env.steps.max() < SURVIVAL_MAX_STEPS:
+        env.step(np.array([keys_to_mask(policy(None)) for policy in policies]))
+
+    _assert_same_mean("passos até o fim de jogo", headless_steps, env.steps)
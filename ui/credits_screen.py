@@ -1,5 +1,7 @@
 import pygame
 from config.constants import WIDTH, HEIGHT
+from ui.gradient import vertical_gradient
+from utils.font_registry import get_font
 
 # Dimensões da tela
 SCREEN_WIDTH = WIDTH
@@ -23,10 +25,10 @@ COLORS = {
 
 class CreditsScreen:
     def __init__(self):
-        self.font_title = pygame.font.Font(None, 44)
-        self.font_subtitle = pygame.font.Font(None, 28)
-        self.font_name = pygame.font.Font(None, 32)
-        self.font_small = pygame.font.Font(None, 20)
+        self.font_title = get_font(44)
+        self.font_subtitle = get_font(28)
+        self.font_name = get_font(32)
+        self.font_small = get_font(20)
 
         # Botão voltar
         self.back_rect = pygame.Rect(SCREEN_WIDTH // 2 - 70, SCREEN_HEIGHT - 60, 140, 36)
@@ -45,14 +47,28 @@ class CreditsScreen:
             "Vinicius Ferrari"
         ]
 
-    def _draw_gradient(self, screen):
-        """Desenha o gradiente de fundo (igual ao ranking)"""
-        for i in range(SCREEN_HEIGHT):
-            ratio = i / SCREEN_HEIGHT
-            r = int(COLORS["bg_top"][0] * (1 - ratio) + COLORS["bg_bottom"][0] * ratio)
-            g = int(COLORS["bg_top"][1] * (1 - ratio) + COLORS["bg_bottom"][1] * ratio)
-            b = int(COLORS["bg_top"][2] * (1 - ratio) + COLORS["bg_bottom"][2] * ratio)
-            pygame.draw.line(screen, (r, g, b), (0, i), (SCREEN_WIDTH, i))
+        # Camadas prontas (mesma ideia da tela de ranking): título, cabeçalho
+        # e botão numa camada, cada nome renderizado uma vez, e a composição
+        # só é refeita enquanto os nomes deslizam; o fade-in só muda o alpha
+        self.static_layer, line_y = self._build_static_layer()
+        self.rows = []  # (superfície da linha, y)
+        y_pos = line_y + 40
+        for dev_name in self.developers:
+            self.rows.append((self._render_developer_row(dev_name), y_pos))
+            y_pos += 50
+        self.overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+        self.overlay_offsets = None  # Deslocamento das linhas na composição atual
+        # Depois do fade-in a tela inteira (fundo + composição) fica pronta
+        # numa superfície opaca: cada quadro parado é um blit só
+        self.frame = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.frame_ready = False
+
+    def _build_static_layer(self):
+        """Título, cabeçalho e botão voltar numa camada (e o y da linha separadora)"""
+        layer = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+        line_y = self._draw_title_and_header(layer)
+        self._draw_back_button(layer)
+        return layer, line_y
 
     def _draw_title_and_header(self, overlay):
         """Desenha o título e cabeçalho"""
@@ -91,20 +107,35 @@ class CreditsScreen:
         offset_x = int(start_offset * (1 - pe))
         return offset_x
 
-    def _draw_developer_row(self, overlay, index, name, y_pos, elapsed):
-        """Desenha uma linha com o nome do desenvolvedor"""
-        offset_x = self._calc_animation_offset(index, elapsed)
+    def _render_developer_row(self, name):
+        """Uma linha com o nome do desenvolvedor, numa superfície da largura da tela"""
+        name_text = self.font_name.render(name, True, COLORS["white"])
+        row = pygame.Surface((SCREEN_WIDTH, name_text.get_height()), pygame.SRCALPHA)
 
         # Nome do desenvolvedor
-        name_text = self.font_name.render(name, True, COLORS["white"])
-        name_x = SCREEN_WIDTH // 2 - name_text.get_width() // 2 + offset_x
-        overlay.blit(name_text, (name_x, y_pos))
+        name_x = SCREEN_WIDTH // 2 - name_text.get_width() // 2
+        row.blit(name_text, (name_x, 0))
 
         # Marcador decorativo
         marker_x = name_x - 30
-        pygame.draw.circle(overlay, COLORS["yellow"], (marker_x, y_pos + 12), 4)
+        pygame.draw.circle(row, COLORS["yellow"], (marker_x, 12), 4)
+
+        return row
+
+    def _compose(self, offsets):
+        """
+        Monta a tela (sem o fundo) com as linhas deslocadas por offsets.
 
-        return y_pos + 50
+        As camadas não se sobrepõem, então os pixels são copiados como
+        estão (BLEND_RGBA_MAX sobre a superfície transparente).
+        """
+        overlay = self.overlay
+        overlay.fill((0, 0, 0, 0))
+        overlay.blit(self.static_layer, (0, 0), special_flags=pygame.BLEND_RGBA_MAX)
+        for (row, y_pos), offset_x in zip(self.rows, offsets):
+            overlay.blit(row, (offset_x, y_pos), special_flags=pygame.BLEND_RGBA_MAX)
+        self.overlay_offsets = offsets
+        self.frame_ready = False
 
     def _draw_back_button(self, overlay):
         """Desenha o botão de voltar"""
@@ -130,6 +161,25 @@ class CreditsScreen:
                     return "menu"
         return None
 
+    def _offsets(self):
+        """Deslocamento de cada linha no slide-in, pelo tempo desde a abertura"""
+        now = pygame.time.get_ticks()
+        elapsed = 0.0 if not self.start_time else (now - self.start_time) / 1000.0
+        return [self._calc_animation_offset(i, elapsed) for i in range(len(self.rows))]
+
+    def needs_redraw(self):
+        """
+        Algo mudaria na tela em relação ao último quadro desenhado?
+
+        Depois do fade-in e do slide a tela fica parada, e o GameManager
+        nem chama draw().
+        """
+        return (
+            self.alpha < 255
+            or not self.frame_ready
+            or self._offsets() != self.overlay_offsets
+        )
+
     def update(self):
         """Atualiza a animação de fade-in"""
         now = pygame.time.get_ticks()
@@ -139,28 +189,37 @@ class CreditsScreen:
             self.alpha = min(255, self.alpha + int(self.fade_speed * dt))
 
     def draw(self, screen):
-        """Desenha a tela de créditos"""
-        # Fundo gradiente
-        self._draw_gradient(screen)
-
-        # Surface temporária para aplicar alpha do fade-in
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-
-        # Título e cabeçalho
-        line_y = self._draw_title_and_header(overlay)
-
-        # Calcula tempo desde abertura (em segundos)
-        now = pygame.time.get_ticks()
-        elapsed = 0.0 if not self.start_time else (now - self.start_time) / 1000.0
-
-        # Desenha lista de desenvolvedores
-        y_pos = line_y + 40
-        for i, dev_name in enumerate(self.developers):
-            y_pos = self._draw_developer_row(overlay, i, dev_name, y_pos, elapsed)
+        """
+        Desenha a tela de créditos.
+
+        Returns:
+            Lista de Rects que mudaram desde o quadro anterior (None = a
+            tela inteira)
+        """
+        # A composição só muda enquanto os nomes deslizam
+        offsets = self._offsets()
+        if offsets != self.overlay_offsets:
+            self._compose(offsets)
+
+        # Fundo gradiente (renderizado uma vez)
+        background = vertical_gradient(
+            SCREEN_WIDTH, SCREEN_HEIGHT, COLORS["bg_top"], COLORS["bg_bottom"]
+        )
 
-        # Botão voltar
-        self._draw_back_button(overlay)
+        # Fade-in terminado: a tela inteira já está pronta
+        # (e, depois do primeiro quadro parado, nada muda na tela)
+        if self.alpha >= 255:
+            changed = not self.frame_ready
+            if changed:
+                self.frame.blit(background, (0, 0))
+                self.overlay.set_alpha(255)
+                self.frame.blit(self.overlay, (0, 0))
+                self.frame_ready = True
+            screen.blit(self.frame, (0, 0))
+            return None if changed else []
 
         # Aplica alpha e copia para a tela
-        overlay.set_alpha(self.alpha)
-        screen.blit(overlay, (0, 0))
+        screen.blit(background, (0, 0))
+        self.overlay.set_alpha(self.alpha)
+        screen.blit(self.overlay, (0, 0))
+        return None
@@ -0,0 +1,65 @@
+import pygame
+from utils.font_registry import get_font
+
+OPTIONS = [
+    "Pressione R para reiniciar",
+    "Pressione L para ver o ranking",
+    "Pressione ESC ou ENTER para voltar ao menu",
+]
+
+
+class GameOverScreen:
+    """
+    Tela de fim de jogo composta uma vez numa camada pronta.
+
+    A única coisa que muda é a pontuação: a camada só é refeita quando ela
+    for diferente da última desenhada, e cada quadro é um blit.
+    """
+
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.font_large = get_font(64)
+        self.font_medium = get_font(48)
+        self.font_small = get_font(36)
+        self.layer = pygame.Surface((width, height))
+        self.layer_score = None  # Pontuação desenhada na camada atual
+
+    def _compose(self, score):
+        layer = self.layer
+
+        # Fundo escuro (a tela é limpa com preto antes de cada quadro)
+        layer.fill((0, 0, 0))
+
+        # Título
+        title = self.font_large.render("FIM DE JOGO", True, (255, 255, 255))
+        layer.blit(title, (self.width // 2 - title.get_width() // 2, 100))
+
+        # Pontuação
+        score_text = self.font_medium.render(f"Pontuação: {score}", True, (255, 255, 255))
+        layer.blit(score_text, (self.width // 2 - score_text.get_width() // 2, 180))
+
+        # Opções
+        y_pos = 280
+        for option in OPTIONS:
+            text = self.font_small.render(option, True, (200, 200, 200))
+            layer.blit(text, (self.width // 2 - text.get_width() // 2, y_pos))
+            y_pos += 40
+
+        self.layer_score = score
+
+    def needs_redraw(self, score):
+        """A pontuação mudou desde o último quadro desenhado?"""
+        return score != self.layer_score
+
+    def draw(self, surface, score):
+        """
+        Returns:
+            None (a tela inteira) quando a camada foi refeita, senão lista
+            vazia (nada mudou)
+        """
+        changed = score != self.layer_score
+        if changed:
+            self._compose(score)
+        surface.blit(self.layer, (0, 0))
+        return None if changed else []
@@ -0,0 +1,54 @@
+import pygame
+
+
+class GlyphAtlas:
+    """
+    Números montados a partir de dígitos já renderizados.
+
+    Cada dígito (e cada prefixo/sufixo fixo, como "Score: " ou "%") é
+    renderizado uma vez; um número novo é só uma fileira de blits dessas
+    peças, sem passar pelo rasterizador da fonte.
+    """
+
+    DIGITS = "0123456789-"
+
+    def __init__(self, font, color):
+        """
+        Args:
+            font: Font usada para renderizar as peças
+            color: Cor do texto
+        """
+        self.font = font
+        self.color = color
+        self.pieces = {char: font.render(char, True, color) for char in self.DIGITS}
+
+    def _piece(self, text):
+        piece = self.pieces.get(text)
+        if piece is None:
+            piece = self.pieces[text] = self.font.render(text, True, self.color)
+        return piece
+
+    def render(self, value, prefix="", suffix=""):
+        """
+        Superfície com prefix + value (inteiro) + suffix.
+
+        Returns:
+            Nova Surface com alpha, do tamanho exato do texto
+        """
+        digits = str(int(value))
+        pieces = []  # (peça, texto até o fim dela)
+        if prefix:
+            pieces.append((self._piece(prefix), prefix))
+        for idx, char in enumerate(digits):
+            pieces.append((self.pieces[char], prefix + digits[: idx + 1]))
+        if suffix:
+            pieces.append((self._piece(suffix), prefix + digits + suffix))
+
+        # As posições vêm das medidas da fonte (font.size não rasteriza): a
+        # fonte avança em frações de pixel, então cada peça é alinhada pelo
+        # fim do trecho que ela completa em vez de somar larguras inteiras
+        width, height = self.font.size(pieces[-1][1])
+        surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        for piece, upto in pieces:
+            surface.blit(piece, (self.font.size(upto)[0] - piece.get_width(), 0))
+        return surface
@@ -0,0 +1,34 @@
+import numpy as np
+import pygame
+
+_gradients = {}  # (largura, altura, cor do topo, cor da base) -> Surface
+
+
+def vertical_gradient(width, height, top_color, bottom_color):
+    """
+    Fundo com gradiente vertical, renderizado uma vez e reaproveitado.
+
+    As cores das linhas são calculadas de uma vez com NumPy e copiadas para
+    a superfície com pygame.surfarray (em vez de uma chamada de
+    pygame.draw.line por linha). A mesma Surface é devolvida para todas as
+    telas com o mesmo tamanho e cores; quem a recebe não deve desenhar nela.
+
+    Args:
+        width, height: Tamanho do fundo
+        top_color, bottom_color: Cores (r, g, b) da primeira e da última linha
+    """
+    key = (width, height, tuple(top_color), tuple(bottom_color))
+    surface = _gradients.get(key)
+    if surface is None:
+        ratio = (np.arange(height) / height)[:, None]
+        rows = (
+            np.array(top_color[:3]) * (1 - ratio) + np.array(bottom_color[:3]) * ratio
+        ).astype(np.uint8)  # Uma cor por linha (mesmo truncamento de int())
+
+        surface = pygame.Surface((width, height))
+        # surfarray indexa por (x, y): a mesma linha de cores para cada coluna
+        pygame.surfarray.blit_array(surface, np.broadcast_to(rows, (width, height, 3)))
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert()
+        _gradients[key] = surface
+    return surface
@@ -1,6 +1,7 @@
 import pygame
 # Altere para importar WIDTH e HEIGHT em vez de SCREEN_WIDTH e SCREEN_HEIGHT
 from config.constants import WIDTH, HEIGHT
+from utils.font_registry import get_font
 
 # Defina as constantes se não existirem no constants.py
 SCREEN_WIDTH = WIDTH
@@ -17,13 +18,16 @@ COLORS = {
 class HighscoreScreen:
     def __init__(self, score_manager):
         self.score_manager = score_manager
-        self.font_large = pygame.font.Font(None, 64)
-        self.font_medium = pygame.font.Font(None, 36)
-        self.font_small = pygame.font.Font(None, 28)
+        self.font_large = get_font(64)
+        self.font_medium = get_font(36)
+        self.font_small = get_font(28)
         self.input_text = ""
         self.active = True
         self.blink_timer = 0
         self.cursor_visible = True
+        self.drawn = None  # (pontuação, texto, cursor) do último quadro
+        self.input_rect = pygame.Rect(SCREEN_WIDTH // 2 - 160, 300, 320, 45)
+        self.input_row = pygame.Rect(0, self.input_rect.y, SCREEN_WIDTH, self.input_rect.height)
     
     def handle_event(self, event):
         if event.type == pygame.KEYDOWN:
@@ -49,7 +53,21 @@ class HighscoreScreen:
             self.blink_timer = 0
             self.cursor_visible = not self.cursor_visible
     
+    def _shown(self, current_score):
+        """O que o quadro mostra além do texto fixo: (pontuação, nome, cursor)"""
+        return (current_score, self.input_text, self.cursor_visible and self.active)
+
+    def needs_redraw(self, current_score):
+        """Algo mudaria na tela em relação ao último quadro desenhado?"""
+        return self.drawn != self._shown(current_score)
+
     def draw(self, screen, current_score):
+        """
+        Returns:
+            Lista de Rects que mudaram desde o quadro anterior: só a faixa
+            do campo de entrada quando o nome ou o cursor mudam (None = a
+            tela inteira)
+        """
         self.current_score = current_score
         screen.fill(COLORS["black"])
         
@@ -70,7 +88,7 @@ class HighscoreScreen:
         screen.blit(instruction, (SCREEN_WIDTH // 2 - instruction.get_width() // 2, 250))
         
         # Campo de entrada
-        input_rect = pygame.Rect(SCREEN_WIDTH // 2 - 160, 300, 320, 45)
+        input_rect = self.input_rect
         pygame.draw.rect(screen, (50, 50, 50), input_rect)  # fundo cinza escuro
         pygame.draw.rect(screen, COLORS["white"], input_rect, 2)  # borda branca
         
@@ -95,3 +113,11 @@ class HighscoreScreen:
         # Instrução de cancelamento
         cancel_text = self.font_small.render("Pressione ESC para cancelar", True, COLORS["gray"])
         screen.blit(cancel_text, (SCREEN_WIDTH // 2 - cancel_text.get_width() // 2, 410))
+
+        # Só a faixa do campo de entrada muda enquanto o nome é digitado
+        # (a faixa inteira porque um nome comprido passa da borda do campo)
+        drawn = self.drawn
+        self.drawn = self._shown(current_score)
+        if drawn is None or drawn[0] != current_score:
+            return None
+        return [self.input_row] if drawn != self.drawn else []
@@ -1,16 +1,19 @@
 # ui/hud.py
 import pygame
+from ui.glyph_atlas import GlyphAtlas
+from utils.font_registry import get_font
 
 
 class HUD:
-    def __init__(self, surface, car, img_config, score_ref):
+    def __init__(self, surface, car, img_config, score_ref, clock):
         self.surface = surface
         self.car = car
         self.img_config = img_config
         self.score_ref = score_ref  # função que retorna o score atual
+        self.clock = clock  # relógio da simulação (tempos dos power-ups)
 
         # Fonte menor para caber no bloco
-        self.font = pygame.font.Font(None, 30)
+        self.font = get_font(30)
 
         # Configurações visuais
         self.bar_width = 120
@@ -25,9 +28,22 @@ class HUD:
         self.hud_width = 180
         self.hud_height = 100
 
+        # Posição da barra de combustível dentro do bloco
+        self.bar_x = 10
+        self.bar_y = 25
+
         # Pré-carrega os ícones
         self._load_icons()
 
+        # Parte fixa pronta e números montados a partir de dígitos prontos
+        self.static_frame = self._build_static_frame()
+        self.panel = pygame.Surface((self.hud_width, self.hud_height), pygame.SRCALPHA)
+        self.score_atlas = GlyphAtlas(self.font, (255, 255, 0))
+        self.fuel_atlas = GlyphAtlas(self.font, (255, 255, 255))
+        self.score_value = None  # Valores desenhados nos textos atuais
+        self.fuel_value = None
+        self.panel_key = None  # (pontuação, largura da barra, cor) do bloco atual
+
     def _load_icons(self):
         """Carrega e escala os ícones dos power-ups"""
         self.rocket_icon = pygame.transform.scale(
@@ -40,70 +56,101 @@ class HUD:
             self.img_config.fuel_img, (self.icon_size, self.icon_size)
         )
 
-    def update(self):
-        """Atualiza os valores da HUD"""
-        self.fuel_percentage = max(0, min(100, self.car.fuel))
-        self.fuel_text = self.font.render(
-            f"{ int(self.fuel_percentage)}%", True, (255, 255, 255)
-        )
-        self.score_text = self.font.render(
-            f"Score: {int(self.score_ref())}", True, (255, 255, 0)
-        )
+    def _build_static_frame(self):
+        """
+        Parte fixa do HUD (fundo, borda, ícone e fundo da barra de
+        combustível), desenhada uma vez numa camada do tamanho do bloco.
+        """
+        frame = pygame.Surface((self.hud_width, self.hud_height), pygame.SRCALPHA)
 
-    def draw(self):
-        """Desenha todos os elementos do HUD"""
-        self._draw_background()
-        self._draw_score()
-        self._draw_fuel_bar()
-        self._draw_powerup_icons()
-
-    def _draw_background(self):
-        """Fundo semi-transparente da HUD"""
-        hud_rect = pygame.Rect(self.hud_x, self.hud_y, self.hud_width, self.hud_height)
-        pygame.draw.rect(self.surface, (0, 0, 0, 128), hud_rect, border_radius=10)
-        pygame.draw.rect(self.surface, (255, 255, 255), hud_rect, 2, border_radius=10)
-
-    def _draw_score(self):
-        """Desenha o texto de pontuação na parte superior"""
-        self.surface.blit(self.score_text, (self.hud_x + 10, self.hud_y + 5))
-
-    def _draw_fuel_bar(self):
-        """Desenha a barra de combustível"""
-        bar_x = self.hud_x + 10
-        bar_y = self.hud_y + 25
+        # Fundo e borda (a tela não tem alpha, então o fundo sempre foi preto opaco)
+        hud_rect = frame.get_rect()
+        pygame.draw.rect(frame, (0, 0, 0), hud_rect, border_radius=10)
+        pygame.draw.rect(frame, (255, 255, 255), hud_rect, 2, border_radius=10)
 
         # Ícone de combustível
-        self.surface.blit(self.fuel_icon, (bar_x, bar_y - 2))
+        frame.blit(self.fuel_icon, (self.bar_x, self.bar_y - 2))
 
         # Fundo da barra
         pygame.draw.rect(
-            self.surface,
+            frame,
             (50, 50, 50),
-            (bar_x + self.icon_size + 5, bar_y, self.bar_width, self.bar_height),
+            (self.bar_x + self.icon_size + 5, self.bar_y, self.bar_width, self.bar_height),
             border_radius=6,
         )
+        return frame
 
-        # Barra de preenchimento
-        fill_width = (self.fuel_percentage / 100) * self.bar_width
+    def update(self):
+        """
+        Atualiza os valores da HUD.
+
+        Os textos só são remontados (a partir do atlas de dígitos) quando o
+        valor inteiro muda, e o bloco só é redesenhado quando a pontuação
+        ou a barra de combustível mudam.
+        """
+        self.fuel_percentage = max(0, min(100, self.car.fuel))
+
+        score = int(self.score_ref())
+        if score != self.score_value:
+            self.score_value = score
+            self.score_text = self.score_atlas.render(score, prefix="Score: ")
+
+        fuel = int(self.fuel_percentage)
+        if fuel != self.fuel_value:
+            self.fuel_value = fuel
+            self.fuel_text = self.fuel_atlas.render(fuel, suffix="%")
+
+        # Largura da barra em pixels inteiros (como o Rect a trunca)
+        fill_width = int((self.fuel_percentage / 100) * self.bar_width)
         color = (
             (0, 200, 0)
             if self.fuel_percentage > 60
             else (200, 150, 0) if self.fuel_percentage > 30 else (200, 0, 0)
         )
+        panel_key = (score, fill_width, color)
+        if panel_key != self.panel_key:
+            self.panel_key = panel_key
+            self._compose_panel(fill_width, color)
+
+    def _compose_panel(self, fill_width, color):
+        """Parte fixa + pontuação + barra de preenchimento"""
+        panel = self.panel
+        panel.fill((0, 0, 0, 0))
+        panel.blit(self.static_frame, (0, 0))
+
+        # Pontuação na parte superior
+        panel.blit(self.score_text, (10, 5))
+
+        # Barra de preenchimento
         pygame.draw.rect(
-            self.surface,
+            panel,
             color,
-            (bar_x + self.icon_size + 5, bar_y, fill_width, self.bar_height),
+            (self.bar_x + self.icon_size + 5, self.bar_y, fill_width, self.bar_height),
             border_radius=6,
         )
 
-        # Texto da porcentagem
+    def draw(self):
+        """Desenha todos os elementos do HUD"""
+        self.surface.blit(self.panel, (self.hud_x, self.hud_y))
+
+        # Texto da porcentagem (passa da borda do bloco, então vai direto na tela)
         self.surface.blit(
-            self.fuel_text, (bar_x + self.icon_size + self.bar_width - 15, bar_y - 2)
+            self.fuel_text,
+            (
+                self.hud_x + self.bar_x + self.icon_size + self.bar_width - 15,
+                self.hud_y + self.bar_y - 2,
+            ),
         )
 
-    def _draw_powerup_icons(self):
-        """Desenha os ícones dos power-ups ativos"""
+        self._draw_powerup_icons(self.clock.get_ticks())
+
+    def _draw_powerup_icons(self, current_time):
+        """
+        Desenha os ícones dos power-ups ativos.
+
+        Args:
+            current_time: Tempo do relógio da simulação neste quadro
+        """
         x_pos = self.hud_x + 10
         y_pos = self.hud_y + self.icon_start_y
 
@@ -114,7 +161,6 @@ class HUD:
 
         # Ícone de fantasma
         if self.car.ghost_power_active:
-            current_time = pygame.time.get_ticks()
             remaining_time = self.car.ghost_power_end_time - current_time
             if (
                 remaining_time > self.car.blink_start_offset
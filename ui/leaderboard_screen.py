@@ -1,5 +1,7 @@
 import pygame
 from config.constants import WIDTH, HEIGHT
+from ui.gradient import vertical_gradient
+from utils.font_registry import get_font
 
 # Dimensões da tela (importadas do projeto)
 SCREEN_WIDTH = WIDTH
@@ -34,9 +36,9 @@ TOP_COLORS = {
 class LeaderboardScreen:
     def __init__(self, score_manager):
         self.score_manager = score_manager
-        self.font_title = pygame.font.Font(None, 44)
-        self.font_item = pygame.font.Font(None, 30)
-        self.font_small = pygame.font.Font(None, 20)
+        self.font_title = get_font(44)
+        self.font_item = get_font(30)
+        self.font_small = get_font(20)
 
         # Botão voltar (rect)
         self.back_rect = pygame.Rect(SCREEN_WIDTH // 2 - 70, SCREEN_HEIGHT - 60, 140, 36)
@@ -48,14 +50,28 @@ class LeaderboardScreen:
         # Tempo de início para animações (slide-in)
         self.start_time = None
 
+        # Camadas prontas: o título, o cabeçalho e o botão não mudam, e cada
+        # linha do ranking é renderizada uma vez (refeita só se o ranking
+        # mudar). A composição fica pronta numa superfície reaproveitada e
+        # só é refeita enquanto as linhas deslizam; o fade-in só muda o
+        # alpha dela.
+        self.static_layer, self.list_top = self._build_static_layer()
+        self.rows = []  # (superfície da linha, y)
+        self.rows_key = None  # Ranking desenhado nas linhas atuais
+        self.overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+        self.overlay_offsets = None  # Deslocamento das linhas na composição atual
+        # Depois do fade-in a tela inteira (fundo + composição) fica pronta
+        # numa superfície opaca: cada quadro parado é um blit só
+        self.frame = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.frame_ready = False
+
     # ---- Helpers de desenho e animação ----
-    def _draw_gradient(self, screen):
-        for i in range(SCREEN_HEIGHT):
-            ratio = i / SCREEN_HEIGHT
-            r = int(COLORS["bg_top"][0] * (1 - ratio) + COLORS["bg_bottom"][0] * ratio)
-            g = int(COLORS["bg_top"][1] * (1 - ratio) + COLORS["bg_bottom"][1] * ratio)
-            b = int(COLORS["bg_top"][2] * (1 - ratio) + COLORS["bg_bottom"][2] * ratio)
-            pygame.draw.line(screen, (r, g, b), (0, i), (SCREEN_WIDTH, i))
+    def _build_static_layer(self):
+        """Título, cabeçalho e botão voltar numa camada (e o y onde a lista começa)"""
+        layer = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+        line_y = self._draw_title_and_header(layer)
+        self._draw_back_button(layer)
+        return layer, line_y + 20
 
     def _draw_title_and_header(self, overlay):
         # Título com sombra
@@ -88,26 +104,56 @@ class LeaderboardScreen:
         offset_x = int(start_offset * (1 - pe))
         return offset_x
 
-    def _draw_row(self, overlay, i, score_data, y_pos, elapsed):
+    def _render_row(self, i, score_data):
+        """Uma linha do ranking (posição, nome e pontuação) numa superfície da largura da tela"""
         is_top = i < 3
         accent = TOP_COLORS.get(i, COLORS["white"]) if is_top else COLORS["white"]
         font_use = self.font_item if i == 0 else self.font_small
 
-        offset_x = self._calc_animation_offset(i, elapsed)
-
         # Texto pos/nome/score com cor de destaque para top3
         text_color = accent if is_top else COLORS["white"]
         pos_text = font_use.render(f"{i+1}\u00ba", True, text_color)
-        overlay.blit(pos_text, (SCREEN_WIDTH // 6 - pos_text.get_width() // 2 + 10 + offset_x, y_pos))
+        name_text = font_use.render(score_data.get("name", "-"), True, text_color)
+        score_text = font_use.render(str(score_data.get("score", 0)), True, text_color)
 
-        name = score_data.get("name", "-")
-        name_text = font_use.render(name, True, text_color)
-        overlay.blit(name_text, (SCREEN_WIDTH // 3 - name_text.get_width() // 2 + offset_x, y_pos))
+        height = max(text.get_height() for text in (pos_text, name_text, score_text))
+        row = pygame.Surface((SCREEN_WIDTH, height), pygame.SRCALPHA)
+        row.blit(pos_text, (SCREEN_WIDTH // 6 - pos_text.get_width() // 2 + 10, 0))
+        row.blit(name_text, (SCREEN_WIDTH // 3 - name_text.get_width() // 2, 0))
+        row.blit(score_text, (2 * SCREEN_WIDTH // 3 - score_text.get_width() // 2, 0))
+        return row
 
-        score_text = font_use.render(str(score_data.get("score", 0)), True, text_color)
-        overlay.blit(score_text, (2 * SCREEN_WIDTH // 3 - score_text.get_width() // 2 + offset_x, y_pos))
+    def _build_rows(self, highscores):
+        self.rows = []
+        y_pos = self.list_top
+        for i, score_data in enumerate(highscores):
+            self.rows.append((self._render_row(i, score_data), y_pos))
+            y_pos += 46 if i == 0 else 32
 
-        return y_pos + (46 if i == 0 else 32)
+        # Se não tiver pontuações
+        self.empty_message = None
+        if not highscores:
+            no_scores = self.font_item.render("Nenhuma pontuação ainda!", True, COLORS["white"])
+            position = (SCREEN_WIDTH // 2 - no_scores.get_width() // 2, SCREEN_HEIGHT // 2)
+            self.empty_message = (no_scores, position)
+
+    def _compose(self, offsets):
+        """
+        Monta a tela (sem o fundo) com as linhas deslocadas por offsets.
+
+        As camadas não se sobrepõem, então os pixels são copiados como
+        estão (BLEND_RGBA_MAX sobre a superfície transparente), sem misturar
+        o alpha das bordas do texto duas vezes.
+        """
+        overlay = self.overlay
+        overlay.fill((0, 0, 0, 0))
+        overlay.blit(self.static_layer, (0, 0), special_flags=pygame.BLEND_RGBA_MAX)
+        for (row, y_pos), offset_x in zip(self.rows, offsets):
+            overlay.blit(row, (offset_x, y_pos), special_flags=pygame.BLEND_RGBA_MAX)
+        if self.empty_message is not None:
+            overlay.blit(*self.empty_message, special_flags=pygame.BLEND_RGBA_MAX)
+        self.overlay_offsets = offsets
+        self.frame_ready = False
 
     def _draw_back_button(self, overlay):
         pygame.draw.rect(overlay, (30, 30, 30), self.back_rect, border_radius=8)
@@ -126,6 +172,29 @@ class LeaderboardScreen:
                     return "menu"
         return None
 
+    def _rows_key(self, highscores):
+        return [(score_data.get("name"), score_data.get("score")) for score_data in highscores]
+
+    def _offsets(self):
+        """Deslocamento de cada linha no slide-in, pelo tempo desde a abertura"""
+        now = pygame.time.get_ticks()
+        elapsed = 0.0 if not self.start_time else (now - self.start_time) / 1000.0
+        return [self._calc_animation_offset(i, elapsed) for i in range(len(self.rows))]
+
+    def needs_redraw(self):
+        """
+        Algo mudaria na tela em relação ao último quadro desenhado?
+
+        Depois do fade-in e do slide a tela fica parada (até o ranking
+        mudar), e o GameManager nem chama draw().
+        """
+        return (
+            self.alpha < 255
+            or not self.frame_ready
+            or self._rows_key(self.score_manager.get_highscores()) != self.rows_key
+            or self._offsets() != self.overlay_offsets
+        )
+
     def update(self):
         # Atualiza o fade-in
         now = pygame.time.get_ticks()
@@ -136,34 +205,45 @@ class LeaderboardScreen:
         # Se start_time definido, nada extra aqui; draw usa o start_time para calcular o slide
 
     def draw(self, screen):
-        # Fundo gradiente
-        self._draw_gradient(screen)
-
-        # Surface temporária para aplicar alpha do fade-in
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-
-        # Título / cabeçalho
-        line_y = self._draw_title_and_header(overlay)
-
-        # Desenha a lista
+        """
+        Desenha o ranking.
+
+        Returns:
+            Lista de Rects que mudaram desde o quadro anterior (None = a
+            tela inteira)
+        """
+        # Linhas do ranking: refeitas só se o ranking mudou
         highscores = self.score_manager.get_highscores()
-        y_pos = line_y + 20
-
-        # calcula tempo desde abertura (em segundos)
-        now = pygame.time.get_ticks()
-        elapsed = 0.0 if not self.start_time else (now - self.start_time) / 1000.0
-
-        for i, score_data in enumerate(highscores):
-            y_pos = self._draw_row(overlay, i, score_data, y_pos, elapsed)
-
-        # Se não tiver pontuações
-        if not highscores:
-            no_scores = self.font_item.render("Nenhuma pontuação ainda!", True, COLORS["white"]) 
-            overlay.blit(no_scores, (SCREEN_WIDTH // 2 - no_scores.get_width() // 2, SCREEN_HEIGHT // 2))
-
-        # Botão voltar (visual)
-        self._draw_back_button(overlay)
+        rows_key = self._rows_key(highscores)
+        if rows_key != self.rows_key:
+            self._build_rows(highscores)
+            self.rows_key = rows_key
+            self.overlay_offsets = None
+
+        # A composição só muda enquanto as linhas deslizam
+        offsets = self._offsets()
+        if offsets != self.overlay_offsets:
+            self._compose(offsets)
+
+        # Fundo gradiente (renderizado uma vez)
+        background = vertical_gradient(
+            SCREEN_WIDTH, SCREEN_HEIGHT, COLORS["bg_top"], COLORS["bg_bottom"]
+        )
+
+        # Fade-in terminado: a tela inteira já está pronta
+        # (e, depois do primeiro quadro parado, nada muda na tela)
+        if self.alpha >= 255:
+            changed = not self.frame_ready
+            if changed:
+                self.frame.blit(background, (0, 0))
+                self.overlay.set_alpha(255)
+                self.frame.blit(self.overlay, (0, 0))
+                self.frame_ready = True
+            screen.blit(self.frame, (0, 0))
+            return None if changed else []
 
         # Aplica alpha e copia para a tela
-        overlay.set_alpha(self.alpha)
-        screen.blit(overlay, (0, 0))
+        screen.blit(background, (0, 0))
+        self.overlay.set_alpha(self.alpha)
+        screen.blit(self.overlay, (0, 0))
+        return None
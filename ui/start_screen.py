@@ -0,0 +1,207 @@
+import math
+
+import pygame
+from ui.gradient import vertical_gradient
+from utils.font_registry import get_font
+
+# Cores
+COLORS = {
+    "bg_top": (6, 16, 42),
+    "bg_bottom": (10, 60, 120),
+    "title": (255, 230, 120),
+    "title_shadow": (20, 20, 40),
+    "subtitle": (220, 220, 220),
+    "option": (240, 240, 240),
+    "selected": (255, 240, 140),
+    "highlight": (30, 30, 60, 120),
+    "instructions": (200, 200, 200),
+}
+
+INSTRUCTIONS = [
+    "Use SETAS ou o MOUSE para navegar",
+    "ENTER ou clique para confirmar",
+    "Boa sorte!",
+]
+
+
+class StartScreen:
+    """
+    Menu inicial desenhado a partir de camadas prontas.
+
+    Tudo o que não muda (gradiente, título, subtítulo e instruções) é
+    composto uma vez numa camada de fundo. As opções ficam numa camada
+    própria, recomposta só quando a opção destacada muda. Por quadro sobram
+    os blits das camadas e do carro animado, e draw() informa só as áreas
+    que mudaram desde o quadro anterior (o carro e, se for o caso, as
+    opções).
+    """
+
+    OPTIONS_TOP = 250  # y da primeira opção
+    OPTION_SPACING = 60
+    CAR_WIDTH = 120  # Largura do carro de enfeite
+    CAR_TOP = 200
+
+    def __init__(self, width, height, options, car_sprite=None):
+        """
+        Args:
+            width, height: Tamanho da tela
+            options: Textos das opções do menu, na ordem
+            car_sprite: Sprite do carro de enfeite (None = sem carro)
+        """
+        self.width = width
+        self.height = height
+        self.options = options
+        self.font_large = get_font(72)
+        self.font_medium = get_font(40)
+        self.font_small = get_font(22)
+
+        self.background = self._build_background()
+        self._build_options()
+        self._build_car(car_sprite)
+
+        self.options_layer = pygame.Surface(self.options_area.size, pygame.SRCALPHA)
+        self.layer_selection = None  # Opção destacada na camada atual
+        self.drawn = None  # (opção destacada, área do carro) do último quadro
+
+    # === CAMADAS ===
+
+    def _build_background(self):
+        """Gradiente, título, subtítulo e instruções (tudo estático)"""
+        # Fundo com gradiente vertical (do escuro para mais claro); copiado
+        # porque o título e as instruções são desenhados por cima
+        background = vertical_gradient(
+            self.width, self.height, COLORS["bg_top"], COLORS["bg_bottom"]
+        ).copy()
+
+        # Título com sombra
+        title = self.font_large.render("CORRIDINHA", True, COLORS["title"])
+        title_shadow = self.font_large.render("CORRIDINHA", True, COLORS["title_shadow"])
+        tx = self.width // 2 - title.get_width() // 2
+        background.blit(title_shadow, (tx + 4, 104))
+        background.blit(title, (tx, 100))
+
+        # Pequena descrição abaixo
+        subtitle = self.font_small.render(
+            "Desvie, colete power-ups e sobreviva o maior tempo!", True, COLORS["subtitle"]
+        )
+        background.blit(subtitle, (self.width // 2 - subtitle.get_width() // 2, 170))
+
+        # Instruções
+        y_pos = self.height - 90
+        for instruction in INSTRUCTIONS:
+            text = self.font_small.render(instruction, True, COLORS["instructions"])
+            background.blit(text, (self.width // 2 - text.get_width() // 2, y_pos))
+            y_pos += 22
+
+        return background
+
+    def _build_options(self):
+        """
+        Cada opção pronta nas duas versões (normal e destacada), com a área
+        clicável e a área total ocupada pelas opções.
+        """
+        self.option_rects = []  # Áreas clicáveis (com padding), na tela
+        self.option_images = []  # (normal, destacada, posição do texto)
+        y_pos = self.OPTIONS_TOP
+        for option in self.options:
+            text = self.font_medium.render(option, True, COLORS["option"])
+            selected_text = self.font_medium.render(option, True, COLORS["selected"])
+            x = self.width // 2 - text.get_width() // 2
+            rect = pygame.Rect(x - 15, y_pos - 7, text.get_width() + 30, text.get_height() + 14)
+
+            # Destaque: fundo translúcido com o texto por cima
+            selected = pygame.Surface(rect.size, pygame.SRCALPHA)
+            selected.fill(COLORS["highlight"])
+            selected.blit(selected_text, (15, 7))
+
+            self.option_rects.append(rect)
+            self.option_images.append((text, selected, (x, y_pos)))
+            y_pos += self.OPTION_SPACING
+
+        self.options_area = self.option_rects[0].unionall(self.option_rects[1:])
+
+    def _build_car(self, car_sprite):
+        """Carro escalado e sua sombra, uma vez só"""
+        self.car_image = None
+        self.car_rect = pygame.Rect(0, 0, 0, 0)  # Área do carro + sombra (y = 0)
+        if not car_sprite:
+            return
+        # Escala para uma dimensão agradável no menu
+        car_w = self.CAR_WIDTH
+        car_h = int(car_sprite.get_height() * (car_w / car_sprite.get_width()))
+        self.car_image = pygame.transform.scale(car_sprite, (car_w, car_h))
+        self.car_x = self.width // 2 - car_w // 2
+
+        # Sombra simples
+        self.car_shadow = pygame.Surface((car_w, 8), pygame.SRCALPHA)
+        pygame.draw.ellipse(self.car_shadow, (0, 0, 0, 100), self.car_shadow.get_rect())
+        self.car_rect = pygame.Rect(self.car_x, 0, car_w, car_h + 2)
+
+    def _compose_options(self, selection):
+        """Redesenha a camada das opções com a opção selection destacada"""
+        layer = self.options_layer
+        layer.fill((0, 0, 0, 0))
+        origin_x, origin_y = self.options_area.topleft
+        for idx, (text, selected, (x, y)) in enumerate(self.option_images):
+            if idx == selection:
+                rect = self.option_rects[idx]
+                layer.blit(selected, (rect.x - origin_x, rect.y - origin_y))
+            else:
+                layer.blit(text, (x - origin_x, y - origin_y))
+        self.layer_selection = selection
+
+    # === DESENHO ===
+
+    def _car_area(self):
+        """Área do carro (e sombra) no bob deste instante"""
+        if self.car_image is None:
+            return self.car_rect
+        t = pygame.time.get_ticks() / 1000.0
+        return self.car_rect.move(0, self.CAR_TOP + int(8 * math.sin(t * 2.0)))
+
+    def needs_redraw(self, selection):
+        """
+        Algo mudaria na tela em relação ao último quadro desenhado?
+
+        Sem mudança o GameManager nem chama draw(): a superfície da tela
+        ainda tem o último quadro.
+        """
+        return self.drawn != (selection, self._car_area())
+
+    def draw(self, surface, selection):
+        """
+        Desenha o menu com a opção selection destacada.
+
+        Args:
+            surface: Superfície da tela
+            selection: Índice da opção selecionada
+
+        Returns:
+            Lista de Rects que mudaram desde o quadro anterior (None = a
+            tela inteira)
+        """
+        if selection != self.layer_selection:
+            self._compose_options(selection)
+
+        surface.blit(self.background, (0, 0))
+
+        # Carro com um leve bob (subida/descida), atrás das opções
+        car_rect = self._car_area()
+        if self.car_image is not None:
+            car_y = car_rect.y
+            surface.blit(self.car_shadow, (self.car_x, car_y + self.car_image.get_height() - 6))
+            surface.blit(self.car_image, (self.car_x, car_y))
+
+        surface.blit(self.options_layer, self.options_area)
+
+        # Áreas alteradas: o carro (posição antiga e nova) e as opções
+        drawn = self.drawn
+        self.drawn = (selection, car_rect)
+        if drawn is None:
+            return None
+        dirty = []
+        if car_rect != drawn[1]:
+            dirty.append(car_rect.union(drawn[1]))
+        if selection != drawn[0]:
+            dirty.append(self.options_area)
+        return dirty
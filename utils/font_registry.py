@@ -0,0 +1,43 @@
+"""
+Fontes compartilhadas por todo o jogo.
+
+Criar um pygame.font.Font lê e prepara o arquivo da fonte toda vez; nas
+telas de menu isso acontecia a cada quadro. Aqui cada (fonte, tamanho) é
+carregado uma vez só e a mesma Font é devolvida para todos que pedirem
+(telas, HUD, textos flutuantes).
+"""
+
+import pygame
+
+_fonts = {}  # (fonte, tamanho) -> Font
+_requests = 0  # Pedidos atendidos (carregando ou não)
+
+
+def get_font(size, face=None):
+    """
+    Font carregada uma vez por processo.
+
+    Args:
+        size: Tamanho da fonte
+        face: Caminho do arquivo da fonte (None = fonte padrão do pygame)
+    """
+    global _requests
+    _requests += 1
+    key = (face, size)
+    font = _fonts.get(key)
+    if font is None:
+        font = _fonts[key] = pygame.font.Font(face, size)
+    return font
+
+
+def font_stats():
+    """
+    Returns:
+        Dict com quantas Font existem (uma por (fonte, tamanho)), quantos
+        pedidos foram feitos e as chaves carregadas
+    """
+    return {
+        "fonts": len(_fonts),
+        "requests": _requests,
+        "loaded": sorted(_fonts, key=lambda key: (str(key[0]), key[1])),
+    }
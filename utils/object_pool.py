@@ -0,0 +1,56 @@
+class ObjectPool:
+    """
+    Reaproveita objetos que saíram do jogo em vez de criar novos.
+
+    Um objeto devolvido com release() volta a ser usado no próximo
+    acquire(), que chama reset() nele com os mesmos argumentos que seriam
+    passados para o construtor (o objeto precisa ter um reset() que o deixe
+    igual a um recém-criado). Só quando não há nenhum livre o factory é
+    chamado.
+
+    Assim, depois dos primeiros segundos de jogo (quando já existem objetos
+    suficientes para o pico de spawns) criar e remover entidades não aloca
+    mais sprites, rects, hitboxes nem fontes, e o coletor de lixo não tem
+    o que varrer nos picos de spawn.
+    """
+
+    def __init__(self, factory, max_free=64):
+        """
+        Args:
+            factory: Função que cria um objeto novo (recebe os argumentos de acquire)
+            max_free: Máximo de objetos guardados livres (o resto é descartado)
+        """
+        self.factory = factory
+        self.max_free = max_free
+        self.free = []
+        self.created = 0  # Objetos criados pelo factory
+        self.reused = 0  # acquire() atendidos com um objeto livre
+
+    def __len__(self):
+        return len(self.free)
+
+    def acquire(self, *args, **kwargs):
+        """Um objeto pronto para usar (reaproveitado, se houver)"""
+        if self.free:
+            obj = self.free.pop()
+            obj.reset(*args, **kwargs)
+            self.reused += 1
+            return obj
+        self.created += 1
+        return self.factory(*args, **kwargs)
+
+    def release(self, obj):
+        """Devolve um objeto que saiu do jogo (não pode mais ser usado por quem devolveu)"""
+        if len(self.free) < self.max_free:
+            self.free.append(obj)
+
+    def release_all(self, objects):
+        for obj in objects:
+            self.release(obj)
+
+    def stats(self):
+        """
+        Returns:
+            Dict com objetos criados, reaproveitados e livres no momento
+        """
+        return {"created": self.created, "reused": self.reused, "free": len(self.free)}
@@ -0,0 +1,118 @@
+class SpatialHash:
+    """
+    Índice espacial em grade uniforme (broadphase de colisões).
+
+    A tela é dividida em células quadradas de cell_size pixels; cada item
+    fica registrado em todas as células que o seu rect cobre. Uma consulta
+    olha só as células do rect consultado, então um foguete testa apenas os
+    inimigos perto dele, e não a lista inteira.
+
+    O índice é incremental: update() só mexe nas células quando o item
+    muda de célula (um carro leva vários passos para atravessar uma).
+
+    A consulta devolve candidatos; quem chama ainda confere a colisão exata
+    (colliderect), já que estar na mesma célula não quer dizer encostar.
+    """
+
+    def __init__(self, cell_size=64):
+        """
+        Args:
+            cell_size: Lado de cada célula em pixels (da ordem do tamanho
+                dos carros: células pequenas demais espalham cada item por
+                muitas células, grandes demais juntam itens distantes)
+        """
+        self.cell_size = cell_size
+        self.cells = {}  # (coluna, linha) -> set de itens
+        self.item_cells = {}  # item -> (coluna0, linha0, coluna1, linha1)
+
+    def __len__(self):
+        return len(self.item_cells)
+
+    def __contains__(self, item):
+        return item in self.item_cells
+
+    def _cell_range(self, rect):
+        """Células cobertas por um rect (coluna/linha inicial e final, inclusivas)"""
+        size = self.cell_size
+        return (
+            rect.left // size,
+            rect.top // size,
+            (rect.right - 1) // size,
+            (rect.bottom - 1) // size,
+        )
+
+    def update(self, item, rect):
+        """
+        Registra um item novo ou atualiza a posição de um item existente.
+
+        Args:
+            item: Qualquer objeto hashable (ex: um EnemyCar)
+            rect: pygame.Rect atual do item
+        """
+        cell_range = self._cell_range(rect)
+        old_range = self.item_cells.get(item)
+        if old_range == cell_range:
+            return  # Continua nas mesmas células
+
+        if old_range is not None:
+            self._unlink(item, old_range)
+        self.item_cells[item] = cell_range
+
+        cells = self.cells
+        col0, row0, col1, row1 = cell_range
+        for col in range(col0, col1 + 1):
+            for row in range(row0, row1 + 1):
+                bucket = cells.get((col, row))
+                if bucket is None:
+                    bucket = cells[(col, row)] = set()
+                bucket.add(item)
+
+    def remove(self, item):
+        """Tira um item do índice (não faz nada se ele não estiver lá)"""
+        old_range = self.item_cells.pop(item, None)
+        if old_range is not None:
+            self._unlink(item, old_range)
+
+    def _unlink(self, item, cell_range):
+        cells = self.cells
+        col0, row0, col1, row1 = cell_range
+        for col in range(col0, col1 + 1):
+            for row in range(row0, row1 + 1):
+                bucket = cells[(col, row)]
+                bucket.discard(item)
+                if not bucket:
+                    del cells[(col, row)]
+
+    def clear(self):
+        self.cells.clear()
+        self.item_cells.clear()
+
+    def query(self, rect):
+        """
+        Itens registrados nas células que o rect cobre.
+
+        Returns:
+            set de candidatos (sem ordem definida; quem precisa de uma
+            ordem estável ordena o resultado). Pode ser o próprio set de
+            uma célula, então não deve ser alterado por quem chama.
+        """
+        cells = self.cells
+        size = self.cell_size
+        left, top, width, height = rect
+        col0 = left // size
+        row0 = top // size
+        col1 = (left + width - 1) // size
+        row1 = (top + height - 1) // size
+        if col0 == col1 and row0 == row1:
+            return cells.get((col0, row0), _EMPTY)  # Caso comum: uma célula só
+
+        found = _EMPTY
+        for col in range(col0, col1 + 1):
+            for row in range(row0, row1 + 1):
+                bucket = cells.get((col, row))
+                if bucket:
+                    found = found | bucket if found else bucket
+        return found
+
+
+_EMPTY = frozenset()